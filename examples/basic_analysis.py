@@ -8,36 +8,43 @@ Creates two hosts, establishes a real connection, and runs privacy analysis
 on the captured metadata.
 """
 
-import trio
-from libp2p import new_host
-from libp2p.peer.peerinfo import info_from_p2p_addr
-from libp2p.tools.async_service import background_trio_service
-from multiaddr import Multiaddr
-
 from libp2p_privacy_poc.metadata_collector import MetadataCollector
 from libp2p_privacy_poc.privacy_analyzer import PrivacyAnalyzer
 from libp2p_privacy_poc.mock_zk_proofs import MockZKProofSystem
 from libp2p_privacy_poc.report_generator import ReportGenerator
-from libp2p_privacy_poc.utils import get_peer_listening_address
+from libp2p_privacy_poc.utils import (
+    cached_multiaddr,
+    close_hosts,
+    get_peer_listening_address,
+)
 
 # Timeout constants for network operations (in seconds)
 LISTEN_TIMEOUT = 10  # Time to bind listener
 CONNECT_TIMEOUT = 10  # Time to establish connection
 CLOSE_TIMEOUT = 5    # Time to cleanup/close hosts
 
+# Banner rules
+_BAR = "=" * 70
+
+# One generator (and report ID) for the whole run
+REPORT_GENERATOR = ReportGenerator()
+
 
 async def main():
     """Run the basic privacy analysis example with real connections."""
+    # Networking imports are deferred so importing this module stays cheap
+    import trio
+    from libp2p import new_host
+    from libp2p.peer.peerinfo import info_from_p2p_addr
+    from libp2p.tools.async_service import background_trio_service
     
-    print("\n" + "=" * 70)
-    print("libp2p Privacy Analysis Tool - Basic Example")
-    print("=" * 70)
+    print("\n".join(["", _BAR, "libp2p Privacy Analysis Tool - Basic Example", _BAR]))
     print("\nUsing REAL py-libp2p connections with automatic event capture\n")
     
     # Create two hosts
     print("1. Creating two libp2p hosts...")
-    listen_addr1 = Multiaddr("/ip4/127.0.0.1/tcp/0")
-    listen_addr2 = Multiaddr("/ip4/127.0.0.1/tcp/0")
+    listen_addr1 = cached_multiaddr("/ip4/127.0.0.1/tcp/0")
+    listen_addr2 = cached_multiaddr("/ip4/127.0.0.1/tcp/0")
     
     host1 = new_host()
     host2 = new_host()
@@ -96,8 +103,7 @@ async def main():
     
             # Run privacy analysis
             print("\n7. Running Privacy Analysis...")
-            analyzer = PrivacyAnalyzer(collector)
-            report = analyzer.analyze()
+            report = PrivacyAnalyzer.analyze_collector(collector)
             
             print(f"\n   Analysis Complete!")
             print(f"   - Overall Risk Score: {report.overall_risk_score:.2f}/1.00")
@@ -106,29 +112,25 @@ async def main():
             print(f"   - High Risks: {len(report.get_high_risks())}")
             
             # Display summary
-            print("\n" + "=" * 70)
-            print("Privacy Analysis Summary")
-            print("=" * 70)
+            print("\n".join(["", _BAR, "Privacy Analysis Summary", _BAR]))
             print(report.summary())
             
             # Generate ZK proofs (mock)
-            print("\n" + "=" * 70)
-            print("Generating Mock ZK Proofs")
-            print("=" * 70)
+            print("\n".join(["", _BAR, "Generating Mock ZK Proofs", _BAR]))
             
             zk_system = MockZKProofSystem()
             
             # Generate anonymity set proof
             print("\n8. Generating anonymity set proof...")
-            peer_ids = list(collector.peers.keys())
-            if peer_ids:
+            peer_count = collector.peer_count()
+            if peer_count:
                 anonymity_proof = zk_system.generate_anonymity_set_proof(
-                    peer_id=str(peer_ids[0]),
-                    anonymity_set_size=len(peer_ids)
+                    peer_id=str(collector.first_peer_id()),
+                    anonymity_set_size=peer_count
                 )
                 print(f"   ✓ Proof generated")
                 print(f"   Type: {anonymity_proof.proof_type}")
-                print(f"   Claim: Peer is one of {len(peer_ids)} peers")
+                print(f"   Claim: Peer is one of {peer_count} peers")
                 
                 # Verify proof
                 is_valid = zk_system.verify_proof(anonymity_proof)
@@ -137,31 +139,17 @@ async def main():
             # Generate enhanced report with ZK proofs
             print("\n9. Generating reports...")
             
-            # Generate proofs for the report (as dictionary)
-            zk_proofs = {}
-            if peer_ids:
-                anonymity_proof = zk_system.generate_anonymity_set_proof(
-                    peer_id=str(peer_ids[0]),
-                    anonymity_set_size=len(peer_ids)
-                )
-                zk_proofs["anonymity_set"] = [anonymity_proof]
+            # Reuse the proof generated above for the report (as dictionary)
+            zk_proofs = {"anonymity_set": [anonymity_proof]} if peer_count else {}
             
             # Generate reports in different formats
-            report_gen = ReportGenerator()
-            
-            # Console report
-            print("\n   Generating console report...")
-            console_report = report_gen.generate_console_report(report, zk_proofs)
+            report_gen = REPORT_GENERATOR
             
-            # JSON report
-            print("   Generating JSON report...")
-            json_report = report_gen.generate_json_report(report, zk_proofs)
+            # Console, JSON and HTML reports
+            print("\n   Generating console, JSON and HTML reports...")
+            reports = report_gen.generate_all(report, zk_proofs)
             
-            # HTML report  
-            print("   Generating HTML report...")
-            html_report = report_gen.generate_html_report(report, zk_proofs)
-            
-            print(f"\n   ✓ All reports generated successfully")
+            print(f"\n   ✓ All reports generated successfully ({', '.join(reports)})")
             
             # Export statistics
             print("\n10. Final statistics...")
@@ -172,9 +160,7 @@ async def main():
             print(f"    - Unique peers: {stats['unique_peers']}")
             print(f"    - Protocols seen: {stats['protocols_used']}")
             
-            print("\n" + "=" * 70)
-            print("✓ Analysis Complete!")
-            print("=" * 70)
+            print("\n".join(["", _BAR, "✓ Analysis Complete!", _BAR]))
             
             print("\n💡 Key Achievement:")
             print("   - Real py-libp2p connections established and analyzed")
@@ -185,11 +171,12 @@ async def main():
             # Cleanup (with timeout protection)
             print("11. Cleaning up...")
             with trio.fail_after(CLOSE_TIMEOUT):
-                await host1.close()
-                await host2.close()
+                await close_hosts([host1, host2])
             print("    ✓ Hosts closed")
 
 
 if __name__ == "__main__":
+    import trio
+    
     trio.run(main)
 
@@ -10,36 +10,66 @@ Each scenario is self-contained and includes:
 3. ZK proof generation
 4. Results and interpretation
 """
+import io
+import sys
+
 import trio
 from libp2p import new_host
 from libp2p.peer.peerinfo import info_from_p2p_addr
 from libp2p.tools.async_service import background_trio_service
-from multiaddr import Multiaddr
 
 from libp2p_privacy_poc.metadata_collector import MetadataCollector
 from libp2p_privacy_poc.privacy_analyzer import PrivacyAnalyzer
 from libp2p_privacy_poc.report_generator import ReportGenerator
 from libp2p_privacy_poc.mock_zk_proofs import MockZKProofSystem, ZKProofType
-from libp2p_privacy_poc.utils import get_peer_listening_address
+from libp2p_privacy_poc.utils import (
+    cached_multiaddr,
+    close_hosts,
+    get_peer_listening_address,
+    mint_peer_id,
+)
 
 # Timeout constants for network operations (in seconds)
 LISTEN_TIMEOUT = 10  # Time to bind listener
 CONNECT_TIMEOUT = 10  # Time to establish connection
 CLOSE_TIMEOUT = 5    # Time to cleanup/close hosts
 
+# Banner rules
+_BAR = "=" * 70
+_RULE = "-" * 70
+
+# One generator (and report ID) for the whole demo run
+REPORT_GENERATOR = ReportGenerator()
+
 
 def print_header(title: str):
     """Print a formatted header."""
-    print("\n" + "=" * 70)
-    print(f"  {title}")
-    print("=" * 70)
+    print("\n".join(["", _BAR, f"  {title}", _BAR]))
 
 
 def print_subheader(title: str):
     """Print a formatted subheader."""
-    print("\n" + "-" * 70)
-    print(f"  {title}")
-    print("-" * 70)
+    print("\n".join(["", _RULE, f"  {title}", _RULE]))
+
+
+def print_hosts(label: str, main_host, peer_hosts):
+    """Print the main host and its peers as a single buffered write."""
+    out = io.StringIO()
+    out.write(f"   {label}: {main_host.get_id()}\n")
+    for i, peer in enumerate(peer_hosts):
+        out.write(f"   Peer {i+1}: {peer.get_id()}\n")
+    sys.stdout.write(out.getvalue())
+
+
+def print_top_risks(report, limit: int = 3):
+    """Print the top risks of a report as a single buffered write."""
+    out = io.StringIO()
+    for risk in report.risks[:limit]:
+        out.write(f"   🔴 {risk.severity.upper()}: {risk.risk_type}\n")
+        out.write(f"      {risk.description[:70]}...\n")
+        if risk.recommendations:
+            out.write(f"      → {risk.recommendations[0]}\n")
+    sys.stdout.write(out.getvalue())
 
 
 async def scenario_1_timing_correlation():
@@ -64,9 +94,7 @@ async def scenario_1_timing_correlation():
     # Create 3 peer hosts (reduced from 5 for speed)
     peer_hosts = [new_host() for _ in range(3)]
     
-    print(f"   Hub: {hub_host.get_id()}")
-    for i, peer in enumerate(peer_hosts):
-        print(f"   Peer {i+1}: {peer.get_id()}")
+    print_hosts("Hub", hub_host, peer_hosts)
     
     # Start networks
     print("\n   Starting networks...")
@@ -78,9 +106,9 @@ async def scenario_1_timing_correlation():
                 async with peer_services[2]:
                     # Start listeners (with timeout protection)
                     with trio.fail_after(LISTEN_TIMEOUT):
-                        await hub_host.get_network().listen(Multiaddr("/ip4/127.0.0.1/tcp/0"))
+                        await hub_host.get_network().listen(cached_multiaddr("/ip4/127.0.0.1/tcp/0"))
                         for peer in peer_hosts:
-                            await peer.get_network().listen(Multiaddr("/ip4/127.0.0.1/tcp/0"))
+                            await peer.get_network().listen(cached_multiaddr("/ip4/127.0.0.1/tcp/0"))
                     
                     await trio.sleep(0.5)
                     print("   ✓ Networks ready")
@@ -105,19 +133,14 @@ async def scenario_1_timing_correlation():
                     stats = collector.get_statistics()
                     print(f"   Total connections: {stats['total_connections']}")
                     
-                    analyzer = PrivacyAnalyzer(collector)
-                    report = analyzer.analyze()
+                    report = PrivacyAnalyzer.analyze_collector(collector)
                     
                     print(f"   Risk Score: {report.overall_risk_score:.2f}/1.00")
                     print(f"   Total Risks: {len(report.risks)}")
                     timing_risks = [r for r in report.risks if 'Timing' in r.risk_type or 'timing' in r.risk_type.lower()]
                     print(f"   Timing-Related Risks: {len(timing_risks)}")
                     
-                    for risk in report.risks[:3]:  # Show top 3 risks
-                        print(f"   🔴 {risk.severity.upper()}: {risk.risk_type}")
-                        print(f"      {risk.description[:70]}...")
-                        if risk.recommendations:
-                            print(f"      → {risk.recommendations[0]}")
+                    print_top_risks(report)
                     
                     # ZK Proof Demonstration
                     print_subheader("ZK Proof: Timing Independence")
@@ -137,9 +160,7 @@ async def scenario_1_timing_correlation():
                     # Cleanup (with timeout protection)
                     print("\n   Cleaning up...")
                     with trio.fail_after(CLOSE_TIMEOUT):
-                        await hub_host.close()
-                        for peer in peer_hosts:
-                            await peer.close()
+                        await close_hosts([hub_host, *peer_hosts])
     
     print("\n✅ Scenario 1 Complete (Real Network)")
 
@@ -165,9 +186,7 @@ async def scenario_2_anonymity_set():
     
     peer_hosts = [new_host() for _ in range(2)]
     
-    print(f"   Main: {main_host.get_id()}")
-    print(f"   Peer 1: {peer_hosts[0].get_id()}")
-    print(f"   Peer 2: {peer_hosts[1].get_id()}")
+    print_hosts("Main", main_host, peer_hosts)
     print("   ⚠️  Only 2 peers - small anonymity set!")
     
     # Start networks
@@ -177,9 +196,9 @@ async def scenario_2_anonymity_set():
             async with background_trio_service(peer_hosts[1].get_network()):
                 # Start listeners (with timeout protection)
                 with trio.fail_after(LISTEN_TIMEOUT):
-                    await main_host.get_network().listen(Multiaddr("/ip4/127.0.0.1/tcp/0"))
-                    await peer_hosts[0].get_network().listen(Multiaddr("/ip4/127.0.0.1/tcp/0"))
-                    await peer_hosts[1].get_network().listen(Multiaddr("/ip4/127.0.0.1/tcp/0"))
+                    await main_host.get_network().listen(cached_multiaddr("/ip4/127.0.0.1/tcp/0"))
+                    await peer_hosts[0].get_network().listen(cached_multiaddr("/ip4/127.0.0.1/tcp/0"))
+                    await peer_hosts[1].get_network().listen(cached_multiaddr("/ip4/127.0.0.1/tcp/0"))
                 
                 await trio.sleep(0.5)
                 print("   ✓ Networks ready")
@@ -204,18 +223,13 @@ async def scenario_2_anonymity_set():
                 print(f"   Total connections: {stats['total_connections']}")
                 print(f"   Anonymity Set Size: {stats['unique_peers']}")
                 
-                analyzer = PrivacyAnalyzer(collector)
-                report = analyzer.analyze()
+                report = PrivacyAnalyzer.analyze_collector(collector)
                 
                 print(f"   Risk Score: {report.overall_risk_score:.2f}/1.00")
                 anonymity_risks = [r for r in report.risks if 'Anonymity' in r.risk_type or 'anonymity' in r.risk_type.lower()]
                 print(f"   Anonymity Risks Detected: {len(anonymity_risks)}")
                 
-                for risk in report.risks[:3]:
-                    print(f"   🔴 {risk.severity.upper()}: {risk.risk_type}")
-                    print(f"      {risk.description[:70]}...")
-                    if risk.recommendations:
-                        print(f"      → {risk.recommendations[0]}")
+                print_top_risks(report)
                 
                 # ZK Proof Demonstration
                 print_subheader("ZK Proof: Anonymity Set Membership")
@@ -236,9 +250,7 @@ async def scenario_2_anonymity_set():
                 # Cleanup (with timeout protection)
                 print("\n   Cleaning up...")
                 with trio.fail_after(CLOSE_TIMEOUT):
-                    await main_host.close()
-                    for peer in peer_hosts:
-                        await peer.close()
+                    await close_hosts([main_host, *peer_hosts])
     
     print("\n✅ Scenario 2 Complete (Real Network)")
 
@@ -264,9 +276,7 @@ async def scenario_3_protocol_fingerprinting():
     # Create 2 peer hosts
     peer_hosts = [new_host() for _ in range(2)]
     
-    print(f"   Main: {main_host.get_id()}")
-    for i, peer in enumerate(peer_hosts):
-        print(f"   Peer {i+1}: {peer.get_id()}")
+    print_hosts("Main", main_host, peer_hosts)
     
     print("\n   Starting networks...")
     async with background_trio_service(main_host.get_network()):
@@ -274,9 +284,9 @@ async def scenario_3_protocol_fingerprinting():
             async with background_trio_service(peer_hosts[1].get_network()):
                 # Start listeners (with timeout protection)
                 with trio.fail_after(LISTEN_TIMEOUT):
-                    await main_host.get_network().listen(Multiaddr("/ip4/127.0.0.1/tcp/0"))
+                    await main_host.get_network().listen(cached_multiaddr("/ip4/127.0.0.1/tcp/0"))
                     for peer in peer_hosts:
-                        await peer.get_network().listen(Multiaddr("/ip4/127.0.0.1/tcp/0"))
+                        await peer.get_network().listen(cached_multiaddr("/ip4/127.0.0.1/tcp/0"))
                 
                 await trio.sleep(0.5)
                 print("   ✓ Networks ready")
@@ -300,19 +310,14 @@ async def scenario_3_protocol_fingerprinting():
     
                 # Analyze
                 print_subheader("Analysis")
-                analyzer = PrivacyAnalyzer(collector)
-                report = analyzer.analyze()
+                report = PrivacyAnalyzer.analyze_collector(collector)
                 
                 print(f"   Risk Score: {report.overall_risk_score:.2f}/1.00")
                 print(f"   Total Risks: {len(report.risks)}")
                 protocol_risks = [r for r in report.risks if 'Protocol' in r.risk_type or 'Fingerprint' in r.risk_type]
                 print(f"   Protocol/Fingerprint Risks: {len(protocol_risks)}")
                 
-                for risk in report.risks[:3]:
-                    print(f"   🔴 {risk.severity.upper()}: {risk.risk_type}")
-                    print(f"      {risk.description[:70]}...")
-                    if risk.recommendations:
-                        print(f"      → {risk.recommendations[0]}")
+                print_top_risks(report)
                 
                 print("\n   💡 Insight: Protocol patterns can fingerprint nodes!")
                 print("   In production, unusual protocol combinations can make nodes identifiable.")
@@ -320,9 +325,7 @@ async def scenario_3_protocol_fingerprinting():
                 # Cleanup (with timeout protection)
                 print("\n   Cleaning up...")
                 with trio.fail_after(CLOSE_TIMEOUT):
-                    await main_host.close()
-                    for peer in peer_hosts:
-                        await peer.close()
+                    await close_hosts([main_host, *peer_hosts])
     
     print("\n✅ Scenario 3 Complete (Real Network)")
 
@@ -341,14 +344,15 @@ async def scenario_4_zk_proof_showcase():
     print("   Demonstrating all types of mock ZK proofs and their privacy benefits.")
     
     zk_system = MockZKProofSystem()
-    host = new_host()
+    # Only an identity is needed here, not a running host
+    peer_id = mint_peer_id()
     
     # 1. Anonymity Set Membership Proof
     print_subheader("1. Anonymity Set Membership Proof")
     print("   Claim: 'I am one of N peers, but I won't tell you which one'")
     
     proof1 = zk_system.generate_anonymity_set_proof(
-        peer_id=str(host.get_id()),
+        peer_id=str(peer_id),
         anonymity_set_size=100
     )
     
@@ -409,7 +413,7 @@ async def scenario_4_zk_proof_showcase():
     print("   Verifying all 4 proofs at once...")
     
     all_proofs = [proof1, proof2, proof3, proof4]
-    valid_count = sum(1 for p in all_proofs if zk_system.verify_proof(p))
+    valid_count = sum(zk_system.verify_proofs_batch(all_proofs))
     
     print(f"   ✓ Valid Proofs: {valid_count}/{len(all_proofs)}")
     print(f"   ✓ Batch verification successful!")
@@ -425,10 +429,6 @@ async def scenario_4_zk_proof_showcase():
     print("\n   💡 Note: These are MOCK proofs for demonstration.")
     print("      Real ZK proofs would use Groth16, PLONK, or similar schemes.")
     
-    # Cleanup (with timeout protection)
-    with trio.fail_after(CLOSE_TIMEOUT):
-        await host.close()
-    
     print("\n✅ Scenario 4 Complete")
 
 
@@ -453,9 +453,7 @@ async def scenario_5_comprehensive_report():
     # Create 3 peers (small anonymity set - privacy issue!)
     peer_hosts = [new_host() for _ in range(3)]
     
-    print(f"   Main: {main_host.get_id()}")
-    for i, peer in enumerate(peer_hosts):
-        print(f"   Peer {i+1}: {peer.get_id()}")
+    print_hosts("Main", main_host, peer_hosts)
     print("   ⚠️  Small anonymity set + rapid connections = multiple privacy issues!")
     
     print("\n   Starting networks...")
@@ -467,9 +465,9 @@ async def scenario_5_comprehensive_report():
                 async with peer_services[2]:
                     # Start listeners (with timeout protection)
                     with trio.fail_after(LISTEN_TIMEOUT):
-                        await main_host.get_network().listen(Multiaddr("/ip4/127.0.0.1/tcp/0"))
+                        await main_host.get_network().listen(cached_multiaddr("/ip4/127.0.0.1/tcp/0"))
                         for peer in peer_hosts:
-                            await peer.get_network().listen(Multiaddr("/ip4/127.0.0.1/tcp/0"))
+                            await peer.get_network().listen(cached_multiaddr("/ip4/127.0.0.1/tcp/0"))
                     
                     await trio.sleep(0.5)
                     print("   ✓ Networks ready")
@@ -494,8 +492,7 @@ async def scenario_5_comprehensive_report():
                     print(f"   Connections: {stats['total_connections']}")
                     print(f"   Unique peers: {stats['unique_peers']}")
                     
-                    analyzer = PrivacyAnalyzer(collector)
-                    report = analyzer.analyze()
+                    report = PrivacyAnalyzer.analyze_collector(collector)
                     
                     print(f"   Risk Score: {report.overall_risk_score:.2f}/1.00")
                     print(f"   Total Risks: {len(report.risks)}")
@@ -522,7 +519,7 @@ async def scenario_5_comprehensive_report():
                     
                     # Generate comprehensive report
                     print_subheader("Comprehensive Report")
-                    report_gen = ReportGenerator()
+                    report_gen = REPORT_GENERATOR
                     
                     console_report = report_gen.generate_console_report(
                         report=report,
@@ -535,18 +532,14 @@ async def scenario_5_comprehensive_report():
                     # Cleanup (with timeout protection)
                     print("\n   Cleaning up...")
                     with trio.fail_after(CLOSE_TIMEOUT):
-                        await main_host.close()
-                        for peer in peer_hosts:
-                            await peer.close()
+                        await close_hosts([main_host, *peer_hosts])
     
     print("\n✅ Scenario 5 Complete (Real Network)")
 
 
 async def main():
     """Run all demo scenarios."""
-    print("\n" + "=" * 70)
-    print("  PRIVACY ANALYSIS DEMO SCENARIOS")
-    print("=" * 70)
+    print("\n".join(["", _BAR, "  PRIVACY ANALYSIS DEMO SCENARIOS", _BAR]))
     print("\n  This demonstration showcases:")
     print("  • Various privacy leak scenarios")
     print("  • Privacy analysis and risk detection")
@@ -562,9 +555,7 @@ async def main():
     ]
     
     for i, (name, scenario_func) in enumerate(scenarios, 1):
-        print(f"\n\n{'=' * 70}")
-        print(f"  Running Scenario {i}/{len(scenarios)}")
-        print(f"{'=' * 70}")
+        print("\n".join(["\n", _BAR, f"  Running Scenario {i}/{len(scenarios)}", _BAR]))
         
         await scenario_func()
         
@@ -572,9 +563,7 @@ async def main():
             print("\n  Press Ctrl+C to stop, or wait 2s for next scenario...")
             await trio.sleep(2)
     
-    print("\n\n" + "=" * 70)
-    print("  ALL SCENARIOS COMPLETE!")
-    print("=" * 70)
+    print("\n".join(["\n", _BAR, "  ALL SCENARIOS COMPLETE!", _BAR]))
     print("\n  Key Takeaways:")
     print("  1. Timing correlations leak identity information")
     print("  2. Small anonymity sets reduce privacy significantly")
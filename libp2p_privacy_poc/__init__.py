@@ -11,20 +11,34 @@ Mock ZK proofs are used for demonstration purposes only.
 __version__ = "0.1.0"
 __author__ = "Hany Almnaem"
 
-from libp2p_privacy_poc.metadata_collector import MetadataCollector, ConnectionMetadata
-from libp2p_privacy_poc.privacy_analyzer import PrivacyAnalyzer, PrivacyReport
-from libp2p_privacy_poc.mock_zk_proofs import MockZKProofSystem, ZKProofType
-from libp2p_privacy_poc.report_generator import ReportGenerator
-
-__all__ = [
-    "MetadataCollector",
-    "ConnectionMetadata",
-    "PrivacyAnalyzer",
-    "PrivacyReport",
-    "MockZKProofSystem",
-    "ZKProofType",
-    "ReportGenerator",
-]
+import importlib
+
+# Public names are resolved on first access (PEP 562), so importing the
+# package (e.g. for `libp2p-privacy version`) does not load every submodule
+_LAZY_EXPORTS = {
+    "MetadataCollector": "libp2p_privacy_poc.metadata_collector",
+    "ConnectionMetadata": "libp2p_privacy_poc.metadata_collector",
+    "PrivacyAnalyzer": "libp2p_privacy_poc.privacy_analyzer",
+    "PrivacyReport": "libp2p_privacy_poc.privacy_analyzer",
+    "MockZKProofSystem": "libp2p_privacy_poc.mock_zk_proofs",
+    "ZKProofType": "libp2p_privacy_poc.mock_zk_proofs",
+    "ReportGenerator": "libp2p_privacy_poc.report_generator",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 # Version and disclaimer
 DISCLAIMER = """
@@ -7,18 +7,16 @@ Provides easy-to-use commands for privacy analysis, reporting, and demonstration
 import click
 import json
 import sys
-import time
+from itertools import islice
 from pathlib import Path
 from typing import Optional
 
-from libp2p import new_host
-from multiaddr import Multiaddr
-
 from libp2p_privacy_poc import print_disclaimer
 from libp2p_privacy_poc.metadata_collector import MetadataCollector
 from libp2p_privacy_poc.privacy_analyzer import PrivacyAnalyzer
 from libp2p_privacy_poc.mock_zk_proofs import MockZKProofSystem
 from libp2p_privacy_poc.report_generator import ReportGenerator
+from libp2p_privacy_poc.utils import cached_multiaddr
 from libp2p_privacy_poc.zk_integration import (
     ZKDataPreparator,
     generate_real_commitment_proof,
@@ -26,6 +24,11 @@ from libp2p_privacy_poc.zk_integration import (
 )
 
 
+def _echo_lines(*lines: str) -> None:
+    """Echo several lines with a single write instead of one per line."""
+    click.echo("\n".join(lines))
+
+
 @click.group()
 @click.version_option(version="0.1.0")
 def main():
@@ -138,10 +141,12 @@ def analyze(
         from libp2p.tools.async_service import background_trio_service
         from libp2p_privacy_poc.utils import get_peer_listening_address
         
-        click.echo("\n" + "=" * 70)
-        click.echo(click.style("libp2p Privacy Analysis Tool", fg="cyan", bold=True))
-        click.echo("=" * 70)
-        click.echo(click.style("\n✓ Using REAL py-libp2p network", fg="green"))
+        _echo_lines(
+            "\n" + "=" * 70,
+            click.style("libp2p Privacy Analysis Tool", fg="cyan", bold=True),
+            "=" * 70,
+            click.style("\n✓ Using REAL py-libp2p network", fg="green"),
+        )
         
         # Create host
         if verbose:
@@ -164,7 +169,7 @@ def analyze(
             # Start listener with timeout
             try:
                 with trio.fail_after(5):
-                    await network.listen(Multiaddr(listen_addr))
+                    await network.listen(cached_multiaddr(listen_addr))
             except trio.TooSlowError:
                 click.echo(click.style("✗ Timeout starting listener", fg="red"), err=True)
                 return None, None
@@ -184,13 +189,15 @@ def analyze(
                 if verbose:
                     click.echo(f"\nConnecting to peer: {connect_to}")
                 try:
-                    peer_info = info_from_p2p_addr(Multiaddr(connect_to))
+                    peer_info = info_from_p2p_addr(cached_multiaddr(connect_to))
                     with trio.fail_after(10):
                         await host.connect(peer_info)
                     click.echo(click.style("✓ Connected successfully", fg="green"))
                 except Exception as e:
-                    click.echo(click.style(f"⚠️  Connection failed: {e}", fg="yellow"))
-                    click.echo("Continuing with analysis of local activity...")
+                    _echo_lines(
+                        click.style(f"⚠️  Connection failed: {e}", fg="yellow"),
+                        "Continuing with analysis of local activity...",
+                    )
             
             # Capture events for specified duration
             click.echo(f"\nCapturing network events for {duration} seconds...")
@@ -207,10 +214,12 @@ def analyze(
             
             # Get final statistics
             stats = collector.get_statistics()
-            click.echo(f"\n{click.style('✓ Capture Complete!', fg='green')}")
-            click.echo(f"  Connections: {stats['total_connections']}")
-            click.echo(f"  Unique Peers: {stats['unique_peers']}")
-            click.echo(f"  Protocols: {stats['protocols_used']}")
+            _echo_lines(
+                f"\n{click.style('✓ Capture Complete!', fg='green')}",
+                f"  Connections: {stats['total_connections']}",
+                f"  Unique Peers: {stats['unique_peers']}",
+                f"  Protocols: {stats['protocols_used']}",
+            )
             
             # Cleanup
             if verbose:
@@ -222,10 +231,12 @@ def analyze(
     
     def _analyze_simulated():
         """Run analysis with simulated data."""
-        click.echo("\n" + "=" * 70)
-        click.echo(click.style("libp2p Privacy Analysis Tool", fg="cyan", bold=True))
-        click.echo("=" * 70)
-        click.echo(click.style("\n⚠️  Using simulated data for demonstration", fg="yellow"))
+        _echo_lines(
+            "\n" + "=" * 70,
+            click.style("libp2p Privacy Analysis Tool", fg="cyan", bold=True),
+            "=" * 70,
+            click.style("\n⚠️  Using simulated data for demonstration", fg="yellow"),
+        )
         
         if verbose:
             click.echo("Creating MetadataCollector...")
@@ -252,12 +263,13 @@ def analyze(
         # Run privacy analysis
         if verbose:
             click.echo("\nRunning privacy analysis...")
-        analyzer = PrivacyAnalyzer(collector)
-        report = analyzer.analyze()
+        report = PrivacyAnalyzer.analyze_collector(collector)
         
-        click.echo(f"\n{click.style('✓ Analysis Complete!', fg='green')}")
-        click.echo(f"  Risk Score: {report.overall_risk_score:.2f}/1.00")
-        click.echo(f"  Risks Detected: {len(report.risks)}")
+        _echo_lines(
+            f"\n{click.style('✓ Analysis Complete!', fg='green')}",
+            f"  Risk Score: {report.overall_risk_score:.2f}/1.00",
+            f"  Risks Detected: {len(report.risks)}",
+        )
         
         # Generate ZK proofs if requested
         zk_proofs = None
@@ -329,7 +341,7 @@ def analyze(
                 click.echo("\n" + report_content)
         
         elif format == 'json':
-            report_content = report_gen.generate_json_report(
+            report_content = report_gen.generate_json_bytes(
                 report,
                 zk_proofs,
                 real_zk_proof=real_zk_proof,
@@ -337,19 +349,19 @@ def analyze(
                 data_source=data_source,
             )
             output_path = output or "privacy_report.json"
-            Path(output_path).write_text(report_content)
+            Path(output_path).write_bytes(report_content)
             click.echo(f"\n{click.style(f'✓ JSON report saved to: {output_path}', fg='green')}")
             
         elif format == 'html':
-            report_content = report_gen.generate_html_report(
-                report,
-                zk_proofs,
-                real_zk_proof=real_zk_proof,
-                real_phase2b_proofs=real_phase2b_proofs,
-                data_source=data_source,
-            )
             output_path = output or "privacy_report.html"
-            Path(output_path).write_text(report_content)
+            with open(output_path, "w", encoding="utf-8") as f:
+                f.writelines(report_gen.iter_html_report(
+                    report,
+                    zk_proofs,
+                    real_zk_proof=real_zk_proof,
+                    real_phase2b_proofs=real_phase2b_proofs,
+                    data_source=data_source,
+                ))
             click.echo(f"\n{click.style(f'✓ HTML report saved to: {output_path}', fg='green')}")
         
         click.echo("\n" + "=" * 70)
@@ -389,11 +401,13 @@ def demo(verbose):
     import subprocess
     
     try:
-        click.echo("\n" + "=" * 70)
-        click.echo(click.style("Privacy Analysis Demonstrations", fg="cyan", bold=True))
-        click.echo("=" * 70)
-        click.echo(click.style("\n✓ Running REAL network demonstrations", fg="green"))
-        click.echo("This will run all 5 scenarios with real py-libp2p connections.\n")
+        _echo_lines(
+            "\n" + "=" * 70,
+            click.style("Privacy Analysis Demonstrations", fg="cyan", bold=True),
+            "=" * 70,
+            click.style("\n✓ Running REAL network demonstrations", fg="green"),
+            "This will run all 5 scenarios with real py-libp2p connections.\n",
+        )
         
         # Run the demo_scenarios.py script
         import os
@@ -412,9 +426,11 @@ def demo(verbose):
         )
         
         if result.returncode == 0:
-            click.echo("\n" + "=" * 70)
-            click.echo(click.style("✓ All Demonstrations Complete!", fg="green"))
-            click.echo("=" * 70 + "\n")
+            _echo_lines(
+                "\n" + "=" * 70,
+                click.style("✓ All Demonstrations Complete!", fg="green"),
+                "=" * 70 + "\n",
+            )
         else:
             click.echo(click.style(f"\n✗ Demo failed with exit code {result.returncode}", fg="red"), err=True)
             sys.exit(result.returncode)
@@ -430,85 +446,117 @@ def demo(verbose):
 @main.command()
 def version():
     """Show version and disclaimer information."""
-    click.echo("\nlibp2p Privacy Analysis Tool v0.1.0")
-    click.echo("Proof of Concept - Not Production Ready\n")
+    _echo_lines(
+        "\nlibp2p Privacy Analysis Tool v0.1.0",
+        "Proof of Concept - Not Production Ready\n",
+    )
     print_disclaimer()
 
 
+# Simulated connection records: (peer_id, multiaddr, direction)
+SIMULATED_CONNECTIONS = (
+    ("QmPeer1abc123def456", "/ip4/192.168.1.100/tcp/4001", "outbound"),
+    ("QmPeer2xyz789ghi012", "/ip4/192.168.1.101/tcp/4001", "inbound"),
+    ("QmPeer3jkl345mno678", "/ip4/192.168.1.102/tcp/4001", "outbound"),
+    ("QmPeer1abc123def456", "/ip4/192.168.1.100/tcp/4002", "inbound"),
+    ("QmPeer4pqr901stu234", "/ip4/192.168.1.103/tcp/4001", "outbound"),
+)
+
+# Synthetic spacing between simulated connections (seconds)
+SIMULATED_INTERVAL = 0.05
+
+# Protocols negotiated with the first simulated peer
+SIMULATED_PROTOCOLS = ("/ipfs/id/1.0.0", "/ipfs/bitswap/1.2.0")
+
+# Demo peer addresses, formatted once at import rather than per demo run
+LINKABILITY_DEMO_ADDRS = tuple(
+    f"/ip4/192.168.1.100/tcp/{port}" for port in range(4001, 4004)
+)
+ANONYMITY_DEMO_PEERS = tuple(
+    (f"QmPeer{i}", f"/ip4/192.168.1.{100 + i}/tcp/4001") for i in range(10)
+)
+
+
 def _simulate_network_activity(collector: MetadataCollector, verbose: bool = False):
     """Simulate network activity for demonstration."""
-    peers = [
-        ("QmPeer1abc123def456", "/ip4/192.168.1.100/tcp/4001"),
-        ("QmPeer2xyz789ghi012", "/ip4/192.168.1.101/tcp/4001"),
-        ("QmPeer3jkl345mno678", "/ip4/192.168.1.102/tcp/4001"),
-        ("QmPeer1abc123def456", "/ip4/192.168.1.100/tcp/4002"),
-        ("QmPeer4pqr901stu234", "/ip4/192.168.1.103/tcp/4001"),
+    # Inject synthetic timestamps instead of sleeping between events
+    start = collector.clock()
+    events = [
+        ("conn_open", peer_id_str, cached_multiaddr(addr_str), direction,
+         start + i * SIMULATED_INTERVAL)
+        for i, (peer_id_str, addr_str, direction) in enumerate(SIMULATED_CONNECTIONS)
     ]
     
-    for i, (peer_id_str, addr_str) in enumerate(peers):
-        collector.on_connection_opened(
-            peer_id=peer_id_str,
-            multiaddr=Multiaddr(addr_str),
-            direction="outbound" if i % 2 == 0 else "inbound"
-        )
-        time.sleep(0.05)
-    
-    # Simulate protocol negotiations
-    collector.on_protocol_negotiated("QmPeer1abc123def456", "/ipfs/id/1.0.0")
-    collector.on_protocol_negotiated("QmPeer1abc123def456", "/ipfs/bitswap/1.2.0")
+    # Protocol negotiations and stream activity
+    events.extend(
+        ("protocol", "QmPeer1abc123def456", protocol) for protocol in SIMULATED_PROTOCOLS
+    )
+    events.append(("streams", "QmPeer1abc123def456", 1))
+    events.append(("streams", "QmPeer2xyz789ghi012", 1))
     
-    # Simulate stream activity
-    collector.on_stream_opened("QmPeer1abc123def456")
-    collector.on_stream_opened("QmPeer2xyz789ghi012")
+    collector.ingest_batch(events)
 
 
 def _generate_zk_proofs(collector: MetadataCollector, verbose: bool = False):
     """Generate mock ZK proofs for demonstration."""
-    zk_system = MockZKProofSystem()
     zk_proofs = {}
     
-    peer_ids = list(collector.peers.keys())
-    if peer_ids:
-        # Anonymity set proof
-        anonymity_proof = zk_system.generate_anonymity_set_proof(
-            peer_id=peer_ids[0],
-            anonymity_set_size=len(peer_ids)
-        )
-        zk_proofs["anonymity_set"] = [anonymity_proof]
-        
-        # Unlinkability proof (if multiple peers)
-        if len(peer_ids) >= 2:
-            unlinkability_proof = zk_system.generate_unlinkability_proof(
-                session_1_id=peer_ids[0],
-                session_2_id=peer_ids[1]
-            )
-            zk_proofs["unlinkability"] = [unlinkability_proof]
+    peer_count = collector.peer_count()
+    if not peer_count:
+        return zk_proofs
+    
+    # Only the first two peers are ever proof inputs
+    peer_ids = list(islice(collector.peers, 2))
+    zk_system = MockZKProofSystem()
+    
+    # Anonymity set proof
+    anonymity_proof = zk_system.generate_anonymity_set_proof(
+        peer_id=peer_ids[0],
+        anonymity_set_size=peer_count
+    )
+    zk_proofs["anonymity_set"] = [anonymity_proof]
+    if verbose:
+        click.echo(f"  Anonymity set proof over {peer_count} peers")
+    
+    if len(peer_ids) < 2:
+        return zk_proofs
+    
+    # Unlinkability proof (needs two sessions)
+    unlinkability_proof = zk_system.generate_unlinkability_proof(
+        session_1_id=peer_ids[0],
+        session_2_id=peer_ids[1]
+    )
+    zk_proofs["unlinkability"] = [unlinkability_proof]
+    if verbose:
+        click.echo("  Unlinkability proof for first two peers")
     
     return zk_proofs
 
 
 def _demo_timing_correlation(verbose: bool):
     """Demonstrate timing correlation detection."""
-    click.echo("\n" + "-" * 70)
-    click.echo(click.style("Demo: Timing Correlation Detection", fg="cyan", bold=True))
-    click.echo("-" * 70)
-    click.echo("\nThis demo shows how timing patterns can leak privacy information.")
+    _echo_lines(
+        "\n" + "-" * 70,
+        click.style("Demo: Timing Correlation Detection", fg="cyan", bold=True),
+        "-" * 70,
+        "\nThis demo shows how timing patterns can leak privacy information.",
+    )
     
     collector = MetadataCollector()
     
-    # Create regular timing pattern
+    # Create regular timing pattern (synthetic 100ms interval)
+    start = collector.clock()
     for i in range(5):
         collector.on_connection_opened(
             peer_id=f"QmPeer{i}",
-            multiaddr=Multiaddr("/ip4/127.0.0.1/tcp/4001"),
-            direction="outbound"
+            multiaddr=cached_multiaddr("/ip4/127.0.0.1/tcp/4001"),
+            direction="outbound",
+            timestamp=start + i * 0.1,
         )
-        time.sleep(0.1)  # Regular interval
     
-    analyzer = PrivacyAnalyzer(collector)
-    report = analyzer.analyze()
+    report = PrivacyAnalyzer.analyze_collector(collector)
     
-    timing_risks = [r for r in report.risks if r.risk_type == "Timing Correlation"]
+    timing_risks = report.get_risks_by_type("Timing Correlation")
     click.echo(f"\n{click.style(f'✓ Detected {len(timing_risks)} timing-related risks', fg='yellow')}")
     
     for risk in timing_risks:
@@ -517,61 +565,63 @@ def _demo_timing_correlation(verbose: bool):
 
 def _demo_peer_linkability(verbose: bool):
     """Demonstrate peer linkability detection."""
-    click.echo("\n" + "-" * 70)
-    click.echo(click.style("Demo: Peer Linkability Detection", fg="cyan", bold=True))
-    click.echo("-" * 70)
-    click.echo("\nThis demo shows how multiple connections can be linked to the same peer.")
+    _echo_lines(
+        "\n" + "-" * 70,
+        click.style("Demo: Peer Linkability Detection", fg="cyan", bold=True),
+        "-" * 70,
+        "\nThis demo shows how multiple connections can be linked to the same peer.",
+    )
     
     collector = MetadataCollector()
     
     # Same peer, multiple addresses
     peer_id = "QmTestPeer123"
-    for i in range(3):
-        collector.on_connection_opened(
-            peer_id=peer_id,
-            multiaddr=Multiaddr(f"/ip4/192.168.1.100/tcp/{4001+i}"),
-            direction="outbound"
-        )
+    collector.on_connections_opened_batch(
+        (peer_id, cached_multiaddr(addr), "outbound")
+        for addr in LINKABILITY_DEMO_ADDRS
+    )
     
-    analyzer = PrivacyAnalyzer(collector)
-    report = analyzer.analyze()
+    report = PrivacyAnalyzer.analyze_collector(collector)
     
-    click.echo(f"\n{click.style('✓ Analysis complete', fg='yellow')}")
-    click.echo(f"  • Detected connections from same peer across {len(collector.peers[peer_id].multiaddrs)} addresses")
+    _echo_lines(
+        f"\n{click.style('✓ Analysis complete', fg='yellow')}",
+        f"  • Detected connections from same peer across {len(collector.peers[peer_id].multiaddrs)} addresses",
+    )
 
 
 def _demo_anonymity_set(verbose: bool):
     """Demonstrate anonymity set analysis."""
-    click.echo("\n" + "-" * 70)
-    click.echo(click.style("Demo: Anonymity Set Analysis with ZK Proofs", fg="cyan", bold=True))
-    click.echo("-" * 70)
-    click.echo("\nThis demo shows anonymity set analysis and ZK proof generation.")
+    _echo_lines(
+        "\n" + "-" * 70,
+        click.style("Demo: Anonymity Set Analysis with ZK Proofs", fg="cyan", bold=True),
+        "-" * 70,
+        "\nThis demo shows anonymity set analysis and ZK proof generation.",
+    )
     
     collector = MetadataCollector()
     
     # Simulate connections to various peers
-    for i in range(10):
-        collector.on_connection_opened(
-            peer_id=f"QmPeer{i}",
-            multiaddr=Multiaddr(f"/ip4/192.168.1.{100+i}/tcp/4001"),
-            direction="outbound"
-        )
+    collector.on_connections_opened_batch(
+        (peer_id, cached_multiaddr(addr), "outbound")
+        for peer_id, addr in ANONYMITY_DEMO_PEERS
+    )
     
-    analyzer = PrivacyAnalyzer(collector)
-    report = analyzer.analyze()
+    report = PrivacyAnalyzer.analyze_collector(collector)
     
     # Generate ZK proof
     zk_system = MockZKProofSystem()
-    peer_ids = list(collector.peers.keys())
+    peer_count = collector.peer_count()
     proof = zk_system.generate_anonymity_set_proof(
-        peer_id=peer_ids[0],
-        anonymity_set_size=len(peer_ids)
+        peer_id=collector.first_peer_id(),
+        anonymity_set_size=peer_count
     )
     
-    click.echo(f"\n{click.style('✓ Anonymity analysis complete', fg='yellow')}")
-    click.echo(f"  • Anonymity set size: {len(peer_ids)}")
-    click.echo(f"  • Generated ZK proof: {proof.proof_type}")
-    click.echo(f"  • Proof verified: {click.style('✓', fg='green') if zk_system.verify_proof(proof) else click.style('✗', fg='red')}")
+    _echo_lines(
+        f"\n{click.style('✓ Anonymity analysis complete', fg='yellow')}",
+        f"  • Anonymity set size: {peer_count}",
+        f"  • Generated ZK proof: {proof.proof_type}",
+        f"  • Proof verified: {click.style('✓', fg='green') if zk_system.verify_proof(proof) else click.style('✗', fg='red')}",
+    )
 
 
 if __name__ == "__main__":
@@ -11,20 +11,28 @@ Key instrumentation points:
 - Stream creation/closure
 """
 
+from __future__ import annotations
+
+import itertools
+import operator
+import sys
 import time
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, TYPE_CHECKING
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, TYPE_CHECKING
 from collections import defaultdict
 
-from multiaddr import Multiaddr
-from libp2p.peer.id import ID as PeerID
-from libp2p.abc import INetConn, INetStream, INetwork, INotifee
-
 if TYPE_CHECKING:
     from typing import Any
 
+    from libp2p.peer.id import ID as PeerID
+    from multiaddr import Multiaddr
+
 
-@dataclass
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep a __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class ConnectionMetadata:
     """
     Metadata about a single connection.
@@ -69,7 +77,7 @@ class ConnectionMetadata:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PeerMetadata:
     """
     Aggregated metadata about a peer across multiple connections.
@@ -95,89 +103,6 @@ class PeerMetadata:
         }
 
 
-class PrivacyNotifee(INotifee):
-    """
-    Network notifee implementation to capture privacy-relevant events.
-    
-    This class implements the INotifee interface and forwards events
-    to the MetadataCollector for processing.
-    """
-    
-    def __init__(self, collector: 'MetadataCollector'):
-        """
-        Initialize the notifee.
-        
-        Args:
-            collector: The MetadataCollector instance to forward events to
-        """
-        self.collector = collector
-    
-    async def opened_stream(self, network: INetwork, stream: INetStream) -> None:
-        """Called when a new stream is opened."""
-        peer_id = stream.muxed_conn.peer_id
-        self.collector.on_stream_opened(peer_id)
-    
-    async def closed_stream(self, network: INetwork, stream: INetStream) -> None:
-        """Called when a stream is closed."""
-        # Stream closed event
-        pass
-    
-    async def connected(self, network: INetwork, conn: INetConn) -> None:
-        """Called when a new connection is established."""
-        try:
-            # Get peer_id from muxed connection
-            peer_id = conn.muxed_conn.peer_id
-            
-            # Get multiaddr from the connection itself (or from raw connection)
-            if hasattr(conn, 'multiaddr') and conn.multiaddr:
-                multiaddr = conn.multiaddr
-            elif hasattr(conn, 'raw_conn') and hasattr(conn.raw_conn, 'multiaddr'):
-                multiaddr = conn.raw_conn.multiaddr
-            else:
-                # Fallback: get from transport addresses
-                addrs = conn.get_transport_addresses() if hasattr(conn, 'get_transport_addresses') else []
-                multiaddr = addrs[0] if addrs else None
-            
-            # Determine direction based on whether we initiated the connection
-            direction = "outbound" if hasattr(conn, 'initiator') and conn.initiator else "inbound"
-            
-            self.collector.on_connection_opened(peer_id, multiaddr, direction)
-            print(f"[PrivacyNotifee] Connected: {peer_id} via {multiaddr}")
-        except Exception as e:
-            print(f"[PrivacyNotifee] Error in connected(): {e}")
-            import traceback
-            traceback.print_exc()
-    
-    async def disconnected(self, network: INetwork, conn: INetConn) -> None:
-        """Called when a connection is closed."""
-        try:
-            peer_id = conn.muxed_conn.peer_id if hasattr(conn, 'muxed_conn') and conn.muxed_conn else None
-            
-            # Get multiaddr from the connection itself
-            multiaddr = None
-            if hasattr(conn, 'multiaddr') and conn.multiaddr:
-                multiaddr = conn.multiaddr
-            elif hasattr(conn, 'raw_conn') and hasattr(conn.raw_conn, 'multiaddr'):
-                multiaddr = conn.raw_conn.multiaddr
-            elif hasattr(conn, 'get_transport_addresses'):
-                addrs = conn.get_transport_addresses()
-                multiaddr = addrs[0] if addrs else None
-            
-            if peer_id and multiaddr:
-                self.collector.on_connection_closed(peer_id, multiaddr)
-                print(f"[PrivacyNotifee] Disconnected: {peer_id}")
-        except Exception as e:
-            print(f"[PrivacyNotifee] Error in disconnected(): {e}")
-    
-    async def listen(self, network: INetwork, multiaddr: Multiaddr) -> None:
-        """Called when the node starts listening on a new multiaddr."""
-        pass
-    
-    async def listen_close(self, network: INetwork, multiaddr: Multiaddr) -> None:
-        """Called when the node stops listening on a multiaddr."""
-        pass
-
-
 class MetadataCollector:
     """
     Collects privacy-relevant metadata from py-libp2p nodes.
@@ -191,14 +116,17 @@ class MetadataCollector:
     The collected data is used for privacy analysis and (future) ZK proof generation.
     """
     
-    def __init__(self, libp2p_host=None):
+    def __init__(self, libp2p_host=None, clock: Callable[[], float] = time.time):
         """
         Initialize the metadata collector.
         
         Args:
             libp2p_host: Optional py-libp2p host instance to monitor
+            clock: Time source used when an event carries no explicit
+                timestamp (default: time.time)
         """
         self.host = libp2p_host
+        self.clock = clock
         
         # Storage for collected metadata
         self.connections: Dict[str, ConnectionMetadata] = {}
@@ -215,6 +143,11 @@ class MetadataCollector:
         # Session tracking
         self.active_sessions: Set[str] = set()
         
+        # Open connections in opening order, overall and per peer, so
+        # queries and per-peer events don't scan every connection ever seen
+        self._open_connections: Dict[str, ConnectionMetadata] = {}
+        self._open_by_peer: Dict[str, Dict[str, ConnectionMetadata]] = {}
+        
         # Statistics
         self.total_connections = 0
         self.total_disconnections = 0
@@ -233,6 +166,9 @@ class MetadataCollector:
         if not self.host:
             return
         
+        # Imported here so the collector itself stays free of libp2p imports
+        from libp2p_privacy_poc.notifee import PrivacyNotifee
+        
         # Create and register our notifee
         self.notifee = PrivacyNotifee(self)
         network = self.host.get_network()
@@ -240,7 +176,13 @@ class MetadataCollector:
         
         print(f"✓ Privacy notifee registered with {network}")
     
-    def on_connection_opened(self, peer_id: PeerID, multiaddr: Multiaddr, direction: str):
+    def on_connection_opened(
+        self,
+        peer_id: PeerID,
+        multiaddr: Multiaddr,
+        direction: str,
+        timestamp: Optional[float] = None,
+    ):
         """
         Called when a new connection is opened.
         
@@ -248,58 +190,175 @@ class MetadataCollector:
             peer_id: The peer ID of the remote peer
             multiaddr: The multiaddr of the connection
             direction: "inbound" or "outbound"
+            timestamp: Optional event time (default: read from the clock)
         """
+        if timestamp is None:
+            timestamp = self.clock()
         peer_id_str = str(peer_id)
         multiaddr_str = str(multiaddr)
-        connection_id = f"{peer_id_str}_{time.time()}"
+        # Running count keeps IDs unique when a peer reopens at the same time
+        connection_id = f"{peer_id_str}_{timestamp}_{self.total_connections}"
         
         # Create connection metadata
         metadata = ConnectionMetadata(
             peer_id=peer_id_str,
             multiaddr=multiaddr_str,
             direction=direction,
-            timestamp_start=time.time(),
+            timestamp_start=timestamp,
             transport_type=self._extract_transport_type(multiaddr_str)
         )
         
         self.connections[connection_id] = metadata
+        self._open_connections[connection_id] = metadata
+        self._open_by_peer.setdefault(peer_id_str, {})[connection_id] = metadata
         self.connection_times.append(metadata.timestamp_start)
         self.total_connections += 1
         self.active_sessions.add(connection_id)
         
         # Update peer metadata
-        self._update_peer_metadata(peer_id_str, multiaddr_str)
+        self._update_peer_metadata(peer_id_str, multiaddr_str, timestamp)
+    
+    def on_connections_opened_batch(
+        self,
+        connections: Iterable[Tuple[PeerID, Multiaddr, str]],
+        timestamps: Optional[Iterable[float]] = None,
+    ):
+        """
+        Record several newly opened connections in a single pass.
+        
+        Equivalent to calling on_connection_opened() for each entry, but
+        the clock and collector state are resolved once per batch. Without
+        explicit timestamps, all connections share the same start time.
+        
+        Args:
+            connections: Iterable of (peer_id, multiaddr, direction) tuples
+            timestamps: Optional per-connection start times, in order
+        """
+        if timestamps is None:
+            timestamps = itertools.repeat(self.clock())
+        connections_map = self.connections
+        connection_times = self.connection_times
+        active_sessions = self.active_sessions
+        open_connections = self._open_connections
+        open_by_peer = self._open_by_peer
+        peers = self.peers
+        extract_transport_type = self._extract_transport_type
+        
+        for (peer_id, multiaddr, direction), timestamp in zip(connections, timestamps):
+            peer_id_str = str(peer_id)
+            multiaddr_str = str(multiaddr)
+            # Running count keeps IDs unique when a peer reappears with the
+            # same timestamp, within this batch or across batches
+            connection_id = f"{peer_id_str}_{timestamp}_{self.total_connections}"
+            
+            metadata = connections_map[connection_id] = ConnectionMetadata(
+                peer_id=peer_id_str,
+                multiaddr=multiaddr_str,
+                direction=direction,
+                timestamp_start=timestamp,
+                transport_type=extract_transport_type(multiaddr_str)
+            )
+            open_connections[connection_id] = metadata
+            open_by_peer.setdefault(peer_id_str, {})[connection_id] = metadata
+            connection_times.append(timestamp)
+            active_sessions.add(connection_id)
+            self.total_connections += 1
+            
+            peer = peers.get(peer_id_str)
+            if peer is None:
+                peer = peers[peer_id_str] = PeerMetadata(
+                    peer_id=peer_id_str,
+                    first_seen=timestamp,
+                    last_seen=timestamp
+                )
+            peer.connection_count += 1
+            peer.last_seen = timestamp
+            peer.multiaddrs.add(multiaddr_str)
+    
+    def ingest_batch(self, events: Iterable[Tuple]):
+        """
+        Apply a recorded sequence of events in order.
+        
+        Each event is a tuple whose first element names its kind:
+        
+        - ("conn_open", peer_id, multiaddr, direction[, timestamp])
+        - ("conn_close", peer_id, multiaddr[, timestamp])
+        - ("protocol", peer_id, protocol)
+        - ("streams", peer_id, count)
+        
+        Consecutive events of the same kind are applied together (e.g. a run
+        of "conn_open" events goes through on_connections_opened_batch()).
+        Events without a timestamp share a single clock reading.
+        
+        Args:
+            events: Iterable of event tuples
+        
+        Raises:
+            ValueError: If an event kind is not recognized
+        """
+        now = self.clock()
+        for kind, run in itertools.groupby(events, key=operator.itemgetter(0)):
+            if kind == "conn_open":
+                run = list(run)
+                self.on_connections_opened_batch(
+                    (event[1:4] for event in run),
+                    timestamps=[event[4] if len(event) > 4 else now for event in run],
+                )
+            elif kind == "conn_close":
+                for event in run:
+                    self.on_connection_closed(
+                        event[1], event[2], event[3] if len(event) > 3 else now
+                    )
+            elif kind == "protocol":
+                for _, peer_id, protocol in run:
+                    self.on_protocol_negotiated(peer_id, protocol)
+            elif kind == "streams":
+                for _, peer_id, count in run:
+                    self.on_streams_opened(peer_id, count)
+            else:
+                raise ValueError(f"Unknown event kind: {kind!r}")
     
-    def on_connection_closed(self, peer_id: PeerID, multiaddr: Multiaddr):
+    def on_connection_closed(
+        self,
+        peer_id: PeerID,
+        multiaddr: Multiaddr,
+        timestamp: Optional[float] = None,
+    ):
         """
         Called when a connection is closed.
         
         Args:
             peer_id: The peer ID of the remote peer
             multiaddr: The multiaddr of the connection
+            timestamp: Optional event time (default: read from the clock)
         """
         peer_id_str = str(peer_id)
-        current_time = time.time()
-        
-        # Find and finalize the connection
-        for conn_id, metadata in self.connections.items():
-            if metadata.peer_id == peer_id_str and metadata.timestamp_end is None:
-                metadata.timestamp_end = current_time
-                metadata.finalize()
-                
-                # Move to history
-                self.connection_history.append(metadata)
-                self.disconnection_times.append(current_time)
-                self.total_disconnections += 1
-                self.active_sessions.discard(conn_id)
-                
-                # Update peer metadata
-                if peer_id_str in self.peers:
-                    self.peers[peer_id_str].last_seen = current_time
-                    if metadata.connection_duration:
-                        self.peers[peer_id_str].total_duration += metadata.connection_duration
-                
-                break
+        current_time = self.clock() if timestamp is None else timestamp
+        
+        # Find and finalize the peer's oldest open connection
+        open_conns = self._open_by_peer.get(peer_id_str)
+        if not open_conns:
+            return
+        conn_id, metadata = next(iter(open_conns.items()))
+        del open_conns[conn_id]
+        if not open_conns:
+            del self._open_by_peer[peer_id_str]
+        del self._open_connections[conn_id]
+        
+        metadata.timestamp_end = current_time
+        metadata.finalize()
+        
+        # Move to history
+        self.connection_history.append(metadata)
+        self.disconnection_times.append(current_time)
+        self.total_disconnections += 1
+        self.active_sessions.discard(conn_id)
+        
+        # Update peer metadata
+        if peer_id_str in self.peers:
+            self.peers[peer_id_str].last_seen = current_time
+            if metadata.connection_duration:
+                self.peers[peer_id_str].total_duration += metadata.connection_duration
     
     def on_protocol_negotiated(self, peer_id: PeerID, protocol: str):
         """
@@ -310,20 +369,52 @@ class MetadataCollector:
             protocol: The protocol identifier
         """
         peer_id_str = str(peer_id)
+        # Every peer negotiates the same handful of protocol IDs; interning
+        # shares one string across usage counts and per-peer sets
+        protocol = sys.intern(str(protocol))
         
         # Track protocol usage
         self.protocol_usage[protocol] += 1
         
         # Update connection metadata
-        for metadata in self.connections.values():
-            if metadata.peer_id == peer_id_str and metadata.timestamp_end is None:
-                if protocol not in metadata.protocols:
-                    metadata.protocols.append(protocol)
+        for metadata in self._open_by_peer.get(peer_id_str, {}).values():
+            if protocol not in metadata.protocols:
+                metadata.protocols.append(protocol)
         
         # Update peer metadata
         if peer_id_str in self.peers:
             self.peers[peer_id_str].protocols.add(protocol)
     
+    def on_protocols_negotiated_batch(self, peer_id: PeerID, protocols: Iterable[str]):
+        """
+        Record several protocols negotiated with the same peer.
+        
+        Equivalent to calling on_protocol_negotiated() once per protocol,
+        but the peer's connections are scanned only once.
+        
+        Args:
+            peer_id: The peer ID of the remote peer
+            protocols: The protocol identifiers, in negotiation order
+        """
+        peer_id_str = str(peer_id)
+        protocols = tuple(sys.intern(str(protocol)) for protocol in protocols)
+        
+        # Track protocol usage
+        protocol_usage = self.protocol_usage
+        for protocol in protocols:
+            protocol_usage[protocol] += 1
+        
+        # Update connection metadata
+        for metadata in self._open_by_peer.get(peer_id_str, {}).values():
+            for protocol in protocols:
+                if protocol not in metadata.protocols:
+                    metadata.protocols.append(protocol)
+        
+        # Update peer metadata
+        peer = self.peers.get(peer_id_str)
+        if peer is not None:
+            peer.protocols.update(protocols)
+    
     def on_stream_opened(self, peer_id: PeerID):
         """
         Called when a new stream is opened.
@@ -331,12 +422,27 @@ class MetadataCollector:
         Args:
             peer_id: The peer ID of the remote peer
         """
+        self.on_streams_opened(peer_id, 1)
+    
+    def on_streams_opened(self, peer_id: PeerID, count: int):
+        """
+        Record several streams opened to the same peer in one call.
+        
+        Equivalent to calling on_stream_opened() count times, with a single
+        scan over the open connections.
+        
+        Args:
+            peer_id: The peer ID of the remote peer
+            count: Number of streams opened
+        """
+        if count <= 0:
+            return
+        
         peer_id_str = str(peer_id)
         
         # Update stream count in active connections
-        for metadata in self.connections.values():
-            if metadata.peer_id == peer_id_str and metadata.timestamp_end is None:
-                metadata.stream_count += 1
+        for metadata in self._open_by_peer.get(peer_id_str, {}).values():
+            metadata.stream_count += count
     
     def record_data_transfer(self, peer_id: PeerID, bytes_sent: int, bytes_received: int):
         """
@@ -350,14 +456,19 @@ class MetadataCollector:
         peer_id_str = str(peer_id)
         
         # Update active connections
-        for metadata in self.connections.values():
-            if metadata.peer_id == peer_id_str and metadata.timestamp_end is None:
-                metadata.bytes_sent += bytes_sent
-                metadata.bytes_received += bytes_received
+        for metadata in self._open_by_peer.get(peer_id_str, {}).values():
+            metadata.bytes_sent += bytes_sent
+            metadata.bytes_received += bytes_received
     
-    def _update_peer_metadata(self, peer_id: str, multiaddr: str):
+    def _update_peer_metadata(
+        self,
+        peer_id: str,
+        multiaddr: str,
+        current_time: Optional[float] = None,
+    ):
         """Update aggregated peer metadata."""
-        current_time = time.time()
+        if current_time is None:
+            current_time = self.clock()
         
         if peer_id not in self.peers:
             self.peers[peer_id] = PeerMetadata(
@@ -384,10 +495,15 @@ class MetadataCollector:
     
     def get_active_connections(self) -> List[ConnectionMetadata]:
         """Get all currently active connections."""
-        return [
-            conn for conn in self.connections.values()
-            if conn.timestamp_end is None
-        ]
+        return list(self._open_connections.values())
+    
+    def active_connection_count(self) -> int:
+        """Get the number of currently active connections."""
+        return len(self._open_connections)
+    
+    def first_active_connection(self) -> Optional[ConnectionMetadata]:
+        """Get the earliest-recorded active connection, or None."""
+        return next(iter(self._open_connections.values()), None)
     
     def get_connection_history(self, limit: Optional[int] = None) -> List[ConnectionMetadata]:
         """
@@ -417,12 +533,20 @@ class MetadataCollector:
         """Get metadata for all known peers."""
         return list(self.peers.values())
     
+    def first_peer_id(self) -> Optional[str]:
+        """Get the first peer seen, or None if no peers are known."""
+        return next(iter(self.peers), None)
+    
+    def peer_count(self) -> int:
+        """Get the number of known peers."""
+        return len(self.peers)
+    
     def get_statistics(self) -> dict:
         """Get overall statistics."""
         return {
             "total_connections": self.total_connections,
             "total_disconnections": self.total_disconnections,
-            "active_connections": len(self.get_active_connections()),
+            "active_connections": self.active_connection_count(),
             "unique_peers": len(self.peers),
             "protocols_used": len(self.protocol_usage),
             "total_connection_history": len(self.connection_history),
@@ -454,6 +578,15 @@ class MetadataCollector:
         self.disconnection_times.clear()
         self.protocol_usage.clear()
         self.active_sessions.clear()
+        self._open_connections.clear()
+        self._open_by_peer.clear()
         self.total_connections = 0
         self.total_disconnections = 0
 
+
+def __getattr__(name: str):
+    # PrivacyNotifee lives in notifee.py; keep the old import path working
+    if name == "PrivacyNotifee":
+        from libp2p_privacy_poc.notifee import PrivacyNotifee
+        return PrivacyNotifee
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
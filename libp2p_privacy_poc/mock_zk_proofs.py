@@ -13,12 +13,36 @@ This module demonstrates:
 For production, replace with real ZK circuits using PySnark2.
 """
 
+import functools
 import hashlib
+import hmac
 import json
+import struct
+import sys
 import time
+from collections import Counter
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    from blake3 import blake3 as _fast_hash
+except ImportError:  # Optional fast path; hashlib is always available
+    _fast_hash = hashlib.sha256
+
+
+# Attached to every serialized mock proof
+MOCK_PROOF_WARNING = "MOCK PROOF - NOT CRYPTOGRAPHICALLY SECURE"
+
+# Static proof_data contents, shared by every generated proof
+_ANONYMITY_NOTICE = "MOCK DATA - Real proof would contain Groth16 proof elements"
+_UNLINKABILITY_NOTICE = "MOCK DATA - Real proof would use commitment schemes and ZK circuits"
+_RANGE_NOTICE = "MOCK DATA - Real proof would use Bulletproofs or similar"
+_TIMING_NOTICE = "MOCK DATA - Real proof would use statistical ZK proofs"
+_MOCK_PROOF_PATH = ("mock_hash_1", "mock_hash_2", "mock_hash_3")  # immutable, safe to share
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep a __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class ZKProofType(Enum):
@@ -30,7 +54,53 @@ class ZKProofType(Enum):
     TIMING_INDEPENDENCE = "timing_independence"
 
 
-@dataclass
+# Encoded proof type names, prefixed to every mock proof hash
+_PROOF_TYPE_BYTES = {proof_type: proof_type.value.encode() for proof_type in ZKProofType}
+
+
+def _prefixed_digest(prefix_hasher: Any, suffix: bytes) -> str:
+    """Hex digest of a shared, already-absorbed prefix followed by suffix."""
+    hasher = prefix_hasher.copy()
+    hasher.update(suffix)
+    return hasher.hexdigest()
+
+
+# Mock verification keys depend only on the proof type. They always use
+# SHA-256 (never the optional fast hash) so every installation agrees on them.
+_VK_PREFIX_HASHER = hashlib.sha256(b"vk_")
+_VK_BY_TYPE: Dict[ZKProofType, str] = {
+    proof_type: _prefixed_digest(_VK_PREFIX_HASHER, type_bytes)
+    for proof_type, type_bytes in _PROOF_TYPE_BYTES.items()
+}
+
+
+def _keys_match(given: Any, expected: Optional[str]) -> bool:
+    """
+    Compare a proof's verification key with the expected one in constant time.
+    
+    Mismatched types, non-ASCII strings and unknown proof types (no
+    expected key) are simply a mismatch.
+    """
+    try:
+        return hmac.compare_digest(given, expected)
+    except TypeError:
+        return False
+
+
+@functools.lru_cache(maxsize=1024)
+def _mock_digest(data: str) -> str:
+    """
+    Hex digest of a string (NOT a real commitment).
+    
+    Mock Merkle roots and commitments depend only on their input, so
+    repeated proofs over the same peers and sessions reuse the digest.
+    Uses BLAKE3 when the optional blake3 package is installed, SHA-256
+    otherwise; both give 32-byte digests.
+    """
+    return _fast_hash(data.encode()).hexdigest()
+
+
+@dataclass(**_SLOTS)
 class MockZKProof:
     """
     Mock ZK Proof structure.
@@ -50,25 +120,40 @@ class MockZKProof:
     public_inputs: Dict[str, Any] = field(default_factory=dict)
     is_valid: bool = True
     
+    # Backing store for the mock_proof_hash property (an explicitly assigned
+    # hash, or "" to derive it); must precede mock_proof_hash so __init__
+    # resets it before the property setter runs
+    _mock_proof_hash: str = field(default="", init=False, repr=False, compare=False)
+    
     # Mock fields (would be real cryptography in production)
     mock_proof_hash: str = ""
     mock_verification_key: str = ""
     
     def __post_init__(self):
-        """Generate mock proof data."""
-        if not self.mock_proof_hash:
-            self.mock_proof_hash = self._generate_mock_hash()
+        """Generate mock proof data (the proof hash is derived when read)."""
         if not self.mock_verification_key:
             self.mock_verification_key = self._generate_mock_verification_key()
     
-    def _generate_mock_hash(self) -> str:
-        """Generate a mock proof hash (NOT cryptographically secure)."""
-        data = f"{self.proof_type.value}_{self.claim}_{self.timestamp}"
-        return hashlib.sha256(data.encode()).hexdigest()
+    def _get_mock_proof_hash(self) -> str:
+        # Not cached, so the hash always matches the current type, claim
+        # and timestamp; explicitly assigned hashes are kept as given
+        return self._mock_proof_hash or self._generate_mock_hash().hex()
+    
+    def _set_mock_proof_hash(self, value: str) -> None:
+        self._mock_proof_hash = value
+    
+    def _generate_mock_hash(self) -> bytes:
+        """Generate a mock proof hash digest (NOT cryptographically secure)."""
+        data = b"_".join((
+            _PROOF_TYPE_BYTES[self.proof_type],
+            self.claim.encode(),
+            struct.pack("<d", self.timestamp),
+        ))
+        return _fast_hash(data).digest()
     
     def _generate_mock_verification_key(self) -> str:
         """Generate a mock verification key (NOT cryptographically secure)."""
-        return hashlib.sha256(f"vk_{self.proof_type.value}".encode()).hexdigest()
+        return _VK_BY_TYPE[self.proof_type]
     
     def verify(self) -> bool:
         """
@@ -95,7 +180,7 @@ class MockZKProof:
             "is_valid": self.is_valid,
             "mock_proof_hash": self.mock_proof_hash,
             "mock_verification_key": self.mock_verification_key,
-            "WARNING": "MOCK PROOF - NOT CRYPTOGRAPHICALLY SECURE",
+            "WARNING": MOCK_PROOF_WARNING,
         }
     
     def __str__(self) -> str:
@@ -103,6 +188,14 @@ class MockZKProof:
         return f"MockZKProof({self.proof_type.value}: {self.claim})"
 
 
+# Installed after @dataclass so the field (and its __init__ argument) stays;
+# proofs that never expose their hash never pay for it
+MockZKProof.mock_proof_hash = property(
+    MockZKProof._get_mock_proof_hash,
+    MockZKProof._set_mock_proof_hash,
+)
+
+
 class MockZKProofSystem:
     """
     Mock Zero-Knowledge Proof System.
@@ -119,18 +212,87 @@ class MockZKProofSystem:
     4. Ensure zero-knowledge property
     """
     
-    def __init__(self):
-        """Initialize the mock ZK proof system."""
+    def __init__(self, clock: Callable[[], float] = time.time):
+        """
+        Initialize the mock ZK proof system.
+        
+        Args:
+            clock: Time source for proof timestamps (default: time.time)
+        """
+        self.clock = clock
         self.generated_proofs: List[MockZKProof] = []
-        self.verification_keys: Dict[ZKProofType, str] = {}
+        # Proof type value -> generator, for callers that route by string
+        self._generators: Dict[str, Callable[..., MockZKProof]] = {
+            ZKProofType.ANONYMITY_SET_MEMBERSHIP.value: self.generate_anonymity_set_proof,
+            ZKProofType.SESSION_UNLINKABILITY.value: self.generate_unlinkability_proof,
+            ZKProofType.RANGE_PROOF.value: self.generate_range_proof,
+            ZKProofType.TIMING_INDEPENDENCE.value: self.generate_timing_independence_proof,
+        }
+        self.verification_keys: Dict[ZKProofType, str] = _VK_BY_TYPE.copy()
+    
+    def _issue_proof(
+        self,
+        proof_type: ZKProofType,
+        claim: str,
+        proof_data: Dict[str, Any],
+        public_inputs: Dict[str, Any],
+        is_valid: bool = True,
+        timestamp: Optional[float] = None,
+    ) -> MockZKProof:
+        """
+        Build and record a new proof.
+        
+        The steps shared by every generate_* method.
+        """
+        if timestamp is None:
+            timestamp = self.clock()
+        proof = MockZKProof(
+            proof_type=proof_type,
+            claim=claim,
+            timestamp=timestamp,
+            proof_data=proof_data,
+            public_inputs=public_inputs,
+            is_valid=is_valid,
+        )
+        return self._record_proof(proof)
+    
+    def _record_proof(self, proof: MockZKProof) -> MockZKProof:
+        """Add a newly generated proof to the generated list."""
+        self.generated_proofs.append(proof)
+        return proof
+    
+    def reset(self) -> None:
+        """
+        Drop every generated proof.
         
-        # Initialize mock verification keys for each proof type
-        for proof_type in ZKProofType:
-            self.verification_keys[proof_type] = self._generate_mock_vk(proof_type)
+        Long generate/export loops can call this between rounds so that
+        old proofs can be reclaimed. Proofs already handed out stay valid
+        and verifiable.
+        """
+        self.generated_proofs.clear()
     
-    def _generate_mock_vk(self, proof_type: ZKProofType) -> str:
-        """Generate mock verification key."""
-        return hashlib.sha256(f"vk_{proof_type.value}".encode()).hexdigest()
+    def generate(self, proof_type: str, **kwargs: Any) -> MockZKProof:
+        """
+        Generate a mock proof from its proof type value.
+        
+        Routes e.g. "range_proof" to generate_range_proof() with a single
+        table lookup, for callers working from serialized proof types.
+        
+        Args:
+            proof_type: ZKProofType value (e.g. "session_unlinkability")
+            **kwargs: Arguments for the matching generate_* method
+        
+        Returns:
+            The generated MockZKProof
+        
+        Raises:
+            ValueError: If no generator exists for the proof type
+        """
+        try:
+            generator = self._generators[proof_type]
+        except KeyError:
+            raise ValueError(f"No mock generator for proof type: {proof_type!r}") from None
+        return generator(**kwargs)
     
     def generate_anonymity_set_proof(
         self,
@@ -159,26 +321,65 @@ class MockZKProofSystem:
         Returns:
             MockZKProof demonstrating anonymity set membership
         """
-        claim = f"Peer is one of {anonymity_set_size} peers in anonymity set"
-        
-        proof = MockZKProof(
-            proof_type=ZKProofType.ANONYMITY_SET_MEMBERSHIP,
-            claim=claim,
-            timestamp=time.time(),
+        return self._issue_proof(
+            ZKProofType.ANONYMITY_SET_MEMBERSHIP,
+            claim=f"Peer is one of {anonymity_set_size} peers in anonymity set",
             proof_data={
                 "anonymity_set_size": anonymity_set_size,
-                "mock_merkle_root": hashlib.sha256(f"set_{anonymity_set_size}".encode()).hexdigest(),
-                "mock_proof_path": ["mock_hash_1", "mock_hash_2", "mock_hash_3"],
-                "NOTICE": "MOCK DATA - Real proof would contain Groth16 proof elements"
+                "mock_merkle_root": _mock_digest(f"set_{anonymity_set_size}"),
+                "mock_proof_path": _MOCK_PROOF_PATH,
+                "NOTICE": _ANONYMITY_NOTICE
             },
             public_inputs={
                 "anonymity_set_size": anonymity_set_size,
                 "merkle_root": "mock_root_hash",
-            }
+            },
         )
+    
+    def generate_anonymity_set_proofs(
+        self,
+        peer_ids: List[str],
+        anonymity_set_size: int,
+    ) -> List[MockZKProof]:
+        """
+        Generate mock anonymity set membership proofs for many peers.
         
-        self.generated_proofs.append(proof)
-        return proof
+        ⚠️ MOCK IMPLEMENTATION
+        
+        Equivalent to calling generate_anonymity_set_proof() for each peer,
+        but the set-wide parts (claim, mock Merkle root, clock reading) are
+        computed once for the whole batch.
+        
+        Args:
+            peer_ids: Peer IDs proving membership (kept private in real ZK)
+            anonymity_set_size: Size of the shared anonymity set
+        
+        Returns:
+            One MockZKProof per peer, in input order
+        """
+        proof_type = ZKProofType.ANONYMITY_SET_MEMBERSHIP
+        claim = f"Peer is one of {anonymity_set_size} peers in anonymity set"
+        merkle_root = _mock_digest(f"set_{anonymity_set_size}")
+        timestamp = self.clock()
+        
+        return [
+            self._issue_proof(
+                proof_type,
+                claim=claim,
+                proof_data={
+                    "anonymity_set_size": anonymity_set_size,
+                    "mock_merkle_root": merkle_root,
+                    "mock_proof_path": _MOCK_PROOF_PATH,
+                    "NOTICE": _ANONYMITY_NOTICE
+                },
+                public_inputs={
+                    "anonymity_set_size": anonymity_set_size,
+                    "merkle_root": "mock_root_hash",
+                },
+                timestamp=timestamp,
+            )
+            for _ in peer_ids
+        ]
     
     def generate_unlinkability_proof(
         self,
@@ -207,27 +408,21 @@ class MockZKProofSystem:
         Returns:
             MockZKProof demonstrating session unlinkability
         """
-        claim = f"Sessions {session_1_id[:8]}... and {session_2_id[:8]}... are cryptographically unlinkable"
-        
-        proof = MockZKProof(
-            proof_type=ZKProofType.SESSION_UNLINKABILITY,
-            claim=claim,
-            timestamp=time.time(),
+        return self._issue_proof(
+            ZKProofType.SESSION_UNLINKABILITY,
+            claim=f"Sessions {session_1_id[:8]}... and {session_2_id[:8]}... are cryptographically unlinkable",
             proof_data={
-                "session_1_commitment": hashlib.sha256(session_1_id.encode()).hexdigest(),
-                "session_2_commitment": hashlib.sha256(session_2_id.encode()).hexdigest(),
+                "session_1_commitment": _mock_digest(session_1_id),
+                "session_2_commitment": _mock_digest(session_2_id),
                 "unlinkability_proof": "mock_unlinkability_data",
-                "NOTICE": "MOCK DATA - Real proof would use commitment schemes and ZK circuits"
+                "NOTICE": _UNLINKABILITY_NOTICE
             },
             public_inputs={
                 "session_1_commitment": "mock_commitment_1",
                 "session_2_commitment": "mock_commitment_2",
             },
-            is_valid=are_unlinkable
+            is_valid=are_unlinkable,
         )
-        
-        self.generated_proofs.append(proof)
-        return proof
     
     def generate_range_proof(
         self,
@@ -258,27 +453,21 @@ class MockZKProofSystem:
         Returns:
             MockZKProof demonstrating range membership
         """
-        claim = f"{value_name} is within range [{min_value}, {max_value}]"
-        
-        proof = MockZKProof(
-            proof_type=ZKProofType.RANGE_PROOF,
-            claim=claim,
-            timestamp=time.time(),
+        return self._issue_proof(
+            ZKProofType.RANGE_PROOF,
+            claim=f"{value_name} is within range [{min_value}, {max_value}]",
             proof_data={
                 "range_min": min_value,
                 "range_max": max_value,
-                "commitment": hashlib.sha256(f"{value_name}_{actual_value}".encode()).hexdigest() if actual_value else "mock_commitment",
+                "commitment": _mock_digest(f"{value_name}_{actual_value}") if actual_value else "mock_commitment",
                 "range_proof_data": "mock_bulletproof_data",
-                "NOTICE": "MOCK DATA - Real proof would use Bulletproofs or similar"
+                "NOTICE": _RANGE_NOTICE
             },
             public_inputs={
                 "min_value": min_value,
                 "max_value": max_value,
-            }
+            },
         )
-        
-        self.generated_proofs.append(proof)
-        return proof
     
     def generate_timing_independence_proof(
         self,
@@ -307,26 +496,20 @@ class MockZKProofSystem:
         Returns:
             MockZKProof demonstrating timing independence
         """
-        claim = f"Events {event_1} and {event_2} are timing-independent"
-        
-        proof = MockZKProof(
-            proof_type=ZKProofType.TIMING_INDEPENDENCE,
-            claim=claim,
-            timestamp=time.time(),
+        return self._issue_proof(
+            ZKProofType.TIMING_INDEPENDENCE,
+            claim=f"Events {event_1} and {event_2} are timing-independent",
             proof_data={
-                "event_1_commitment": hashlib.sha256(event_1.encode()).hexdigest(),
-                "event_2_commitment": hashlib.sha256(event_2.encode()).hexdigest(),
+                "event_1_commitment": _mock_digest(event_1),
+                "event_2_commitment": _mock_digest(event_2),
                 "timing_proof": "mock_timing_independence_data",
                 "statistical_test": "mock_randomness_test_passed",
-                "NOTICE": "MOCK DATA - Real proof would use statistical ZK proofs"
+                "NOTICE": _TIMING_NOTICE
             },
             public_inputs={
                 "independence_threshold": 0.05,  # p-value threshold
-            }
+            },
         )
-        
-        self.generated_proofs.append(proof)
-        return proof
     
     def verify_proof(self, proof: MockZKProof) -> bool:
         """
@@ -347,7 +530,7 @@ class MockZKProofSystem:
             Mock verification result (always True for valid mock proofs)
         """
         # Mock verification logic
-        if proof.mock_verification_key != self.verification_keys.get(proof.proof_type):
+        if not _keys_match(proof.mock_verification_key, self.verification_keys.get(proof.proof_type)):
             return False
         
         return proof.verify()
@@ -369,19 +552,42 @@ class MockZKProofSystem:
         Returns:
             True if all proofs verify
         """
-        return all(self.verify_proof(proof) for proof in proofs)
+        # Same checks as verify_proof(), applied column-wise over the batch;
+        # each pass stops at the first failing proof
+        verification_keys = self.verification_keys
+        return all(
+            _keys_match(proof.mock_verification_key, verification_keys.get(proof.proof_type))
+            for proof in proofs
+        ) and all(proof.verify() for proof in proofs)
+    
+    def verify_proofs_batch(self, proofs: List[MockZKProof]) -> List[bool]:
+        """
+        Mock verification of many proofs, reporting each result.
+        
+        ⚠️ MOCK IMPLEMENTATION
+        
+        Same checks as verify_proof(), applied to each proof in turn.
+        
+        Args:
+            proofs: List of proofs to verify
+        
+        Returns:
+            Verification result for each proof, in input order
+        """
+        verify_proof = self.verify_proof
+        return [verify_proof(proof) for proof in proofs]
     
     def get_proof_statistics(self) -> dict:
         """Get statistics about generated proofs."""
-        proof_counts = {}
-        for proof_type in ZKProofType:
-            count = sum(1 for p in self.generated_proofs if p.proof_type == proof_type)
-            proof_counts[proof_type.value] = count
-        
+        proofs = self.generated_proofs
+        # One pass over the proofs, rather than one per proof type
+        type_counts = Counter(proof.proof_type for proof in proofs)
         return {
-            "total_proofs": len(self.generated_proofs),
-            "by_type": proof_counts,
-            "all_valid": all(p.is_valid for p in self.generated_proofs),
+            "total_proofs": len(proofs),
+            "by_type": {
+                proof_type.value: type_counts[proof_type] for proof_type in ZKProofType
+            },
+            "all_valid": all(proof.is_valid for proof in proofs),
         }
     
     def export_proofs(self) -> List[dict]:
@@ -0,0 +1,98 @@
+"""
+libp2p network notifee for the MetadataCollector.
+
+Forwards py-libp2p connection and stream events to a MetadataCollector.
+Kept separate from the collector so that feeding it events directly
+does not require importing libp2p.
+"""
+
+from typing import TYPE_CHECKING
+
+from multiaddr import Multiaddr
+from libp2p.abc import INetConn, INetStream, INetwork, INotifee
+
+if TYPE_CHECKING:
+    from libp2p_privacy_poc.metadata_collector import MetadataCollector
+
+
+class PrivacyNotifee(INotifee):
+    """
+    Network notifee implementation to capture privacy-relevant events.
+    
+    This class implements the INotifee interface and forwards events
+    to the MetadataCollector for processing.
+    """
+    
+    def __init__(self, collector: 'MetadataCollector'):
+        """
+        Initialize the notifee.
+        
+        Args:
+            collector: The MetadataCollector instance to forward events to
+        """
+        self.collector = collector
+    
+    async def opened_stream(self, network: INetwork, stream: INetStream) -> None:
+        """Called when a new stream is opened."""
+        peer_id = stream.muxed_conn.peer_id
+        self.collector.on_stream_opened(peer_id)
+    
+    async def closed_stream(self, network: INetwork, stream: INetStream) -> None:
+        """Called when a stream is closed."""
+        # Stream closed event
+        pass
+    
+    async def connected(self, network: INetwork, conn: INetConn) -> None:
+        """Called when a new connection is established."""
+        try:
+            # Get peer_id from muxed connection
+            peer_id = conn.muxed_conn.peer_id
+            
+            # Get multiaddr from the connection itself (or from raw connection)
+            if hasattr(conn, 'multiaddr') and conn.multiaddr:
+                multiaddr = conn.multiaddr
+            elif hasattr(conn, 'raw_conn') and hasattr(conn.raw_conn, 'multiaddr'):
+                multiaddr = conn.raw_conn.multiaddr
+            else:
+                # Fallback: get from transport addresses
+                addrs = conn.get_transport_addresses() if hasattr(conn, 'get_transport_addresses') else []
+                multiaddr = addrs[0] if addrs else None
+            
+            # Determine direction based on whether we initiated the connection
+            direction = "outbound" if hasattr(conn, 'initiator') and conn.initiator else "inbound"
+            
+            self.collector.on_connection_opened(peer_id, multiaddr, direction)
+            print(f"[PrivacyNotifee] Connected: {peer_id} via {multiaddr}")
+        except Exception as e:
+            print(f"[PrivacyNotifee] Error in connected(): {e}")
+            import traceback
+            traceback.print_exc()
+    
+    async def disconnected(self, network: INetwork, conn: INetConn) -> None:
+        """Called when a connection is closed."""
+        try:
+            peer_id = conn.muxed_conn.peer_id if hasattr(conn, 'muxed_conn') and conn.muxed_conn else None
+            
+            # Get multiaddr from the connection itself
+            multiaddr = None
+            if hasattr(conn, 'multiaddr') and conn.multiaddr:
+                multiaddr = conn.multiaddr
+            elif hasattr(conn, 'raw_conn') and hasattr(conn.raw_conn, 'multiaddr'):
+                multiaddr = conn.raw_conn.multiaddr
+            elif hasattr(conn, 'get_transport_addresses'):
+                addrs = conn.get_transport_addresses()
+                multiaddr = addrs[0] if addrs else None
+            
+            if peer_id and multiaddr:
+                self.collector.on_connection_closed(peer_id, multiaddr)
+                print(f"[PrivacyNotifee] Disconnected: {peer_id}")
+        except Exception as e:
+            print(f"[PrivacyNotifee] Error in disconnected(): {e}")
+    
+    async def listen(self, network: INetwork, multiaddr: Multiaddr) -> None:
+        """Called when the node starts listening on a new multiaddr."""
+        pass
+    
+    async def listen_close(self, network: INetwork, multiaddr: Multiaddr) -> None:
+        """Called when the node stops listening on a multiaddr."""
+        pass
@@ -11,15 +11,49 @@ Key analysis capabilities:
 - Privacy risk scoring
 """
 
-import statistics
+import bisect
+import sys
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Set, Tuple
 from collections import defaultdict, Counter
 
+import numpy as np
+
 from libp2p_privacy_poc.metadata_collector import MetadataCollector, ConnectionMetadata, PeerMetadata
 
 
-@dataclass
+# Lower bounds of the MEDIUM, HIGH and CRITICAL bands (inclusive)
+_RISK_BINS = (0.25, 0.5, 0.75)
+_RISK_LABELS = ("LOW", "MEDIUM", "HIGH", "CRITICAL")
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep a __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def risk_bucket(score: float) -> int:
+    """
+    Index of the risk band a score falls into (0=LOW ... 3=CRITICAL).
+    
+    Shared by the risk-level label and the report colors so every
+    threshold lookup is one bisect over _RISK_BINS.
+    """
+    return bisect.bisect_right(_RISK_BINS, score)
+
+
+def _interval_mean_stdev(intervals: np.ndarray) -> Tuple[float, float]:
+    """
+    Mean and sample standard deviation of connection intervals.
+    
+    NumPy equivalent of statistics.mean/stdev, which go through exact
+    Fraction arithmetic and dominate timing analysis on long histories.
+    """
+    mean = float(intervals.mean())
+    if intervals.size < 2:
+        return mean, 0.0
+    return mean, float(intervals.std(ddof=1))
+
+
+@dataclass(**_SLOTS)
 class PrivacyRisk:
     """Represents a detected privacy risk."""
     risk_type: str
@@ -41,7 +75,7 @@ class PrivacyRisk:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PrivacyReport:
     """
     Comprehensive privacy analysis report.
@@ -58,6 +92,10 @@ class PrivacyReport:
         """Get all risks of a specific severity."""
         return [risk for risk in self.risks if risk.severity == severity]
     
+    def get_risks_by_type(self, risk_type: str) -> List[PrivacyRisk]:
+        """Get all risks of a specific type (e.g. "Timing Correlation")."""
+        return [risk for risk in self.risks if risk.risk_type == risk_type]
+    
     def get_critical_risks(self) -> List[PrivacyRisk]:
         """Get all critical risks."""
         return self.get_risks_by_severity("critical")
@@ -111,14 +149,7 @@ class PrivacyReport:
         - MEDIUM: >= 0.25
         - LOW: < 0.25
         """
-        if self.overall_risk_score >= 0.75:
-            return "CRITICAL"
-        elif self.overall_risk_score >= 0.5:
-            return "HIGH"
-        elif self.overall_risk_score >= 0.25:
-            return "MEDIUM"
-        else:
-            return "LOW"
+        return _RISK_LABELS[risk_bucket(self.overall_risk_score)]
     
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
@@ -145,6 +176,11 @@ class PrivacyAnalyzer:
     - Traffic fingerprinting (does traffic pattern leak information?)
     """
     
+    # Analysis thresholds (tunable per instance or subclass)
+    TIMING_CORRELATION_THRESHOLD = 0.7
+    LINKABILITY_THRESHOLD = 0.6
+    MIN_ANONYMITY_SET_SIZE = 10
+    
     def __init__(self, metadata_collector: MetadataCollector):
         """
         Initialize the privacy analyzer.
@@ -153,11 +189,22 @@ class PrivacyAnalyzer:
             metadata_collector: MetadataCollector instance with collected data
         """
         self.collector = metadata_collector
+    
+    @classmethod
+    def analyze_collector(cls, metadata_collector: MetadataCollector) -> PrivacyReport:
+        """
+        Analyze a collector in one call.
         
-        # Analysis thresholds (tunable)
-        self.TIMING_CORRELATION_THRESHOLD = 0.7
-        self.LINKABILITY_THRESHOLD = 0.6
-        self.MIN_ANONYMITY_SET_SIZE = 10
+        Convenience for callers that only want the report and never touch
+        the analyzer itself.
+        
+        Args:
+            metadata_collector: MetadataCollector instance with collected data
+            
+        Returns:
+            PrivacyReport with detected risks and recommendations
+        """
+        return cls(metadata_collector).analyze()
         
     def analyze(self) -> PrivacyReport:
         """
@@ -176,9 +223,13 @@ class PrivacyAnalyzer:
         # Collect statistics
         report.statistics = self.collector.get_statistics()
         
+        # Inter-connection intervals and their moments feed both timing passes
+        intervals = self._connection_intervals()
+        interval_stats = _interval_mean_stdev(intervals) if intervals.size else None
+        
         # Run all analysis modules
         report.risks.extend(self._analyze_peer_linkability())
-        report.risks.extend(self._analyze_timing_correlations())
+        report.risks.extend(self._analyze_timing_correlations(intervals, interval_stats))
         report.risks.extend(self._analyze_session_unlinkability())
         report.risks.extend(self._analyze_anonymity_set())
         report.risks.extend(self._analyze_protocol_fingerprinting())
@@ -188,7 +239,7 @@ class PrivacyAnalyzer:
         report.peer_analysis = self._analyze_peers()
         
         # Perform timing analysis
-        report.timing_analysis = self._analyze_timing_patterns()
+        report.timing_analysis = self._analyze_timing_patterns(intervals, interval_stats)
         
         # Calculate overall risk score
         report.overall_risk_score = self._calculate_overall_risk(report.risks)
@@ -251,7 +302,15 @@ class PrivacyAnalyzer:
         
         return risks
     
-    def _analyze_timing_correlations(self) -> List[PrivacyRisk]:
+    def _connection_intervals(self) -> np.ndarray:
+        """Time between consecutive connections, in seconds."""
+        return np.diff(np.asarray(self.collector.connection_times, dtype=np.float64))
+    
+    def _analyze_timing_correlations(
+        self,
+        intervals: Optional[np.ndarray] = None,
+        interval_stats: Optional[Tuple[float, float]] = None,
+    ) -> List[PrivacyRisk]:
         """
         Detect timing-based privacy leaks.
         
@@ -266,18 +325,17 @@ class PrivacyAnalyzer:
             return risks
         
         # Calculate inter-connection intervals
-        intervals = []
-        for i in range(1, len(self.collector.connection_times)):
-            interval = self.collector.connection_times[i] - self.collector.connection_times[i-1]
-            intervals.append(interval)
+        if intervals is None:
+            intervals = self._connection_intervals()
         
-        if not intervals:
+        if not intervals.size:
             return risks
         
         # Check for regular patterns (low variance = predictable)
-        mean_interval = statistics.mean(intervals)
-        if len(intervals) > 1:
-            stdev_interval = statistics.stdev(intervals)
+        if interval_stats is None:
+            interval_stats = _interval_mean_stdev(intervals)
+        mean_interval, stdev_interval = interval_stats
+        if intervals.size > 1:
             coefficient_of_variation = stdev_interval / mean_interval if mean_interval > 0 else 0
             
             if coefficient_of_variation < 0.3:  # Low variation = regular pattern
@@ -294,12 +352,12 @@ class PrivacyAnalyzer:
                 ))
         
         # Check for very short intervals (burst pattern)
-        short_intervals = [i for i in intervals if i < 1.0]  # Less than 1 second
-        if len(short_intervals) > len(intervals) * 0.3:
+        short_count = int(np.count_nonzero(intervals < 1.0))  # Less than 1 second
+        if short_count > intervals.size * 0.3:
             risks.append(PrivacyRisk(
                 risk_type="Timing Correlation",
                 severity="low",
-                description=f"Burst connection pattern detected ({len(short_intervals)} rapid connections)",
+                description=f"Burst connection pattern detected ({short_count} rapid connections)",
                 confidence=0.65,
                 recommendations=[
                     "Space out connection attempts",
@@ -469,26 +527,31 @@ class PrivacyAnalyzer:
         
         return min(score, 1.0)
     
-    def _analyze_timing_patterns(self) -> dict:
+    def _analyze_timing_patterns(
+        self,
+        intervals: Optional[np.ndarray] = None,
+        interval_stats: Optional[Tuple[float, float]] = None,
+    ) -> dict:
         """Analyze timing patterns in connections."""
         if len(self.collector.connection_times) < 2:
             return {}
         
-        intervals = []
-        for i in range(1, len(self.collector.connection_times)):
-            interval = self.collector.connection_times[i] - self.collector.connection_times[i-1]
-            intervals.append(interval)
+        if intervals is None:
+            intervals = self._connection_intervals()
         
-        if not intervals:
+        if not intervals.size:
             return {}
         
+        if interval_stats is None:
+            interval_stats = _interval_mean_stdev(intervals)
+        mean_interval, stdev_interval = interval_stats
         return {
-            "mean_interval": statistics.mean(intervals),
-            "median_interval": statistics.median(intervals),
-            "stdev_interval": statistics.stdev(intervals) if len(intervals) > 1 else 0,
-            "min_interval": min(intervals),
-            "max_interval": max(intervals),
-            "total_intervals": len(intervals),
+            "mean_interval": mean_interval,
+            "median_interval": float(np.median(intervals)),
+            "stdev_interval": stdev_interval if intervals.size > 1 else 0,
+            "min_interval": float(intervals.min()),
+            "max_interval": float(intervals.max()),
+            "total_intervals": int(intervals.size),
         }
     
     def _calculate_overall_risk(self, risks: List[PrivacyRisk]) -> float:
@@ -112,6 +112,7 @@ PROOF_VERSION = 1  # Increment for breaking changes
 MAX_PROOF_SIZE_BYTES = 10 * 1024  # 10KB per proof
 MAX_PROOFS_IN_MEMORY = 10_000
 MAX_PROOF_BATCH_SIZE = 100
+BATCH_VERIFY_TILE = 64  # Proofs per multi-scalar multiplication in batch_verify
 
 # Performance targets (achievable ranges)
 TARGET_COMMIT_TIME_MS = (3, 7)  # 3-7ms range
@@ -27,8 +27,16 @@ Interfaces:
 - ZKProofBackend: Composed interface for full ZK systems
 """
 
+import sys
 from abc import ABC, abstractmethod
-from typing import Protocol, runtime_checkable, Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Sequence, Set
+
+if sys.version_info >= (3, 12):
+    from typing import Protocol, runtime_checkable
+else:
+    # Backport of the 3.12 protocol metaclass with cached member lookups
+    from typing_extensions import Protocol, runtime_checkable
+
 from .types import ZKProof, ProofContext
 
 
@@ -159,6 +167,38 @@ class ProofBackend(ABC):
         """
         pass
 
+    def verify_proofs(
+        self,
+        proofs: Sequence[ZKProof],
+        public_inputs: Optional[Sequence[Dict[str, Any]]] = None,
+    ) -> List[bool]:
+        """
+        Verify several proofs, reporting one result per proof.
+
+        The default calls verify_proof() for each proof in turn; backends
+        with a batched verifier override this to share work across the
+        batch.
+
+        Args:
+            proofs: Proofs to verify
+            public_inputs: Public inputs for each proof, aligned with
+                proofs (None passes an empty dict to every proof)
+
+        Returns:
+            list[bool]: Verification result for each proof, in order
+
+        Raises:
+            ValueError: If public_inputs and proofs differ in length
+        """
+        if public_inputs is None:
+            return [self.verify_proof(proof, {}) for proof in proofs]
+        if len(public_inputs) != len(proofs):
+            raise ValueError("public_inputs must have one entry per proof")
+        return [
+            self.verify_proof(proof, inputs)
+            for proof, inputs in zip(proofs, public_inputs)
+        ]
+
     @abstractmethod
     def get_backend_info(self) -> Dict[str, Any]:
         """
@@ -553,6 +593,47 @@ class ZKProofBackend(ProofBackend):
 # TYPE HELPERS
 # ============================================================================
 
+# Required members of each runtime-checkable protocol, fixed at import so
+# the helpers below do not rebuild them on every call the way
+# isinstance(obj, SomeProtocol) does
+_COMMITMENT_SCHEME_ATTRS = ("commit", "verify_commitment")
+_PROOF_GENERATOR_ATTRS = ("generate",)
+_PROOF_VERIFIER_ATTRS = ("verify",)
+
+# Concrete classes declared to implement each protocol; instances of these
+# exact types are accepted with a single set lookup
+_COMMITMENT_SCHEMES: Set[type] = set()
+_PROOF_GENERATORS: Set[type] = set()
+_PROOF_VERIFIERS: Set[type] = set()
+
+
+def register_commitment_scheme(cls: type) -> type:
+    """Class decorator declaring that cls implements CommitmentScheme."""
+    _COMMITMENT_SCHEMES.add(cls)
+    return cls
+
+
+def register_proof_generator(cls: type) -> type:
+    """Class decorator declaring that cls implements ProofGenerator."""
+    _PROOF_GENERATORS.add(cls)
+    return cls
+
+
+def register_proof_verifier(cls: type) -> type:
+    """Class decorator declaring that cls implements ProofVerifier."""
+    _PROOF_VERIFIERS.add(cls)
+    return cls
+
+
+def _implements(
+    obj: Any, protocol: type, registered: Set[type], attrs: tuple
+) -> bool:
+    """Structural protocol check with registered and nominal fast paths."""
+    if type(obj) in registered or type.__instancecheck__(protocol, obj):
+        return True
+    # Same rule as runtime_checkable: every member present, methods not None
+    return all(getattr(obj, attr, None) is not None for attr in attrs)
+
 
 def is_proof_backend(obj: Any) -> bool:
     """
@@ -577,7 +658,9 @@ def is_commitment_scheme(obj: Any) -> bool:
     Returns:
         bool: True if obj implements CommitmentScheme
     """
-    return isinstance(obj, CommitmentScheme)
+    return _implements(
+        obj, CommitmentScheme, _COMMITMENT_SCHEMES, _COMMITMENT_SCHEME_ATTRS
+    )
 
 
 def is_proof_generator(obj: Any) -> bool:
@@ -590,7 +673,9 @@ def is_proof_generator(obj: Any) -> bool:
     Returns:
         bool: True if obj implements ProofGenerator
     """
-    return isinstance(obj, ProofGenerator)
+    return _implements(
+        obj, ProofGenerator, _PROOF_GENERATORS, _PROOF_GENERATOR_ATTRS
+    )
 
 
 def is_proof_verifier(obj: Any) -> bool:
@@ -603,4 +688,6 @@ def is_proof_verifier(obj: Any) -> bool:
     Returns:
         bool: True if obj implements ProofVerifier
     """
-    return isinstance(obj, ProofVerifier)
+    return _implements(
+        obj, ProofVerifier, _PROOF_VERIFIERS, _PROOF_VERIFIER_ATTRS
+    )
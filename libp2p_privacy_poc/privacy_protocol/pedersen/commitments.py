@@ -31,6 +31,8 @@ Implementation Details:
 
 from typing import Tuple, Optional, Any
 from dataclasses import dataclass
+from functools import cached_property
+import hashlib
 import threading
 
 try:
@@ -42,6 +44,14 @@ except ImportError:
         "Install with: pip install petlib"
     )
 
+# Optional: libsecp256k1 bindings for fast secp256k1 scalar multiplication
+try:
+    from coincurve import PublicKey as _SecpPublicKey
+    _HAS_COINCURVE = True
+except ImportError:
+    _SecpPublicKey = None
+    _HAS_COINCURVE = False
+
 from ..security import RandomnessSource, constant_time_compare
 from ..exceptions import CryptographicError, SecurityError
 from ..config import (
@@ -132,6 +142,73 @@ class CurveParameters:
         """Alias for the configured curve name."""
         return self.curve
 
+    @cached_property
+    def challenge_prefix(self) -> "hashlib._Hash":
+        """
+        SHA-256 state that has absorbed len(G) || G || len(H) || H.
+
+        Every Fiat-Shamir challenge over these generators starts with the
+        same prefix; copy() this state instead of re-hashing it per proof.
+        """
+        return generator_transcript(self.G, self.H)
+
+    @cached_property
+    def _secp_H(self) -> Any:
+        """H as a coincurve PublicKey, or None if the fast path is unavailable."""
+        if not _HAS_COINCURVE or self.curve != "secp256k1":
+            return None
+        return _SecpPublicKey(self.H.export())
+
+    def combine_generators(self, a: int, b: int) -> bytes:
+        """
+        Compute a*G + b*H and return its compressed encoding.
+
+        Uses libsecp256k1 (via coincurve, constant-time for secret scalars)
+        when available on secp256k1; otherwise, or when a scalar is zero or
+        the sum is the identity, falls back to petlib.
+
+        Args:
+            a: Scalar for G, in [0, order)
+            b: Scalar for H, in [0, order)
+
+        Returns:
+            bytes: Compressed point encoding
+        """
+        a_bytes = a.to_bytes(32, byteorder='big')
+        b_bytes = b.to_bytes(32, byteorder='big')
+
+        secp_H = self._secp_H
+        if secp_H is not None and a and b:
+            try:
+                return _SecpPublicKey.combine_keys([
+                    _SecpPublicKey.from_secret(a_bytes),
+                    secp_H.multiply(b_bytes),
+                ]).format(compressed=True)
+            except ValueError:
+                # Sum is the point at infinity; let petlib encode it
+                pass
+
+        point = Bn.from_binary(a_bytes) * self.G + Bn.from_binary(b_bytes) * self.H
+        return point.export()
+
+
+def generator_transcript(G: Any, H: Any) -> "hashlib._Hash":
+    """
+    Start a SHA-256 transcript with the length-prefixed generators.
+
+    Args:
+        G: Generator point G (EcPt)
+        H: Generator point H (EcPt)
+
+    Returns:
+        SHA-256 state over len(G) || G || len(H) || H (compressed encodings)
+    """
+    h = hashlib.sha256()
+    for point_bytes in (G.export(), H.export()):
+        h.update(len(point_bytes).to_bytes(4, 'big'))
+        h.update(point_bytes)
+    return h
+
 
 def setup_curve(
     curve_name: Optional[str] = None, library: Optional[str] = None
@@ -364,25 +441,9 @@ def commit(
             )
 
     try:
-        # Get group order as Bn for modular operations
-        order_bn = params.group.order()
-
-        # Convert Python int to petlib Bn using byte representation
-        # This is the most reliable method for all values in [0, GROUP_ORDER)
-        # secp256k1 scalars are 32 bytes (256 bits)
-        value_bytes = value.to_bytes(32, byteorder='big')
-        value_bn = Bn.from_binary(value_bytes)
-
-        blinding_bytes = blinding.to_bytes(32, byteorder='big')
-        blinding_bn = Bn.from_binary(blinding_bytes)
-
         # Compute Pedersen commitment: C = value*G + blinding*H
-        # petlib uses efficient elliptic curve scalar multiplication
-        commitment_point = value_bn * params.G + blinding_bn * params.H
-
-        # Export commitment to bytes (compressed format)
         # Compressed format is 33 bytes: 1 byte prefix + 32 bytes x-coord
-        commitment_bytes = commitment_point.export()
+        commitment_bytes = params.combine_generators(value, blinding)
 
         # Validate output size
         if len(commitment_bytes) != POINT_SIZE_BYTES:
@@ -392,7 +453,7 @@ def commit(
             )
 
         # Return commitment and blinding as Python int
-        return commitment_bytes, int(blinding_bn)
+        return commitment_bytes, blinding
 
     except Exception as e:
         if isinstance(e, ValueError):
@@ -501,15 +562,9 @@ def verify_commitment(
         value_mod = value % int(order_bn)
         blinding_mod = blinding % int(order_bn)
 
-        value_bytes = value_mod.to_bytes(32, byteorder='big')
-        value_bn = Bn.from_binary(value_bytes)
-
-        blinding_bytes = blinding_mod.to_bytes(32, byteorder='big')
-        blinding_bn = Bn.from_binary(blinding_bytes)
-
         # Recompute expected commitment
         # C_expected = value * G + blinding * H
-        expected_point = value_bn * params.G + blinding_bn * params.H
+        expected_bytes = params.combine_generators(value_mod, blinding_mod)
 
         # Import commitment from bytes
         # This may raise if commitment_bytes is invalid
@@ -538,7 +593,6 @@ def verify_commitment(
         # Export both points to normalized byte representation
         # Then use constant-time byte comparison via hmac.compare_digest
         commitment_bytes_normalized = commitment_point.export()
-        expected_bytes = expected_point.export()
 
         # Constant-time comparison (prevents timing side-channel attacks)
         result = constant_time_compare(
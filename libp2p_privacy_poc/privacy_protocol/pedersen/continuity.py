@@ -15,7 +15,7 @@ from petlib.bn import Bn
 
 from ..types import ZKProof, ZKProofType
 from ..statements import StatementType
-from ..security import RandomnessSource
+from ..security import RandomnessSource, constant_time_compare
 from .commitments import get_cached_curve_params
 
 # Secp256k1 group (match existing params)
@@ -35,6 +35,9 @@ def _to_bn(value: Bn | int) -> Bn:
     if isinstance(value, Bn):
         return value
     if isinstance(value, int):
+        if value >= 0:
+            # Binary import avoids a decimal string round-trip
+            return Bn.from_binary(value.to_bytes((value.bit_length() + 7) // 8, "big"))
         return Bn.from_decimal(str(value))
     raise TypeError(f"Expected Bn or int, got {type(value)}")
 
@@ -227,16 +230,16 @@ def verify_continuity_proof(proof: ZKProof) -> bool:
         z_1 = Bn.from_binary(response_combined[32:64])
         z_2 = Bn.from_binary(response_combined[64:96])
 
+        # Both equations are checked as z_id*G + z_i*H + (-c)*C_i == A_i, each
+        # one multi-scalar multiplication (all scalars are public here)
+        neg_c = (-c) % order
+
         # Step 5: Verify first equation
-        left_1 = (z_id * g) + (z_1 * h)
-        right_1 = A1 + (c * C1)
-        if left_1 != right_1:
+        if group.wsum([z_id, z_1, neg_c], [g, h, C1]) != A1:
             return False
 
         # Step 6: Verify second equation
-        left_2 = (z_id * g) + (z_2 * h)
-        right_2 = A2 + (c * C2)
-        if left_2 != right_2:
+        if group.wsum([z_id, z_2, neg_c], [g, h, C2]) != A2:
             return False
 
         # Step 7: Verify challenge binding
@@ -251,7 +254,8 @@ def verify_continuity_proof(proof: ZKProof) -> bool:
         expected_challenge_hash = hashlib.sha256(challenge_input).digest()
         expected_c = Bn.from_binary(expected_challenge_hash) % order
 
-        if c != expected_c:
+        # Constant-time comparison against the canonical 32-byte encoding
+        if not constant_time_compare(proof.challenge, _bn_to_fixed_bytes(expected_c)):
             return False
 
         return True
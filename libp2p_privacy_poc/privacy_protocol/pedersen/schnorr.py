@@ -44,7 +44,7 @@ Implementation Details:
     - Proof size: ~129 bytes (A: 33, c: 32, z_v: 32, z_b: 32)
 """
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 import hashlib
 
 try:
@@ -56,7 +56,7 @@ except ImportError:
         "Install with: pip install petlib"
     )
 
-from .commitments import CurveParameters, setup_curve
+from .commitments import CurveParameters, generator_transcript, setup_curve
 from ..security import RandomnessSource, constant_time_compare
 from ..config import GROUP_ORDER, POINT_SIZE_BYTES
 from ..exceptions import ProofGenerationError, ProofVerificationError
@@ -207,15 +207,9 @@ def generate_schnorr_pok(
         # Compute Announcement A = r_v*G + r_b*H
         # ====================================================================
         
-        # Convert nonces to petlib Bn for elliptic curve operations
-        r_v_bn = Bn.from_decimal(str(r_v))
-        r_b_bn = Bn.from_decimal(str(r_b))
-        
-        # Compute announcement: A = r_v*G + r_b*H
-        A = r_v_bn * params.G + r_b_bn * params.H
-        
-        # Serialize announcement to bytes (compressed point format)
-        A_bytes = A.export()
+        # Compute announcement A = r_v*G + r_b*H, serialized to bytes
+        # (compressed point format)
+        A_bytes = params.combine_generators(r_v, r_b)
         
         # Validate announcement size
         if len(A_bytes) != POINT_SIZE_BYTES:
@@ -233,7 +227,8 @@ def generate_schnorr_pok(
             params.H,
             commitment,
             A_bytes,
-            context
+            context,
+            prefix=params.challenge_prefix
         )
         
         # Convert challenge to scalar modulo GROUP_ORDER
@@ -426,13 +421,6 @@ def verify_schnorr_pok(
         # Extract challenge
         c_bytes = proof['c']
         
-        # Convert challenge to scalar (with modular reduction for safety)
-        c = int.from_bytes(c_bytes, 'big') % GROUP_ORDER
-        
-        # Extract responses
-        z_v = int.from_bytes(proof['z_v'], 'big') % GROUP_ORDER
-        z_b = int.from_bytes(proof['z_b'], 'big') % GROUP_ORDER
-        
         # ====================================================================
         # Recompute Challenge c' = Hash(G, H, C, A, context) mod q
         # ====================================================================
@@ -443,7 +431,8 @@ def verify_schnorr_pok(
             params.H,
             commitment,
             proof['A'],
-            context
+            context,
+            prefix=params.challenge_prefix
         )
         
         # ====================================================================
@@ -470,20 +459,21 @@ def verify_schnorr_pok(
         if C is None or not params.group.check_point(C):
             return False
         
-        # Convert scalars to petlib Bn for elliptic curve operations
-        z_v_bn = Bn.from_decimal(str(z_v))
-        z_b_bn = Bn.from_decimal(str(z_b))
-        c_bn = Bn.from_decimal(str(c))
-        
-        # Left side: z_v*G + z_b*H
-        left_side = z_v_bn * params.G + z_b_bn * params.H
+        # Decode scalars straight into petlib Bn (with modular reduction
+        # for safety), skipping a Python int round-trip per scalar
+        order = params.group.order()
+        z_v_bn = Bn.from_binary(proof['z_v']) % order
+        z_b_bn = Bn.from_binary(proof['z_b']) % order
+        neg_c_bn = (-Bn.from_binary(c_bytes)) % order
         
-        # Right side: A + c*C
-        right_side = A + c_bn * C
+        # z_v*G + z_b*H = A + c*C  <=>  z_v*G + z_b*H + (-c)*C = A
+        # Evaluated as one multi-scalar multiplication (EC_POINTs_mul)
+        # instead of three separate point multiplications
+        combined = params.group.wsum([z_v_bn, z_b_bn, neg_c_bn], [params.G, params.H, C])
         
         # Verify equation holds
         # Note: EcPt equality in petlib uses point comparison
-        if left_side != right_side:
+        if combined != A:
             return False
         
         # ====================================================================
@@ -498,6 +488,141 @@ def verify_schnorr_pok(
         return False
 
 
+# Bits in each random batch-verification weight (soundness error 2^-128)
+BATCH_WEIGHT_BYTES = 16
+
+
+def _scalar_to_bn(value: int) -> Bn:
+    """Convert a scalar already reduced mod GROUP_ORDER to a petlib Bn."""
+    return Bn.from_binary(value.to_bytes(32, 'big'))
+
+
+def batch_verify_schnorr_pok(
+    items: List[Tuple[bytes, Dict[str, bytes], bytes]],
+    params: Optional[CurveParameters] = None,
+    randomness_source: Optional[RandomnessSource] = None
+) -> bool:
+    """
+    Verify many Schnorr proofs of knowledge with one multi-scalar multiplication.
+    
+    ⚠️ SECURITY CRITICAL
+    
+    Each item is (commitment, proof, context) exactly as passed to
+    verify_schnorr_pok(). Challenges are still recomputed and compared
+    (constant-time) per proof; the verification equations are combined
+    with fresh random 128-bit weights r_i:
+    
+        Σ r_i*z_v,i * G + Σ r_i*z_b,i * H - Σ r_i*c_i * C_i - Σ r_i * A_i = O
+    
+    A batch containing any invalid proof passes with probability at most
+    2^-128. The result says whether ALL proofs are valid, not which failed.
+    
+    Args:
+        items: (commitment, proof dict with 'A', 'c', 'z_v', 'z_b', context)
+        params: Curve parameters (initialized if None)
+        randomness_source: Source of the batch weights (created if None)
+    
+    Returns:
+        True if every proof is valid, False otherwise (including malformed
+        input; unlike verify_schnorr_pok this never raises ValueError)
+    """
+    if not items:
+        return True
+    
+    if params is None:
+        params = setup_curve()
+    
+    if randomness_source is None:
+        randomness_source = RandomnessSource()
+    
+    try:
+        group = params.group
+        check_point = group.check_point
+        G, H, prefix = params.G, params.H, params.challenge_prefix
+        
+        # Pass 1: validate and decode every proof into parallel columns
+        points_C: List[EcPt] = []
+        points_A: List[EcPt] = []
+        challenges: List[int] = []
+        responses_v: List[int] = []
+        responses_b: List[int] = []
+        
+        for commitment, proof, context in items:
+            if not isinstance(commitment, bytes) or not isinstance(context, bytes):
+                return False
+            A_bytes = proof['A']
+            c_bytes = proof['c']
+            z_v_bytes = proof['z_v']
+            z_b_bytes = proof['z_b']
+            if (
+                len(commitment) != POINT_SIZE_BYTES
+                or len(A_bytes) != POINT_SIZE_BYTES
+                or len(c_bytes) != 32
+                or len(z_v_bytes) != 32
+                or len(z_b_bytes) != 32
+            ):
+                return False
+            
+            # Per-proof Fiat-Shamir check (CONSTANT-TIME)
+            expected_challenge_bytes = _compute_challenge(
+                G, H, commitment, A_bytes, context, prefix=prefix
+            )
+            if not constant_time_compare(c_bytes, expected_challenge_bytes):
+                return False
+            
+            A = EcPt.from_binary(A_bytes, group)
+            C = EcPt.from_binary(commitment, group)
+            if A is None or C is None:
+                return False
+            if not check_point(A) or not check_point(C):
+                return False
+            
+            points_C.append(C)
+            points_A.append(A)
+            challenges.append(int.from_bytes(c_bytes, 'big') % GROUP_ORDER)
+            responses_v.append(int.from_bytes(z_v_bytes, 'big') % GROUP_ORDER)
+            responses_b.append(int.from_bytes(z_b_bytes, 'big') % GROUP_ORDER)
+        
+        # Pass 2: one random draw for all weights, then build the MSM
+        weight_bytes = randomness_source.get_random_bytes(
+            BATCH_WEIGHT_BYTES * len(points_C)
+        )
+        g_scalar = 0
+        h_scalar = 0
+        weights: List[Bn] = []
+        points: List[EcPt] = []
+        
+        for i, (C, A, c, z_v, z_b) in enumerate(
+            zip(points_C, points_A, challenges, responses_v, responses_b)
+        ):
+            # Non-zero random weight for this proof's equation
+            offset = i * BATCH_WEIGHT_BYTES
+            r = int.from_bytes(weight_bytes[offset:offset + BATCH_WEIGHT_BYTES], 'big')
+            while r == 0:
+                r = int.from_bytes(
+                    randomness_source.get_random_bytes(BATCH_WEIGHT_BYTES), 'big'
+                )
+            
+            g_scalar += r * z_v
+            h_scalar += r * z_b
+            weights.append(_scalar_to_bn((-r * c) % GROUP_ORDER))
+            points.append(C)
+            weights.append(_scalar_to_bn((-r) % GROUP_ORDER))
+            points.append(A)
+        
+        # Fixed bases G and H appear once, with aggregated scalars
+        weights.append(_scalar_to_bn(g_scalar % GROUP_ORDER))
+        points.append(G)
+        weights.append(_scalar_to_bn(h_scalar % GROUP_ORDER))
+        points.append(H)
+        
+        return group.wsum(weights, points).is_infinite()
+    
+    except Exception:
+        # Any decoding or arithmetic failure means the batch is invalid
+        return False
+
+
 # ============================================================================
 # CHALLENGE COMPUTATION (Fiat-Shamir Transform)
 # ============================================================================
@@ -508,7 +633,8 @@ def _compute_challenge(
     H: EcPt,
     commitment: bytes,
     announcement: bytes,
-    context: bytes
+    context: bytes,
+    prefix: Optional["hashlib._Hash"] = None
 ) -> bytes:
     """
     Compute Fiat-Shamir challenge via SHA-256 with length-prefixed encoding.
@@ -540,6 +666,8 @@ def _compute_challenge(
         commitment: Commitment bytes (33 bytes)
         announcement: Announcement point bytes (33 bytes)
         context: Additional context bytes
+        prefix: Optional SHA-256 state that has already absorbed G and H
+            (CurveParameters.challenge_prefix); computed from G and H if None
     
     Returns:
         32-byte challenge (caller converts to scalar mod GROUP_ORDER)
@@ -558,25 +686,16 @@ def _compute_challenge(
         - Deterministic (same inputs → same challenge)
         - Binds challenge to all protocol parameters
     """
-    # Initialize SHA-256 hash
-    h = hashlib.sha256()
-    
-    # Export generators to bytes (compressed point format)
-    G_bytes = G.export()
-    H_bytes = H.export()
+    # Hash generators G and H with length prefixes, reusing the cached
+    # state from CurveParameters when the caller provides it
+    if prefix is None:
+        prefix = generator_transcript(G, H)
+    h = prefix.copy()
     
     # ========================================================================
     # Length-Prefixed Concatenation (CRITICAL for security)
     # ========================================================================
     
-    # Hash generator G with length prefix
-    h.update(len(G_bytes).to_bytes(4, 'big'))
-    h.update(G_bytes)
-    
-    # Hash generator H with length prefix
-    h.update(len(H_bytes).to_bytes(4, 'big'))
-    h.update(H_bytes)
-    
     # Hash commitment with length prefix
     h.update(len(commitment).to_bytes(4, 'big'))
     h.update(commitment)
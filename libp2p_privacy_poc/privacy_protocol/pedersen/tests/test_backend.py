@@ -4,7 +4,6 @@ WARNING: DRAFT - requires cryptographic review before production use.
 Test suite for PedersenBackend commitment opening proofs.
 """
 
-import copy
 import hashlib
 
 import pytest
@@ -24,13 +23,14 @@ from ...types import ProofContext, ZKProof, ZKProofType
 SCALAR_BYTES = get_cached_curve_params().scalar_bytes
 RESPONSE_BYTES = 2 * SCALAR_BYTES
 
+_LONG_PEER_ID = "A" * 10_240
+_NO_LEAK_PEER_ID = "peer-" + ("x" * 80)
+
 
 def _tamper_bytes(data: bytes) -> bytes:
     if not data:
         return data
-    tampered = bytearray(data)
-    tampered[0] ^= 0x01
-    return bytes(tampered)
+    return bytes((data[0] ^ 0x01,)) + data[1:]
 
 
 # ============================================================================
@@ -120,7 +120,7 @@ def test_peer_id_with_special_characters(backend):
 
 
 def test_very_long_peer_id(backend):
-    ctx = ProofContext(peer_id="A" * 10_240, session_id="session_long")
+    ctx = ProofContext(peer_id=_LONG_PEER_ID, session_id="session_long")
     proof = backend.generate_commitment_opening_proof(ctx)
     assert backend.verify_proof(proof) is True
 
@@ -161,49 +161,75 @@ def test_wrong_proof_type_in_verification(backend, ctx):
 
 def test_tampered_commitment_in_verification(backend, ctx):
     proof = backend.generate_commitment_opening_proof(ctx)
-    tampered = copy.deepcopy(proof)
+    tampered = proof.clone()
     tampered.commitment = _tamper_bytes(proof.commitment)
     assert backend.verify_proof(tampered) is False
 
 
 def test_tampered_challenge_in_verification(backend, ctx):
     proof = backend.generate_commitment_opening_proof(ctx)
-    tampered = copy.deepcopy(proof)
+    tampered = proof.clone()
     tampered.challenge = _tamper_bytes(proof.challenge)
     assert backend.verify_proof(tampered) is False
 
 
 def test_tampered_response_in_verification(backend, ctx):
     proof = backend.generate_commitment_opening_proof(ctx)
-    tampered = copy.deepcopy(proof)
+    tampered = proof.clone()
     tampered.response = _tamper_bytes(proof.response)
     assert backend.verify_proof(tampered) is False
 
 
+def test_shifted_field_boundaries_are_rejected_after_valid_proof(backend, ctx):
+    proof = backend.generate_commitment_opening_proof(ctx)
+    assert backend.verify_proof(proof) is True
+
+    # Move one byte across every field boundary after A, so the fields
+    # still concatenate to the same bytes as the valid proof
+    A_field = proof.public_inputs["A"]
+    A_bytes = bytes.fromhex(A_field) if isinstance(A_field, str) else bytes(A_field)
+    ctx_hash = bytes(proof.public_inputs["ctx_hash"])
+    tail = bytes(proof.challenge) + bytes(proof.response) + ctx_hash
+    forged_A = A_bytes + tail[:1]
+    tail = tail[1:]
+
+    forged = proof.clone()
+    forged.challenge = tail[:SCALAR_BYTES]
+    forged.response = tail[SCALAR_BYTES:SCALAR_BYTES + RESPONSE_BYTES]
+    forged.public_inputs = dict(
+        proof.public_inputs,
+        A=forged_A.hex() if isinstance(A_field, str) else forged_A,
+        ctx_hash=tail[SCALAR_BYTES + RESPONSE_BYTES:],
+    )
+
+    assert backend.verify_proof(forged) is False
+    assert backend.verify_proof(proof) is True
+
+
 def test_missing_ctx_hash_in_public_inputs(backend, ctx):
     proof = backend.generate_commitment_opening_proof(ctx)
-    tampered = copy.deepcopy(proof)
+    tampered = proof.clone()
     tampered.public_inputs = {"v": 1, "A": proof.public_inputs["A"]}
     assert backend.verify_proof(tampered) is False
 
 
 def test_invalid_commitment_size(backend, ctx):
     proof = backend.generate_commitment_opening_proof(ctx)
-    tampered = copy.deepcopy(proof)
+    tampered = proof.clone()
     tampered.commitment = b"\x00" * (POINT_SIZE_BYTES - 1)
     assert backend.verify_proof(tampered) is False
 
 
 def test_invalid_challenge_size(backend, ctx):
     proof = backend.generate_commitment_opening_proof(ctx)
-    tampered = copy.deepcopy(proof)
+    tampered = proof.clone()
     tampered.challenge = b"\x00" * (SCALAR_BYTES - 1)
     assert backend.verify_proof(tampered) is False
 
 
 def test_invalid_response_size(backend, ctx):
     proof = backend.generate_commitment_opening_proof(ctx)
-    tampered = copy.deepcopy(proof)
+    tampered = proof.clone()
     tampered.response = b"\x00" * (RESPONSE_BYTES - 1)
     assert backend.verify_proof(tampered) is False
 
@@ -227,7 +253,7 @@ def test_commitment_value_changes_across_peer_ids(backend):
 
 def test_replay_across_session_id_fails(backend, ctx):
     proof = backend.generate_commitment_opening_proof(ctx)
-    tampered = copy.deepcopy(proof)
+    tampered = proof.clone()
     other_ctx = ProofContext(
         peer_id=ctx.peer_id,
         session_id="session_other",
@@ -242,7 +268,7 @@ def test_replay_across_session_id_fails(backend, ctx):
 
 def test_tampered_context_fails_verification(backend, ctx):
     proof = backend.generate_commitment_opening_proof(ctx)
-    tampered = copy.deepcopy(proof)
+    tampered = proof.clone()
     tampered.public_inputs["ctx_hash"] = _tamper_bytes(
         proof.public_inputs["ctx_hash"]
     )
@@ -260,13 +286,31 @@ def test_public_inputs_statement_only(backend, ctx):
 
 
 def test_serialized_proof_does_not_contain_raw_peer_id(backend):
-    peer_id = "peer-" + ("x" * 80)
+    peer_id = _NO_LEAK_PEER_ID
     ctx = ProofContext(peer_id=peer_id, session_id="session_no_leak")
     proof = backend.generate_commitment_opening_proof(ctx)
     serialized = proof.serialize()
     assert peer_id.encode("utf-8") not in serialized
 
 
+def test_compact_serialization_roundtrip(backend, ctx):
+    proof = backend.generate_commitment_opening_proof(ctx)
+    frame = proof.serialize_compact()
+    assert len(frame) < len(proof.serialize())
+    restored = ZKProof.deserialize_compact(frame)
+    assert restored == proof
+    assert backend.verify_proof(restored) is True
+
+
+def test_compact_serialization_rejects_other_layouts(backend, ctx):
+    proof = backend.generate_commitment_opening_proof(ctx)
+    proof.public_inputs["extra"] = 1
+    with pytest.raises(ValueError):
+        proof.serialize_compact()
+    with pytest.raises(ValueError):
+        ZKProof.deserialize_compact(b"\x01" * 10)
+
+
 def test_commitment_hiding_different_peer_ids(backend):
     ctx_a = ProofContext(peer_id="QmHideA", session_id="session_hide")
     ctx_b = ProofContext(peer_id="QmHideB", session_id="session_hide")
@@ -297,11 +341,35 @@ def test_batch_verify_single_proof(backend, ctx):
 
 def test_batch_verify_one_invalid_proof_fails(backend, ctx):
     proof = backend.generate_commitment_opening_proof(ctx)
-    tampered = copy.deepcopy(proof)
+    tampered = proof.clone()
     tampered.challenge = _tamper_bytes(proof.challenge)
     assert backend.batch_verify([proof, tampered]) is False
 
 
+def test_batch_verify_many_valid_proofs(backend):
+    proofs = [
+        backend.generate_commitment_opening_proof(
+            ProofContext(peer_id=f"QmPeer{i}", session_id=f"session_{i}")
+        )
+        for i in range(8)
+    ]
+    assert backend.batch_verify(proofs) is True
+
+
+def test_batch_verify_detects_tampered_response(backend, ctx):
+    # Challenge still matches, so only the combined equation can catch it
+    proofs = [backend.generate_commitment_opening_proof(ctx) for _ in range(4)]
+    tampered = proofs[2].clone()
+    tampered.response = _tamper_bytes(tampered.response)
+    assert backend.verify_proof(tampered) is False
+    assert backend.batch_verify(proofs[:2] + [tampered] + proofs[3:]) is False
+
+
+def test_batch_verify_rejects_non_proofs(backend, ctx):
+    proof = backend.generate_commitment_opening_proof(ctx)
+    assert backend.batch_verify([proof, "not-a-proof"]) is False
+
+
 # ============================================================================
 # INTEGRATION TESTS
 # ============================================================================
@@ -368,3 +436,34 @@ def test_integration_with_zkproof_serialization(backend, ctx):
     serialized = proof.serialize()
     restored = ZKProof.deserialize(serialized)
     assert backend.verify_proof(restored) is True
+
+
+def test_batch_verify_tiles_and_streams(backend, ctx):
+    proofs = [backend.generate_commitment_opening_proof(ctx) for _ in range(5)]
+    assert backend.batch_verify(proofs, tile=2) is True
+    assert backend.batch_verify(iter(proofs), tile=2) is True
+
+    tampered = proofs[4].clone()
+    tampered.response = _tamper_bytes(tampered.response)
+    assert backend.batch_verify(proofs[:4] + [tampered], tile=2) is False
+
+    with pytest.raises(ValueError):
+        backend.batch_verify(proofs, tile=0)
+
+
+def test_verify_proofs_reports_each_result(backend, ctx):
+    proofs = [backend.generate_commitment_opening_proof(ctx) for _ in range(3)]
+    assert backend.verify_proofs(proofs) == [True, True, True]
+    assert backend.verify_proofs([]) == []
+
+    tampered = proofs[1].clone()
+    tampered.response = _tamper_bytes(tampered.response)
+    assert backend.verify_proofs([proofs[0], tampered, proofs[2]]) == [
+        True,
+        False,
+        True,
+    ]
+    assert backend.verify_proofs(proofs, [{}, "bad", None]) == [True, False, True]
+
+    with pytest.raises(ValueError):
+        backend.verify_proofs(proofs, [{}])
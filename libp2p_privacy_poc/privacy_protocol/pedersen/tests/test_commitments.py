@@ -658,6 +658,19 @@ class TestEdgeCases:
         # Different commitments
         assert c1 != c2
 
+    def test_combine_generators_matches_petlib(self):
+        """Fast path and petlib agree on a*G + b*H, including zero scalars."""
+        from petlib.bn import Bn
+
+        params = setup_curve()
+
+        for a, b in [(42, 7), (GROUP_ORDER - 1, 1), (0, 99), (99, 0)]:
+            expected = (
+                Bn.from_decimal(str(a)) * params.G
+                + Bn.from_decimal(str(b)) * params.H
+            ).export()
+            assert params.combine_generators(a, b) == expected
+
 
 # ============================================================================
 # TEST: SECURITY PROPERTIES
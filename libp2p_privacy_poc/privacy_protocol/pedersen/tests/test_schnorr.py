@@ -961,6 +961,14 @@ def test_challenge_binding_deterministic(params):
     # Same inputs should produce same challenge
     assert challenge1_recomputed == challenge2_recomputed
 
+    # Cached generator prefix must not change the challenge
+    challenge_with_prefix = _compute_challenge(
+        params.G, params.H, commitment, proof1['A'], context,
+        prefix=params.challenge_prefix
+    )
+    assert challenge_with_prefix == challenge1_recomputed
+    assert challenge_with_prefix == proof1['c']
+
 
 def test_context_binding_different_challenges(params, commitment_with_witness):
     """Test that different context produces different challenge."""
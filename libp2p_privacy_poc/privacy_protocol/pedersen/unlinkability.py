@@ -14,7 +14,7 @@ from petlib.bn import Bn
 
 from ..types import ZKProof, ZKProofType
 from ..statements import StatementType
-from ..security import RandomnessSource
+from ..security import RandomnessSource, constant_time_compare
 from .commitments import get_cached_curve_params
 
 # Secp256k1 group (match membership.py)
@@ -33,6 +33,9 @@ def _to_bn(value: Bn | int) -> Bn:
     if isinstance(value, Bn):
         return value
     if isinstance(value, int):
+        if value >= 0:
+            # Binary import avoids a decimal string round-trip
+            return Bn.from_binary(value.to_bytes((value.bit_length() + 7) // 8, "big"))
         return Bn.from_decimal(str(value))
     raise TypeError(f"Expected Bn or int, got {type(value)}")
 
@@ -206,11 +209,9 @@ def verify_unlinkability_proof(proof: ZKProof) -> bool:
         z_v = Bn.from_binary(response_bytes[:32])
         z_b = Bn.from_binary(response_bytes[32:])
 
-        # Verify: z_v*G + z_b*H == A + c*C
-        left_side = (z_v * g) + (z_b * h)
-        right_side = A + (c * C)
-
-        if left_side != right_side:
+        # Verify: z_v*G + z_b*H == A + c*C, i.e. z_v*G + z_b*H + (-c)*C == A,
+        # as one multi-scalar multiplication (all scalars are public here)
+        if group.wsum([z_v, z_b, (-c) % order], [g, h, C]) != A:
             return False
 
         # Step 5: Recompute challenge to verify binding
@@ -224,7 +225,8 @@ def verify_unlinkability_proof(proof: ZKProof) -> bool:
         expected_challenge_hash = hashlib.sha256(challenge_input).digest()
         expected_c = Bn.from_binary(expected_challenge_hash) % order
 
-        if c != expected_c:
+        # Constant-time comparison against the canonical 32-byte encoding
+        if not constant_time_compare(proof.challenge, _bn_to_fixed_bytes(expected_c)):
             return False
 
         return True
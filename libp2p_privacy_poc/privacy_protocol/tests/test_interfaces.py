@@ -30,7 +30,10 @@ from ..interfaces import (
     is_proof_backend,
     is_commitment_scheme,
     is_proof_generator,
-    is_proof_verifier
+    is_proof_verifier,
+    register_commitment_scheme,
+    register_proof_generator,
+    register_proof_verifier,
 )
 from ..types import ZKProof, ProofContext, ZKProofType
 from ..exceptions import CryptographicError
@@ -158,6 +161,7 @@ class MockProofBackend(ProofBackend):
         return super().__exit__(exc_type, exc_val, exc_tb)
 
 
+@register_commitment_scheme
 class MockCommitmentScheme:
     """Mock implementation of CommitmentScheme protocol."""
     
@@ -182,6 +186,7 @@ class MockCommitmentScheme:
         return commitment == expected
 
 
+@register_proof_generator
 class MockProofGenerator:
     """Mock implementation of ProofGenerator protocol."""
     
@@ -201,6 +206,7 @@ class MockProofGenerator:
         )
 
 
+@register_proof_verifier
 class MockProofVerifier:
     """Mock implementation of ProofVerifier protocol."""
     
@@ -281,6 +287,18 @@ class TestConcreteImplementations:
         assert backend.backend_name == "MockBackend"
         assert backend.backend_version == "1.0.0-test"
     
+    def test_default_verify_proofs_loops_over_verify_proof(self):
+        """Default verify_proofs() returns one verify_proof() result each."""
+        backend = MockProofBackend()
+        good = ZKProof(proof_type="test", commitment=b"c")
+        empty = ZKProof(proof_type="test", commitment=b"")
+        
+        assert backend.verify_proofs([good, empty]) == [True, False]
+        assert backend.verify_proofs([good], [{"set_size": 1}]) == [True]
+        assert backend.proofs_verified == 3
+        with pytest.raises(ValueError):
+            backend.verify_proofs([good], [])
+    
     def test_mock_backend_generate_proof(self):
         """MockProofBackend can generate proofs."""
         backend = MockProofBackend()
@@ -605,6 +623,38 @@ class TestHelperFunctions:
         assert is_proof_verifier(verifier) is True
         assert is_proof_verifier("not a verifier") is False
 
+    def test_register_decorators_return_class(self):
+        """Registration leaves the decorated class unchanged."""
+        class Scheme:
+            def commit(self, value, blinding_factor):
+                return b""
+
+            def verify_commitment(self, commitment, value, blinding_factor):
+                return True
+
+        assert register_commitment_scheme(Scheme) is Scheme
+        assert is_commitment_scheme(Scheme()) is True
+        assert register_proof_generator(MockProofGenerator) is MockProofGenerator
+        assert register_proof_verifier(MockProofVerifier) is MockProofVerifier
+
+    def test_helpers_match_protocol_isinstance(self):
+        """Fast helpers agree with isinstance() on the protocols."""
+        class PartialScheme:
+            def commit(self, value, blinding_factor):
+                return b""
+
+        class DisabledVerifier:
+            verify = None
+
+        candidates = [
+            MockCommitmentScheme(), MockProofGenerator(), MockProofVerifier(),
+            PartialScheme(), DisabledVerifier(), object(), "text",
+        ]
+        for obj in candidates:
+            assert is_commitment_scheme(obj) == isinstance(obj, CommitmentScheme)
+            assert is_proof_generator(obj) == isinstance(obj, ProofGenerator)
+            assert is_proof_verifier(obj) == isinstance(obj, ProofVerifier)
+
 
 # ============================================================================
 # TEST: TYPE HINTS AND MYPY COMPATIBILITY
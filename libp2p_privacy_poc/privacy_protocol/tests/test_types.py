@@ -12,6 +12,7 @@ Tests cover:
 6. JSON serialization (to_dict)
 """
 
+import sys
 import time
 import json
 import hashlib
@@ -114,6 +115,21 @@ class TestProofContext:
         assert hash1 == hash2
         assert len(hash1) == 64  # SHA-256 hex length
 
+    def test_ctx_hash_cached(self):
+        """Test that ctx_hash matches SHA-256 of to_bytes() and is reused."""
+        ctx = ProofContext(peer_id="QmTest", session_id="s1")
+
+        assert ctx.ctx_hash == hashlib.sha256(ctx.to_bytes()).digest()
+        assert ctx.to_bytes() is ctx.to_bytes()
+        assert ctx.ctx_hash is ctx.ctx_hash
+
+    def test_frozen(self):
+        """Test that context fields cannot be reassigned after creation."""
+        ctx = ProofContext(peer_id="QmTest")
+
+        with pytest.raises(AttributeError):
+            ctx.peer_id = "QmOther"
+
 
 # ============================================================================
 # ZK PROOF TYPE TESTS
@@ -259,7 +275,33 @@ class TestZKProof:
         assert isinstance(claim, str)
         assert "anonymity_set_membership" in claim
         assert "proof" in claim
-    
+
+    def test_clone_independent_public_inputs(self):
+        """Test that clone() copies fields and detaches public_inputs."""
+        proof = ZKProof(
+            proof_type="anonymity_set_membership",
+            commitment=b"test",
+            challenge=b"challenge",
+            public_inputs={"ctx_hash": b"hash"}
+        )
+
+        cloned = proof.clone()
+        cloned.public_inputs["ctx_hash"] = b"other"
+        cloned.challenge = b"changed"
+
+        assert cloned.commitment == proof.commitment
+        assert cloned.timestamp == proof.timestamp
+        assert proof.public_inputs == {"ctx_hash": b"hash"}
+        assert proof.challenge == b"challenge"
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slots need 3.10+")
+    def test_slots_reject_unknown_attributes(self):
+        """Test that ZKProof instances carry no per-instance __dict__."""
+        proof = ZKProof(proof_type="test", commitment=b"test")
+        assert not hasattr(proof, "__dict__")
+        with pytest.raises(AttributeError):
+            proof.unexpected = 1
+
     @pytest.mark.skipif(not MOCK_AVAILABLE, reason="MockZKProof not available")
     def test_from_mock_proof_conversion(self):
         """Test conversion from MockZKProof to ZKProof."""
@@ -370,7 +412,30 @@ class TestZKProof:
         assert restored.response == original.response
         assert restored.public_inputs == original.public_inputs
         assert restored.timestamp == original.timestamp
-    
+
+    def test_serialize_reuses_encoding_until_mutated(self):
+        """Test that cached serialization tracks field and input changes."""
+        proof = ZKProof(
+            proof_type="test",
+            commitment=b"commitment",
+            public_inputs={"set_size": 100},
+            timestamp=1234567890.0
+        )
+        data = proof.serialize()
+        assert proof.serialize() is data
+
+        proof.commitment = b"other"
+        assert ZKProof.deserialize(proof.serialize()).commitment == b"other"
+
+        proof.public_inputs["set_size"] = 5
+        assert ZKProof.deserialize(proof.serialize()).public_inputs == {"set_size": 5}
+
+        # Mutable inputs can change in place, so they are never cached
+        proof.public_inputs["members"] = [1]
+        proof.serialize()
+        proof.public_inputs["members"].append(2)
+        assert ZKProof.deserialize(proof.serialize()).public_inputs["members"] == [1, 2]
+
     def test_deserialize_version_check(self):
         """Test that deserialization checks version."""
         # Create CBOR data with wrong version
@@ -17,11 +17,15 @@ Compatibility Layer:
 - Maintains existing API contracts
 """
 
+import sys
 import time
 import json
 import hashlib
-from dataclasses import dataclass, field
-from typing import Dict, Any, Optional
+import struct
+from dataclasses import dataclass, field, replace
+from functools import cached_property
+from operator import is_
+from typing import Dict, Any, Optional, Tuple
 from enum import Enum
 
 try:
@@ -32,15 +36,18 @@ except ImportError:
         "Install with: pip install cbor2"
     )
 
-from .config import PROOF_VERSION, SERIALIZATION_FORMAT
+from .config import PROOF_VERSION, SERIALIZATION_FORMAT, POINT_SIZE_BYTES
 from .exceptions import ProofVerificationError, CryptographicError
 
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep a __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 # ============================================================================
 # PROOF CONTEXT
 # ============================================================================
 
 
-@dataclass
+@dataclass(frozen=True)
 class ProofContext:
     """
     Unified context for proof generation.
@@ -54,6 +61,11 @@ class ProofContext:
         metadata: Additional context-specific metadata
         timestamp: Unix timestamp when context was created
     
+    Contexts are frozen: the serialized bytes and their SHA-256 are computed
+    once on first use and reused by every proof generated or verified
+    against the same context. Do not mutate ``metadata`` in place after the
+    context has been used.
+    
     Example:
         >>> ctx = ProofContext(
         ...     peer_id="QmXYZ...",
@@ -83,6 +95,11 @@ class ProofContext:
             >>> ctx_bytes = ctx.to_bytes()
             >>> assert isinstance(ctx_bytes, bytes)
         """
+        return self._serialized
+    
+    @cached_property
+    def _serialized(self) -> bytes:
+        """Deterministic JSON encoding of the context (computed once)."""
         data = {
             "peer_id": self.peer_id,
             "session_id": self.session_id,
@@ -90,6 +107,16 @@ class ProofContext:
             "timestamp": self.timestamp
         }
         return json.dumps(data, sort_keys=True).encode('utf-8')
+    
+    @cached_property
+    def ctx_hash(self) -> bytes:
+        """
+        SHA-256 of to_bytes(), as bound into proof challenges.
+        
+        Returns:
+            bytes: 32-byte context hash
+        """
+        return hashlib.sha256(self._serialized).digest()
 
 
 # ============================================================================
@@ -118,12 +145,34 @@ class ZKProofType(Enum):
     TIMING_INDEPENDENCE = "timing_independence"
 
 
+# Compact fixed-layout frame for commitment opening proofs:
+# version | proof_type | flags | curve | commitment | challenge | response
+# | ctx_hash | A | anonymity_set_size | timestamp
+_COMPACT_FRAME = struct.Struct(
+    f">BBBB{POINT_SIZE_BYTES}s32s64s32s{POINT_SIZE_BYTES}sId"
+)
+_COMPACT_FRAME_SIZES = (POINT_SIZE_BYTES, 32, 64, 32, POINT_SIZE_BYTES)
+_COMPACT_CURVES = ("secp256k1",)
+_COMPACT_PROOF_TYPES = tuple(t.value for t in ZKProofType)
+_COMPACT_FLAG_CLAIM_ONLY = 0x01
+_COMPACT_FLAG_A_HEX = 0x02
+_COMPACT_KEYS = frozenset(
+    ("v", "curve", "anonymity_set_size", "ctx_hash", "A", "claim_only")
+)
+
+# Values that cannot change in place; serialize() only reuses its output
+# for proofs made entirely of these
+_IMMUTABLE_VALUE_TYPES = frozenset(
+    (bytes, str, int, float, bool, type(None), ZKProofType)
+)
+
+
 # ============================================================================
 # ZK PROOF (WITH COMPATIBILITY LAYER)
 # ============================================================================
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ZKProof:
     """
     Universal zero-knowledge proof structure.
@@ -167,6 +216,10 @@ class ZKProof:
     response: Optional[bytes] = None  # Prover response (Schnorr)
     public_inputs: Dict[str, Any] = field(default_factory=dict)
     timestamp: float = field(default_factory=time.time)
+    # Last serialize() output and the exact objects it encoded
+    _serialized_cache: Optional[Tuple[tuple, bytes]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     # ========================================================================
     # COMPATIBILITY LAYER FOR MockZKProof
@@ -224,6 +277,19 @@ class ZKProof:
         """
         return f"{self.proof_type} proof"
 
+    def clone(self) -> 'ZKProof':
+        """
+        Copy this proof so its fields can be modified independently.
+        
+        Byte fields are immutable and shared; public_inputs is copied one
+        level deep, which is all that reassigning or overwriting its keys
+        needs and far cheaper than copy.deepcopy().
+        
+        Returns:
+            ZKProof: New proof with the same field values
+        """
+        return replace(self, public_inputs=dict(self.public_inputs))
+
     # ========================================================================
     # PHASE 2B STATEMENT METADATA HELPERS
     # ========================================================================
@@ -337,6 +403,10 @@ class ZKProof:
         - Type preservation
         - Version field for forward compatibility
         
+        The encoding is reused while every field (and every public input)
+        is still the same immutable object it was built from; reassigning
+        a field or a public input re-encodes on the next call.
+        
         Returns:
             bytes: CBOR-encoded proof
         
@@ -348,6 +418,24 @@ class ZKProof:
             >>> data = proof.serialize()
             >>> assert isinstance(data, bytes)
         """
+        public_inputs = self.public_inputs
+        snapshot = (
+            self.proof_type,
+            self.commitment,
+            self.challenge,
+            self.response,
+            self.timestamp,
+            *public_inputs.keys(),
+            *public_inputs.values(),
+        ) if isinstance(public_inputs, dict) else None
+        cached = self._serialized_cache
+        if (
+            cached is not None
+            and snapshot is not None
+            and len(cached[0]) == len(snapshot)
+            and all(map(is_, cached[0], snapshot))
+        ):
+            return cached[1]
         try:
             data = {
                 "v": PROOF_VERSION,  # Version field for compatibility
@@ -360,9 +448,14 @@ class ZKProof:
                 "p": self.public_inputs,
                 "ts": self.timestamp
             }
-            return cbor2.dumps(data)
+            encoded = cbor2.dumps(data)
         except Exception as e:
             raise CryptographicError(f"Failed to serialize proof: {e}")
+        if snapshot is not None and all(
+            type(value) in _IMMUTABLE_VALUE_TYPES for value in snapshot
+        ):
+            self._serialized_cache = (snapshot, encoded)
+        return encoded
     
     @classmethod
     def deserialize(cls, data: bytes) -> 'ZKProof':
@@ -415,6 +508,104 @@ class ZKProof:
             timestamp=obj.get("ts", time.time())
         )
     
+    def serialize_compact(self) -> bytes:
+        """
+        Serialize a commitment opening proof to a fixed-layout binary frame.
+        
+        Every field sits at a fixed offset, so no field names are encoded
+        and decoding is a single struct unpack. Only commitment opening
+        proofs (as produced by PedersenBackend) fit the layout; use
+        serialize() for everything else.
+        
+        Returns:
+            bytes: Fixed-size frame (_COMPACT_FRAME.size bytes)
+        
+        Raises:
+            ValueError: If the proof does not fit the compact layout
+        """
+        inputs = self.public_inputs
+        if (
+            self.proof_type not in _COMPACT_PROOF_TYPES
+            or set(inputs) != _COMPACT_KEYS
+            or inputs["curve"] not in _COMPACT_CURVES
+            or not isinstance(inputs["claim_only"], bool)
+        ):
+            raise ValueError("Proof does not fit the compact layout")
+        
+        A_field = inputs["A"]
+        flags = _COMPACT_FLAG_CLAIM_ONLY if inputs["claim_only"] else 0
+        if isinstance(A_field, str):
+            flags |= _COMPACT_FLAG_A_HEX
+            A_field = bytes.fromhex(A_field)
+        
+        fields = (
+            self.commitment, self.challenge, self.response,
+            inputs["ctx_hash"], A_field,
+        )
+        if any(
+            not isinstance(value, (bytes, bytearray)) or len(value) != size
+            for value, size in zip(fields, _COMPACT_FRAME_SIZES)
+        ):
+            raise ValueError("Proof does not fit the compact layout")
+        
+        try:
+            return _COMPACT_FRAME.pack(
+                inputs["v"],
+                _COMPACT_PROOF_TYPES.index(self.proof_type),
+                flags,
+                _COMPACT_CURVES.index(inputs["curve"]),
+                *fields,
+                inputs["anonymity_set_size"],
+                self.timestamp,
+            )
+        except struct.error as e:
+            raise ValueError(f"Proof does not fit the compact layout: {e}")
+    
+    @classmethod
+    def deserialize_compact(cls, data: bytes) -> 'ZKProof':
+        """
+        Deserialize a frame produced by serialize_compact().
+        
+        Args:
+            data: Compact frame bytes
+        
+        Returns:
+            ZKProof: Commitment opening proof
+        
+        Raises:
+            ValueError: If the frame size, proof type or curve index is invalid
+        """
+        if len(data) != _COMPACT_FRAME.size:
+            raise ValueError(
+                f"Invalid compact proof size: expected {_COMPACT_FRAME.size} "
+                f"bytes, got {len(data)}"
+            )
+        (
+            version, type_idx, flags, curve_idx, commitment, challenge, response,
+            ctx_hash, A_bytes, anonymity_set_size, timestamp,
+        ) = _COMPACT_FRAME.unpack(data)
+        
+        if curve_idx >= len(_COMPACT_CURVES):
+            raise ValueError(f"Unknown curve index: {curve_idx}")
+        if type_idx >= len(_COMPACT_PROOF_TYPES):
+            raise ValueError(f"Unknown proof type index: {type_idx}")
+        
+        return cls(
+            proof_type=_COMPACT_PROOF_TYPES[type_idx],
+            commitment=commitment,
+            challenge=challenge,
+            response=response,
+            public_inputs={
+                "v": version,
+                "curve": _COMPACT_CURVES[curve_idx],
+                "anonymity_set_size": anonymity_set_size,
+                "ctx_hash": ctx_hash,
+                "A": A_bytes.hex() if flags & _COMPACT_FLAG_A_HEX else A_bytes,
+                "claim_only": bool(flags & _COMPACT_FLAG_CLAIM_ONLY),
+            },
+            timestamp=timestamp,
+        )
+    
     def to_dict(self) -> dict:
         """
         Convert to dictionary for JSON serialization.
@@ -8,9 +8,15 @@ Generates comprehensive privacy reports in various formats:
 """
 
 import json
-from typing import Any, Dict, List, Optional
+from concurrent.futures import Executor
+from typing import Any, Dict, Iterator, List, Optional
 
-from libp2p_privacy_poc.privacy_analyzer import PrivacyReport, PrivacyRisk
+try:
+    import orjson
+except ImportError:  # Optional fast path; stdlib json is always available
+    orjson = None
+
+from libp2p_privacy_poc.privacy_analyzer import PrivacyReport, PrivacyRisk, risk_bucket
 from libp2p_privacy_poc.mock_zk_proofs import MockZKProof
 from libp2p_privacy_poc.utils import (
     format_timestamp,
@@ -21,6 +27,100 @@ from libp2p_privacy_poc.utils import (
     generate_report_id,
 )
 
+# Static stylesheet shared by every HTML report
+_HTML_STYLE = """    <style>
+        body {
+            font-family: Arial, sans-serif;
+            margin: 20px;
+            background-color: #f5f5f5;
+        }
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+            background-color: white;
+            padding: 30px;
+            border-radius: 8px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        h1 {
+            color: #333;
+            border-bottom: 3px solid #4CAF50;
+            padding-bottom: 10px;
+        }
+        h2 {
+            color: #555;
+            margin-top: 30px;
+        }
+        .risk-score {
+            font-size: 48px;
+            font-weight: bold;
+            text-align: center;
+            padding: 20px;
+            border-radius: 8px;
+            margin: 20px 0;
+        }
+        .risk-low { background-color: #4CAF50; color: white; }
+        .risk-medium { background-color: #FF9800; color: white; }
+        .risk-high { background-color: #F44336; color: white; }
+        .risk-critical { background-color: #D32F2F; color: white; }
+        .risk-item {
+            margin: 15px 0;
+            padding: 15px;
+            border-left: 4px solid #ccc;
+            background-color: #f9f9f9;
+        }
+        .risk-item.critical { border-left-color: #D32F2F; }
+        .risk-item.high { border-left-color: #F44336; }
+        .risk-item.medium { border-left-color: #FF9800; }
+        .risk-item.low { border-left-color: #4CAF50; }
+        .badge {
+            display: inline-block;
+            padding: 3px 8px;
+            border-radius: 3px;
+            font-size: 12px;
+            font-weight: bold;
+            color: white;
+        }
+        .badge-critical { background-color: #D32F2F; }
+        .badge-high { background-color: #F44336; }
+        .badge-medium { background-color: #FF9800; }
+        .badge-low { background-color: #4CAF50; }
+        .warning {
+            background-color: #FFF3CD;
+            border: 1px solid #FFC107;
+            padding: 15px;
+            border-radius: 4px;
+            margin: 20px 0;
+        }
+        .stats {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 15px;
+            margin: 20px 0;
+        }
+        .stat-card {
+            padding: 15px;
+            background-color: #f0f0f0;
+            border-radius: 4px;
+            text-align: center;
+        }
+        .stat-value {
+            font-size: 24px;
+            font-weight: bold;
+            color: #333;
+        }
+        .stat-label {
+            font-size: 14px;
+            color: #666;
+            margin-top: 5px;
+        }
+    </style>
+"""
+
+# Indexed by risk_bucket(): LOW, MEDIUM, HIGH, CRITICAL
+_RISK_COLORS = ("green", "yellow", "yellow", "red")
+_RISK_CLASSES = ("risk-low", "risk-medium", "risk-high", "risk-critical")
+
 
 class ReportGenerator:
     """
@@ -31,6 +131,54 @@ class ReportGenerator:
         """Initialize the report generator."""
         self.report_id = generate_report_id()
     
+    def generate_all(
+        self,
+        report: PrivacyReport,
+        zk_proofs: Optional[Dict[str, List[MockZKProof]]] = None,
+        verbose: bool = False,
+        real_zk_proof: Optional[Dict[str, Any]] = None,
+        real_phase2b_proofs: Optional[List[Dict[str, Any]]] = None,
+        data_source: Optional[str] = None,
+        executor: Optional[Executor] = None,
+    ) -> Dict[str, str]:
+        """
+        Generate the console, JSON and HTML reports in one call.
+        
+        Args:
+            report: The privacy report
+            zk_proofs: Optional ZK proofs to include
+            verbose: Include detailed information in the console report
+            executor: Optional executor to render the three formats
+                concurrently (e.g. a ProcessPoolExecutor for very large
+                reports). Rendering is serial by default; for typical
+                reports it takes well under a millisecond, far less than
+                dispatching work to another process.
+        
+        Returns:
+            Dictionary mapping "console", "json" and "html" to report content
+        """
+        shared = {
+            "real_zk_proof": real_zk_proof,
+            "real_phase2b_proofs": real_phase2b_proofs,
+            "data_source": data_source,
+        }
+        jobs = {
+            "console": (self.generate_console_report, {"verbose": verbose, **shared}),
+            "json": (self.generate_json_report, shared),
+            "html": (self.generate_html_report, shared),
+        }
+        if executor is None:
+            return {
+                name: render(report, zk_proofs, **kwargs)
+                for name, (render, kwargs) in jobs.items()
+            }
+        
+        futures = {
+            name: executor.submit(render, report, zk_proofs, **kwargs)
+            for name, (render, kwargs) in jobs.items()
+        }
+        return {name: future.result() for name, future in futures.items()}
+    
     def generate_console_report(
         self,
         report: PrivacyReport,
@@ -214,6 +362,33 @@ class ReportGenerator:
         Returns:
             JSON string
         """
+        return self.generate_json_bytes(
+            report,
+            zk_proofs,
+            certificate,
+            real_zk_proof=real_zk_proof,
+            real_phase2b_proofs=real_phase2b_proofs,
+            data_source=data_source,
+        ).decode("utf-8")
+    
+    def generate_json_bytes(
+        self,
+        report: PrivacyReport,
+        zk_proofs: Optional[Dict[str, List[MockZKProof]]] = None,
+        certificate: Optional[dict] = None,
+        real_zk_proof: Optional[Dict[str, Any]] = None,
+        real_phase2b_proofs: Optional[List[Dict[str, Any]]] = None,
+        data_source: Optional[str] = None,
+    ) -> bytes:
+        """
+        Generate a JSON report as UTF-8 encoded bytes.
+        
+        Same document as generate_json_report(), without decoding orjson's
+        output to str; use this when the report goes straight to a file.
+        
+        Returns:
+            JSON document as bytes
+        """
         data = {
             "report_id": self.report_id,
             "timestamp": report.timestamp,
@@ -243,7 +418,15 @@ class ReportGenerator:
             "WARNING": "PROOF OF CONCEPT - NOT PRODUCTION READY",
         }
         
-        return json.dumps(data, indent=2)
+        if orjson is not None:
+            try:
+                return orjson.dumps(
+                    data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                )
+            except TypeError:
+                # orjson rejects some values stdlib json accepts (e.g. >64-bit ints)
+                pass
+        return json.dumps(data, indent=2).encode("utf-8")
     
     def generate_html_report(
         self,
@@ -263,99 +446,44 @@ class ReportGenerator:
         Returns:
             HTML string
         """
-        html = f"""
+        return "".join(self.iter_html_report(
+            report,
+            zk_proofs,
+            real_zk_proof=real_zk_proof,
+            real_phase2b_proofs=real_phase2b_proofs,
+            data_source=data_source,
+        ))
+    
+    def iter_html_report(
+        self,
+        report: PrivacyReport,
+        zk_proofs: Optional[Dict[str, List[MockZKProof]]] = None,
+        real_zk_proof: Optional[Dict[str, Any]] = None,
+        real_phase2b_proofs: Optional[List[Dict[str, Any]]] = None,
+        data_source: Optional[str] = None,
+    ) -> Iterator[str]:
+        """
+        Generate an HTML report as a sequence of chunks.
+        
+        Joining the chunks gives exactly generate_html_report(); callers
+        writing to a file can pass this to writelines() and never hold the
+        whole document in memory.
+        
+        Args:
+            report: The privacy report
+            zk_proofs: Optional ZK proofs to include
+        
+        Yields:
+            Consecutive pieces of the HTML document
+        """
+        yield f"""
 <!DOCTYPE html>
 <html>
 <head>
     <title>Privacy Analysis Report - {self.report_id}</title>
-    <style>
-        body {{
-            font-family: Arial, sans-serif;
-            margin: 20px;
-            background-color: #f5f5f5;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background-color: white;
-            padding: 30px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        h1 {{
-            color: #333;
-            border-bottom: 3px solid #4CAF50;
-            padding-bottom: 10px;
-        }}
-        h2 {{
-            color: #555;
-            margin-top: 30px;
-        }}
-        .risk-score {{
-            font-size: 48px;
-            font-weight: bold;
-            text-align: center;
-            padding: 20px;
-            border-radius: 8px;
-            margin: 20px 0;
-        }}
-        .risk-low {{ background-color: #4CAF50; color: white; }}
-        .risk-medium {{ background-color: #FF9800; color: white; }}
-        .risk-high {{ background-color: #F44336; color: white; }}
-        .risk-critical {{ background-color: #D32F2F; color: white; }}
-        .risk-item {{
-            margin: 15px 0;
-            padding: 15px;
-            border-left: 4px solid #ccc;
-            background-color: #f9f9f9;
-        }}
-        .risk-item.critical {{ border-left-color: #D32F2F; }}
-        .risk-item.high {{ border-left-color: #F44336; }}
-        .risk-item.medium {{ border-left-color: #FF9800; }}
-        .risk-item.low {{ border-left-color: #4CAF50; }}
-        .badge {{
-            display: inline-block;
-            padding: 3px 8px;
-            border-radius: 3px;
-            font-size: 12px;
-            font-weight: bold;
-            color: white;
-        }}
-        .badge-critical {{ background-color: #D32F2F; }}
-        .badge-high {{ background-color: #F44336; }}
-        .badge-medium {{ background-color: #FF9800; }}
-        .badge-low {{ background-color: #4CAF50; }}
-        .warning {{
-            background-color: #FFF3CD;
-            border: 1px solid #FFC107;
-            padding: 15px;
-            border-radius: 4px;
-            margin: 20px 0;
-        }}
-        .stats {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 15px;
-            margin: 20px 0;
-        }}
-        .stat-card {{
-            padding: 15px;
-            background-color: #f0f0f0;
-            border-radius: 4px;
-            text-align: center;
-        }}
-        .stat-value {{
-            font-size: 24px;
-            font-weight: bold;
-            color: #333;
-        }}
-        .stat-label {{
-            font-size: 14px;
-            color: #666;
-            margin-top: 5px;
-        }}
-    </style>
-</head>
+"""
+        yield _HTML_STYLE
+        yield f"""</head>
 <body>
     <div class="container">
         <h1>Privacy Analysis Report</h1>
@@ -380,7 +508,9 @@ class ReportGenerator:
         </div>
         
         <h2>Privacy Risks ({len(report.risks)})</h2>
-        {self._generate_risk_items_html(report.risks)}
+        """
+        yield from self._iter_risk_items_html(report.risks)
+        yield f"""
         
         {self._generate_zk_proofs_html(zk_proofs) if zk_proofs else ''}
         
@@ -394,29 +524,14 @@ class ReportGenerator:
 </body>
 </html>
 """
-        return html
     
     def _get_risk_color(self, score: float) -> str:
         """Get color for risk score."""
-        if score >= 0.75:
-            return "red"
-        elif score >= 0.5:
-            return "yellow"
-        elif score >= 0.25:
-            return "yellow"
-        else:
-            return "green"
+        return _RISK_COLORS[risk_bucket(score)]
     
     def _get_risk_class(self, score: float) -> str:
         """Get CSS class for risk score."""
-        if score >= 0.75:
-            return "risk-critical"
-        elif score >= 0.5:
-            return "risk-high"
-        elif score >= 0.25:
-            return "risk-medium"
-        else:
-            return "risk-low"
+        return _RISK_CLASSES[risk_bucket(score)]
     
     def _generate_stat_cards(self, statistics: dict) -> str:
         """Generate HTML for statistics cards."""
@@ -431,44 +546,45 @@ class ReportGenerator:
             """)
         return "\n".join(cards)
     
-    def _generate_risk_items_html(self, risks: List[PrivacyRisk]) -> str:
-        """Generate HTML for risk items."""
+    def _iter_risk_items_html(self, risks: List[PrivacyRisk]) -> Iterator[str]:
+        """Generate HTML for risk items, one item at a time."""
         if not risks:
-            return "<p>No privacy risks detected.</p>"
+            yield "<p>No privacy risks detected.</p>"
+            return
         
-        items = []
-        for risk in risks:
-            items.append(f"""
+        for index, risk in enumerate(risks):
+            if index:
+                yield "\n"
+            yield f"""
             <div class="risk-item {risk.severity}">
                 <span class="badge badge-{risk.severity}">{risk.severity.upper()}</span>
                 <strong>{risk.risk_type}</strong>
                 <p>{risk.description}</p>
                 <small>Confidence: {risk.confidence:.0%}</small>
             </div>
-            """)
-        return "\n".join(items)
+            """
     
     def _generate_zk_proofs_html(self, zk_proofs: Dict[str, List[MockZKProof]]) -> str:
         """Generate HTML for ZK proofs section."""
         total_proofs = sum(len(proofs) for proofs in zk_proofs.values())
         
-        html = f"""
+        parts = [f"""
         <h2>Zero-Knowledge Proofs ({total_proofs})</h2>
         <div class="warning">
             <strong>⚠️ MOCK PROOFS</strong><br>
             These are demonstration proofs only. Real cryptographic implementation required for production.
         </div>
-        """
+        """]
         
         for proof_type, proofs in zk_proofs.items():
             if proofs:
-                html += f"<h3>{proof_type.replace('_', ' ').title()} ({len(proofs)})</h3><ul>"
+                parts.append(f"<h3>{proof_type.replace('_', ' ').title()} ({len(proofs)})</h3><ul>")
                 for proof in proofs[:5]:
                     verified = "✓" if proof.verify() else "✗"
-                    html += f"<li>{proof.claim} {verified}</li>"
-                html += "</ul>"
+                    parts.append(f"<li>{proof.claim} {verified}</li>")
+                parts.append("</ul>")
         
-        return html
+        return "".join(parts)
 
     def _generate_real_zk_proof_html(
         self,
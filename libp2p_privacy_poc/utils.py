@@ -2,12 +2,20 @@
 Utility functions for the privacy analysis tool.
 """
 
+import functools
 import json
-import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, TYPE_CHECKING
 from multiaddr import Multiaddr
 
+try:
+    import orjson
+except ImportError:  # Optional fast path; stdlib json is always available
+    orjson = None
+
+if TYPE_CHECKING:
+    from libp2p.peer.id import ID as PeerID
+
 
 def get_peer_listening_address(host) -> Multiaddr:
     """
@@ -32,15 +40,73 @@ def get_peer_listening_address(host) -> Multiaddr:
     if not network.listeners:
         raise ValueError(f"Host {host.get_id()} has no active listeners")
     
-    listener_key = list(network.listeners.keys())[0]
-    listener = network.listeners[listener_key]
+    listener = next(iter(network.listeners.values()))
     actual_addr = listener.get_addrs()[0]
-    return actual_addr.encapsulate(Multiaddr(f"/p2p/{host.get_id()}"))
+    return actual_addr.encapsulate(cached_multiaddr(f"/p2p/{host.get_id()}"))
+
 
+async def close_hosts(hosts: Iterable[Any]) -> None:
+    """
+    Close several libp2p hosts concurrently.
+    
+    Each close() waits on transport and muxer shutdown independently, so
+    running them in one nursery takes as long as the slowest close rather
+    than the sum of all of them.
+    
+    Args:
+        hosts: libp2p Host objects to close
+    """
+    import trio
+    
+    async with trio.open_nursery() as nursery:
+        for host in hosts:
+            nursery.start_soon(host.close)
 
 
+@functools.lru_cache(maxsize=1024)
+def cached_multiaddr(addr: str) -> Multiaddr:
+    """
+    Parse a multiaddr string, reusing the result for repeated strings.
+    
+    Multiaddr parsing tokenizes and validates every protocol component;
+    demos and simulations build the same few addresses over and over.
+    Multiaddr objects are never mutated in place (encapsulate/decapsulate
+    return new instances), so sharing one parsed object is safe.
+    
+    Args:
+        addr: Multiaddr in string form, e.g. "/ip4/127.0.0.1/tcp/0"
+        
+    Returns:
+        Parsed Multiaddr
+    """
+    return Multiaddr(addr)
+
+
+def mint_peer_id() -> "PeerID":
+    """
+    Create a fresh, valid peer ID without constructing a libp2p host.
+    
+    Use this when a demo or test only needs an identity (e.g. as a proof
+    input or an unreachable dial target); new_host() also builds a swarm,
+    transports and muxers that are thrown away immediately.
+    
+    Returns:
+        PeerID derived from a newly generated Ed25519 key pair
+    """
+    from libp2p.crypto.ed25519 import create_new_key_pair
+    from libp2p.peer.id import ID as PeerID
+    
+    return PeerID.from_pubkey(create_new_key_pair().public_key)
+
+
+@functools.lru_cache(maxsize=4096)
 def format_timestamp(timestamp: float) -> str:
-    """Format a Unix timestamp as human-readable string."""
+    """
+    Format a Unix timestamp as human-readable string.
+    
+    A report's timestamp is formatted once per output format, so results
+    are memoized (local time is assumed not to change while running).
+    """
     return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
 
 
@@ -56,9 +122,16 @@ def format_duration(seconds: float) -> str:
         return f"{hours:.1f}h"
 
 
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+
 def format_bytes(bytes_count: int) -> str:
     """Format byte count as human-readable string."""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
+    if isinstance(bytes_count, int) and bytes_count >= 0:
+        # Each unit is 2**10 of the previous one, so the bit length picks it
+        index = min(max(bytes_count.bit_length() - 1, 0) // 10, 5)
+        return f"{bytes_count / (1 << (10 * index)):.1f}{_BYTE_UNITS[index]}"
+    for unit in _BYTE_UNITS[:-1]:
         if bytes_count < 1024.0:
             return f"{bytes_count:.1f}{unit}"
         bytes_count /= 1024.0
@@ -72,33 +145,73 @@ def truncate_peer_id(peer_id: str, length: int = 16) -> str:
     return f"{peer_id[:length]}..."
 
 
-def calculate_entropy(values: List[Any]) -> float:
+# Below this many distinct values the plain loop beats NumPy's setup cost
+_ENTROPY_VECTORIZE_MIN_DISTINCT = 128
+
+
+def calculate_entropy(values: Any) -> float:
     """
     Calculate Shannon entropy of a list of values.
     
     Higher entropy = more randomness/unpredictability
     Lower entropy = more patterns/predictability
-    """
-    if not values:
-        return 0.0
     
+    NumPy arrays are tallied with np.bincount (integers spanning a range
+    no wider than the array) or np.unique; other sequences with Counter,
+    reducing in NumPy once there are many distinct values.
+    """
     from collections import Counter
     import math
     
-    counts = Counter(values)
-    total = len(values)
-    
-    entropy = 0.0
-    for count in counts.values():
-        probability = count / total
-        if probability > 0:
-            entropy -= probability * math.log2(probability)
+    if type(values).__module__ == "numpy":
+        if values.size == 0:
+            return 0.0
+        import numpy as np
+        values = values.ravel()
+        total = values.size
+        if values.dtype.kind in "iub":
+            low = int(values.min())
+            span = int(values.max()) - low + 1
+        if values.dtype.kind in "iub" and span <= total:
+            # Dense integer codes: one counting pass, no sort
+            counts = np.bincount(values - low if low else values)
+            counts = counts[counts > 0]
+        else:
+            _, counts = np.unique(values, return_counts=True)
+    else:
+        if not values:
+            return 0.0
+        tally = Counter(values)
+        total = len(values)
+        
+        if len(tally) < _ENTROPY_VECTORIZE_MIN_DISTINCT:
+            entropy = 0.0
+            for count in tally.values():
+                probability = count / total
+                entropy -= probability * math.log2(probability)
+            return entropy
+        
+        import numpy as np
+        counts = np.fromiter(tally.values(), dtype=np.float64, count=len(tally))
     
-    return entropy
+    probabilities = counts / total
+    return float((probabilities * -np.log2(probabilities)).sum())
 
 
 def save_json(data: dict, filepath: str, pretty: bool = True):
     """Save data as JSON file."""
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 if pretty else 0
+            )
+        except TypeError:
+            # orjson rejects some values stdlib json accepts (e.g. int keys)
+            pass
+        else:
+            with open(filepath, 'wb') as f:
+                f.write(encoded)
+            return
     with open(filepath, 'w') as f:
         if pretty:
             json.dump(data, f, indent=2)
@@ -113,10 +226,28 @@ def load_json(filepath: str) -> dict:
 
 
 def generate_report_id() -> str:
-    """Generate a unique report ID."""
-    import hashlib
-    timestamp = str(time.time())
-    return hashlib.sha256(timestamp.encode()).hexdigest()[:16]
+    """Generate a unique report ID (16 hex characters, 64 random bits)."""
+    import secrets
+    return secrets.token_hex(8)
+
+
+_COLOR_RESET = '\033[0m'
+_COLORS = {
+    'red': '\033[91m',
+    'green': '\033[92m',
+    'yellow': '\033[93m',
+    'blue': '\033[94m',
+    'magenta': '\033[95m',
+    'cyan': '\033[96m',
+    'white': '\033[97m',
+    'reset': _COLOR_RESET,
+}
+_SEVERITY_COLORS = {
+    'critical': _COLORS['red'],
+    'high': _COLORS['red'],
+    'medium': _COLORS['yellow'],
+    'low': _COLORS['green'],
+}
 
 
 def color_text(text: str, color: str) -> str:
@@ -130,34 +261,13 @@ def color_text(text: str, color: str) -> str:
     Returns:
         Colored text string
     """
-    colors = {
-        'red': '\033[91m',
-        'green': '\033[92m',
-        'yellow': '\033[93m',
-        'blue': '\033[94m',
-        'magenta': '\033[95m',
-        'cyan': '\033[96m',
-        'white': '\033[97m',
-        'reset': '\033[0m',
-    }
-    
-    color_code = colors.get(color.lower(), colors['reset'])
-    reset_code = colors['reset']
-    
-    return f"{color_code}{text}{reset_code}"
+    return f"{_COLORS.get(color.lower(), _COLOR_RESET)}{text}{_COLOR_RESET}"
 
 
 def format_risk_severity(severity: str) -> str:
     """Format risk severity with color."""
-    severity_colors = {
-        'critical': 'red',
-        'high': 'red',
-        'medium': 'yellow',
-        'low': 'green',
-    }
-    
-    color = severity_colors.get(severity.lower(), 'white')
-    return color_text(severity.upper(), color)
+    color_code = _SEVERITY_COLORS.get(severity.lower(), _COLORS['white'])
+    return f"{color_code}{severity.upper()}{_COLOR_RESET}"
 
 
 def create_progress_bar(current: int, total: int, width: int = 50) -> str:
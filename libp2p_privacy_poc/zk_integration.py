@@ -79,37 +79,65 @@ class ZKDataPreparator:
         Returns:
             ZKReadyData ready for circuit input
         """
-        # Create commitment to peer_id (hide the actual value)
-        peer_commitment = hashlib.sha256(peer_id.encode()).hexdigest()
+        return self.prepare_anonymity_set_data_batch([peer_id], all_peer_ids)[0]
+    
+    def prepare_anonymity_set_data_batch(
+        self,
+        peer_ids: List[str],
+        all_peer_ids: List[str]
+    ) -> List[ZKReadyData]:
+        """
+        Prepare anonymity set membership data for several peers at once.
         
-        # Create Merkle tree root of anonymity set (public input)
-        merkle_root = self._compute_mock_merkle_root(all_peer_ids)
+        Equivalent to calling prepare_anonymity_set_data() per peer, but the
+        set-wide parts (Merkle root, position lookup table) are computed
+        once, so preparing every member of an N-peer set is O(N) rather
+        than O(N^2).
         
-        # Find position in set (private input)
-        try:
-            position = all_peer_ids.index(peer_id)
-        except ValueError:
-            position = -1
+        Args:
+            peer_ids: The peer IDs to prove membership for
+            all_peer_ids: All peer IDs in the anonymity set
         
-        return ZKReadyData(
-            data_type="anonymity_set_membership",
-            values={
-                "anonymity_set_size": len(all_peer_ids),
-                "peer_position": position,
-            },
-            commitments={
-                "peer_id": peer_commitment,
-            },
-            public_inputs={
-                "merkle_root": merkle_root,
-                "set_size": len(all_peer_ids),
-            },
-            private_inputs={
-                "peer_id": peer_id,
-                "position": position,
-                "merkle_proof": self._compute_mock_merkle_proof(all_peer_ids, position),
-            }
-        )
+        Returns:
+            One ZKReadyData per peer, in input order
+        """
+        # Create Merkle tree root of anonymity set (public input)
+        merkle_root = self._compute_mock_merkle_root(all_peer_ids)
+        set_size = len(all_peer_ids)
+        
+        # Position of each peer's first occurrence, as list.index() reports it
+        positions: Dict[str, int] = {}
+        for index, member in enumerate(all_peer_ids):
+            positions.setdefault(member, index)
+        
+        prepared = []
+        for peer_id in peer_ids:
+            # Create commitment to peer_id (hide the actual value)
+            peer_commitment = hashlib.sha256(peer_id.encode()).hexdigest()
+            
+            # Find position in set (private input)
+            position = positions.get(peer_id, -1)
+            
+            prepared.append(ZKReadyData(
+                data_type="anonymity_set_membership",
+                values={
+                    "anonymity_set_size": set_size,
+                    "peer_position": position,
+                },
+                commitments={
+                    "peer_id": peer_commitment,
+                },
+                public_inputs={
+                    "merkle_root": merkle_root,
+                    "set_size": set_size,
+                },
+                private_inputs={
+                    "peer_id": peer_id,
+                    "position": position,
+                    "merkle_proof": self._compute_mock_merkle_proof(all_peer_ids, position),
+                }
+            ))
+        return prepared
     
     def prepare_unlinkability_data(
         self,
@@ -37,8 +37,14 @@ setup(
         "click>=8.1.0",
         "rich>=13.0.0",
         "pyyaml>=6.0",
+        "typing_extensions>=4.6; python_version<'3.12'",
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.9.0",
+            "blake3>=0.3.0",
+            "coincurve>=18.0.0",
+        ],
         "dev": [
             "pytest>=8.0.0",
             "pytest-trio>=0.8.0",
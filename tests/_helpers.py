@@ -0,0 +1,28 @@
+"""
+Shared helpers for tests that run real py-libp2p networks.
+
+Listeners and notifee callbacks complete asynchronously; these helpers
+poll for the actual condition instead of sleeping a fixed amount.
+"""
+import trio
+
+
+async def wait_for_listen_addr(network, timeout: float = 5.0):
+    """Return the network's first listen address once it is bound."""
+    with trio.fail_after(timeout):
+        while True:
+            if network.listeners:
+                listener = next(iter(network.listeners.values()))
+                addrs = listener.get_addrs()
+                if addrs:
+                    return addrs[0]
+            await trio.sleep(0.01)
+
+
+async def wait_for_connections(collector, count: int = 1, timeout: float = 5.0) -> bool:
+    """Wait until collector has recorded count connections; False on timeout."""
+    with trio.move_on_after(timeout):
+        while collector.total_connections < count:
+            await trio.sleep(0.01)
+        return True
+    return False
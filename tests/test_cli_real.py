@@ -177,7 +177,7 @@ def test_cli_analyze_html_output(tmp_path):
     assert output_file.exists(), "HTML file should be created"
     
     # Verify HTML content
-    html_content = output_file.read_text()
+    html_content = output_file.read_text(encoding="utf-8")
     assert "<html" in html_content.lower(), "Should be valid HTML"
     assert "privacy" in html_content.lower(), "Should contain privacy content"
     
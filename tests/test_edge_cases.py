@@ -14,17 +14,9 @@ from multiaddr import Multiaddr
 from libp2p_privacy_poc.metadata_collector import MetadataCollector
 from libp2p_privacy_poc.privacy_analyzer import PrivacyAnalyzer
 from libp2p_privacy_poc.report_generator import ReportGenerator
+from libp2p_privacy_poc.utils import mint_peer_id
 
-
-async def _wait_for_listen_addr(network, timeout: float = 5.0):
-    with trio.fail_after(timeout):
-        while True:
-            if network.listeners:
-                listener = next(iter(network.listeners.values()))
-                addrs = listener.get_addrs()
-                if addrs:
-                    return addrs[0]
-            await trio.sleep(0.05)
+from _helpers import wait_for_connections, wait_for_listen_addr
 
 
 @pytest.mark.trio
@@ -48,14 +40,12 @@ async def test_connection_failure_handling():
     
     async with background_trio_service(host.get_network()):
         await host.get_network().listen(Multiaddr("/ip4/127.0.0.1/tcp/0"))
-        await trio.sleep(0.5)
+        await wait_for_listen_addr(host.get_network())
         
         print("\n2. Attempting to connect to non-existent peer...")
         # Create a valid peer ID but point to non-existent address
         # (Generate valid peer ID format but unreachable endpoint)
-        temp_host = new_host()
-        valid_peer_id = temp_host.get_id()
-        await temp_host.close()
+        valid_peer_id = mint_peer_id()
         
         fake_peer_addr = Multiaddr(f"/ip4/127.0.0.1/tcp/9999/p2p/{valid_peer_id}")
         print(f"   Attempting connection to: {fake_peer_addr}")
@@ -109,17 +99,17 @@ async def test_reconnection_tracking():
             # Start listeners
             await host1.get_network().listen(Multiaddr("/ip4/127.0.0.1/tcp/0"))
             await host2.get_network().listen(Multiaddr("/ip4/127.0.0.1/tcp/0"))
-            await trio.sleep(0.5)
+            await wait_for_listen_addr(host1.get_network())
             
             # Get host2's address
-            actual_addr = await _wait_for_listen_addr(host2.get_network())
+            actual_addr = await wait_for_listen_addr(host2.get_network())
             full_addr = actual_addr.encapsulate(Multiaddr(f"/p2p/{host2.get_id()}"))
             
             # First connection
             print("\n2. Establishing first connection...")
             peer_info = info_from_p2p_addr(full_addr)
             await host1.connect(peer_info)
-            await trio.sleep(0.5)
+            await wait_for_connections(collector)
             
             stats1 = collector.get_statistics()
             print(f"   ✓ First connection: {stats1['total_connections']} connections")
@@ -176,12 +166,12 @@ async def test_rapid_connections_disconnections():
                     for peer in peer_hosts:
                         await peer.get_network().listen(Multiaddr("/ip4/127.0.0.1/tcp/0"))
                     
-                    await trio.sleep(0.5)
+                    await wait_for_listen_addr(main_host.get_network())
                     
                     # Make rapid connections
                     print("\n2. Making rapid connections...")
                     for peer in peer_hosts:
-                        actual_addr = await _wait_for_listen_addr(
+                        actual_addr = await wait_for_listen_addr(
                             peer.get_network()
                         )
                         full_addr = actual_addr.encapsulate(Multiaddr(f"/p2p/{peer.get_id()}"))
@@ -189,7 +179,7 @@ async def test_rapid_connections_disconnections():
                         await main_host.connect(info_from_p2p_addr(full_addr))
                         await trio.sleep(0.02)  # Very short interval
                     
-                    await trio.sleep(0.5)
+                    await wait_for_connections(collector, count=len(peer_hosts))
                     
                     # Check data collection
                     print("\n3. Verifying data integrity...")
@@ -238,7 +228,7 @@ async def test_empty_network_analysis():
     
     async with background_trio_service(host.get_network()):
         await host.get_network().listen(Multiaddr("/ip4/127.0.0.1/tcp/0"))
-        await trio.sleep(0.5)
+        await wait_for_listen_addr(host.get_network())
         
         # Check stats with no connections
         print("\n2. Checking statistics...")
@@ -302,10 +292,10 @@ async def test_connection_metadata_accuracy():
             # Start listeners
             await host1.get_network().listen(Multiaddr("/ip4/127.0.0.1/tcp/0"))
             await host2.get_network().listen(Multiaddr("/ip4/127.0.0.1/tcp/0"))
-            await trio.sleep(0.5)
+            await wait_for_listen_addr(host1.get_network())
             
             # Get host2's address
-            actual_addr = await _wait_for_listen_addr(host2.get_network())
+            actual_addr = await wait_for_listen_addr(host2.get_network())
             full_addr = actual_addr.encapsulate(Multiaddr(f"/p2p/{host2.get_id()}"))
             
             # Record start time
@@ -315,7 +305,7 @@ async def test_connection_metadata_accuracy():
             print("\n2. Establishing connection...")
             peer_info = info_from_p2p_addr(full_addr)
             await host1.connect(peer_info)
-            await trio.sleep(0.5)
+            await wait_for_connections(collector)
             
             # Record end time
             end_time = trio.current_time()
@@ -375,8 +365,6 @@ if __name__ == "__main__":
                 results.append((name, f"FAILED: {str(e)[:50]}"))
                 import traceback
                 traceback.print_exc()
-            
-            await trio.sleep(0.5)  # Brief delay between tests
         
         # Summary
         print("\n\n" + "=" * 70)
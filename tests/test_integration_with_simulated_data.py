@@ -9,8 +9,8 @@ initialization issues. See KNOWN_ISSUES.md. This test validates the
 complete privacy analysis pipeline using the same API that would be used
 with real connections.
 """
+import itertools
 import pytest
-import trio
 import time
 from libp2p import new_host
 from libp2p.peer.id import ID as PeerID
@@ -36,9 +36,10 @@ async def test_full_pipeline_with_simulated_events():
     host = new_host()
     print(f"   Host ID: {host.get_id()}")
     
-    # Attach collector
+    # Attach collector; a stepped clock spaces events 0.1s apart without sleeping
     print("\n2. Setting up MetadataCollector...")
-    collector = MetadataCollector(host)
+    ticks = itertools.count(start=1000.0, step=0.1)
+    collector = MetadataCollector(host, clock=lambda: next(ticks))
     
     # Simulate connection events
     print("\n3. Simulating connection events...")
@@ -55,7 +56,6 @@ async def test_full_pipeline_with_simulated_events():
     for i, peer_id in enumerate(peer_ids):
         multiaddr = Multiaddr(f"/ip4/127.0.0.1/tcp/{5000 + i}")
         collector.on_connection_opened(peer_id, multiaddr, "outbound")
-        await trio.sleep(0.1)  # Simulate timing
         
         # Simulate some streams
         collector.on_stream_opened(peer_id)
@@ -206,8 +206,7 @@ async def test_metadata_collector_api_integration():
     print("   ✓ on_connection_opened works")
     
     # Check active connections
-    active_conns = collector.get_active_connections()
-    assert len(active_conns) == 1
+    assert collector.active_connection_count() == 1
     print("   ✓ Active connections tracked")
     
     collector.on_stream_opened(test_peer)
@@ -223,7 +222,7 @@ async def test_metadata_collector_api_integration():
     print("   ✓ on_protocol_negotiated works")
     
     collector.on_connection_closed(test_peer, test_addr)
-    assert len(collector.get_active_connections()) == 0
+    assert collector.active_connection_count() == 0
     print("   ✓ on_connection_closed works")
     
     print("\n" + "=" * 60)
@@ -0,0 +1,259 @@
+"""
+Unit tests for MetadataCollector event bookkeeping.
+
+These tests drive the collector directly (no libp2p host) using string
+peer IDs, the same way the CLI simulation does.
+"""
+import subprocess
+import sys
+
+import pytest
+from multiaddr import Multiaddr
+
+from libp2p_privacy_poc.metadata_collector import MetadataCollector
+
+
+def test_connections_opened_batch_matches_single_events():
+    events = [
+        ("QmPeerA", Multiaddr("/ip4/10.0.0.1/tcp/4001"), "outbound"),
+        ("QmPeerB", Multiaddr("/ip4/10.0.0.2/tcp/4001"), "inbound"),
+        ("QmPeerA", Multiaddr("/ip4/10.0.0.1/tcp/4002"), "outbound"),
+    ]
+
+    single = MetadataCollector()
+    for peer_id, multiaddr, direction in events:
+        single.on_connection_opened(peer_id, multiaddr, direction)
+
+    batch = MetadataCollector()
+    batch.on_connections_opened_batch(events)
+
+    assert batch.get_statistics() == single.get_statistics()
+    assert len(batch.connections) == 3
+    assert len(batch.active_sessions) == 3
+    assert len(batch.connection_times) == 3
+    assert batch.peers["QmPeerA"].connection_count == 2
+    assert batch.peers["QmPeerA"].multiaddrs == {
+        "/ip4/10.0.0.1/tcp/4001",
+        "/ip4/10.0.0.1/tcp/4002",
+    }
+    assert {c.transport_type for c in batch.connections.values()} == {"tcp"}
+
+
+def test_connections_opened_batch_empty():
+    collector = MetadataCollector()
+    collector.on_connections_opened_batch([])
+
+    assert collector.total_connections == 0
+    assert not collector.peers
+
+
+def test_injected_clock_drives_event_timestamps():
+    ticks = iter([100.0, 100.5, 101.0])
+    collector = MetadataCollector(clock=lambda: next(ticks))
+
+    collector.on_connection_opened("QmPeerA", Multiaddr("/ip4/10.0.0.1/tcp/4001"), "outbound")
+    collector.on_connection_opened("QmPeerB", Multiaddr("/ip4/10.0.0.2/tcp/4001"), "outbound")
+    collector.on_connection_closed("QmPeerA", Multiaddr("/ip4/10.0.0.1/tcp/4001"))
+
+    assert collector.connection_times == [100.0, 100.5]
+    assert collector.disconnection_times == [101.0]
+    assert collector.connection_history[0].connection_duration == 1.0
+    assert collector.peers["QmPeerA"].first_seen == 100.0
+    assert collector.peers["QmPeerA"].last_seen == 101.0
+
+
+def test_explicit_timestamps_bypass_clock():
+    def clock():
+        raise AssertionError("clock should not be read")
+
+    collector = MetadataCollector(clock=clock)
+    collector.on_connection_opened(
+        "QmPeerA", Multiaddr("/ip4/10.0.0.1/tcp/4001"), "outbound", timestamp=5.0
+    )
+    collector.on_connections_opened_batch(
+        [
+            ("QmPeerB", Multiaddr("/ip4/10.0.0.2/tcp/4001"), "inbound"),
+            ("QmPeerC", Multiaddr("/ip4/10.0.0.3/tcp/4001"), "inbound"),
+        ],
+        timestamps=[5.1, 5.2],
+    )
+    collector.on_connection_closed("QmPeerA", Multiaddr("/ip4/10.0.0.1/tcp/4001"), timestamp=6.0)
+
+    assert collector.connection_times == [5.0, 5.1, 5.2]
+    assert collector.peers["QmPeerC"].last_seen == 5.2
+    assert collector.connection_history[0].timestamp_end == 6.0
+
+
+def test_protocols_negotiated_batch_matches_single_events():
+    protocols = ("/ipfs/id/1.0.0", "/ipfs/ping/1.0.0", "/ipfs/id/1.0.0")
+
+    single = MetadataCollector()
+    single.on_connection_opened("QmPeerA", Multiaddr("/ip4/10.0.0.1/tcp/4001"), "outbound")
+    for protocol in protocols:
+        single.on_protocol_negotiated("QmPeerA", protocol)
+
+    batch = MetadataCollector()
+    batch.on_connection_opened("QmPeerA", Multiaddr("/ip4/10.0.0.1/tcp/4001"), "outbound")
+    batch.on_protocols_negotiated_batch("QmPeerA", protocols)
+
+    assert dict(batch.protocol_usage) == dict(single.protocol_usage)
+    assert batch.peers["QmPeerA"].protocols == single.peers["QmPeerA"].protocols
+    (conn,) = batch.connections.values()
+    assert conn.protocols == ["/ipfs/id/1.0.0", "/ipfs/ping/1.0.0"]
+
+
+def test_collector_import_does_not_load_libp2p():
+    code = (
+        "import sys\n"
+        "from libp2p_privacy_poc.metadata_collector import MetadataCollector\n"
+        "MetadataCollector().on_connection_opened('QmPeer', '/ip4/10.0.0.1/tcp/4001', 'outbound')\n"
+        "assert not any(m == 'libp2p' or m.startswith('libp2p.') for m in sys.modules)\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_first_peer_id_and_peer_count():
+    collector = MetadataCollector()
+    assert collector.first_peer_id() is None
+    assert collector.peer_count() == 0
+
+    collector.on_connection_opened("QmPeerA", "/ip4/10.0.0.1/tcp/4001", "outbound")
+    collector.on_connection_opened("QmPeerB", "/ip4/10.0.0.2/tcp/4001", "inbound")
+    collector.on_connection_opened("QmPeerA", "/ip4/10.0.0.1/tcp/4002", "outbound")
+
+    assert collector.first_peer_id() == "QmPeerA"
+    assert collector.peer_count() == 2
+
+
+def test_active_connection_count_and_first_active_connection():
+    collector = MetadataCollector()
+    assert collector.active_connection_count() == 0
+    assert collector.first_active_connection() is None
+
+    collector.on_connection_opened("QmPeerA", "/ip4/10.0.0.1/tcp/4001", "outbound", timestamp=1.0)
+    collector.on_connection_opened("QmPeerB", "/ip4/10.0.0.2/tcp/4001", "inbound", timestamp=2.0)
+    collector.on_connection_closed("QmPeerA", "/ip4/10.0.0.1/tcp/4001", timestamp=3.0)
+
+    assert collector.active_connection_count() == len(collector.get_active_connections()) == 1
+    assert collector.first_active_connection().peer_id == "QmPeerB"
+
+
+def test_streams_opened_matches_repeated_single_events():
+    single = MetadataCollector()
+    counted = MetadataCollector()
+    for collector in (single, counted):
+        collector.on_connection_opened("QmPeerA", "/ip4/10.0.0.1/tcp/4001", "outbound")
+        collector.on_connection_opened("QmPeerB", "/ip4/10.0.0.2/tcp/4001", "inbound")
+
+    for _ in range(3):
+        single.on_stream_opened("QmPeerA")
+    counted.on_streams_opened("QmPeerA", 3)
+    counted.on_streams_opened("QmPeerB", 0)
+
+    assert [c.stream_count for c in counted.get_active_connections()] == [
+        c.stream_count for c in single.get_active_connections()
+    ] == [3, 0]
+
+
+def test_ingest_batch_matches_individual_calls():
+    addr_a = Multiaddr("/ip4/10.0.0.1/tcp/4001")
+    addr_b = Multiaddr("/ip4/10.0.0.2/tcp/4001")
+
+    single = MetadataCollector()
+    single.on_connection_opened("QmPeerA", addr_a, "outbound", timestamp=1.0)
+    single.on_connection_opened("QmPeerB", addr_b, "inbound", timestamp=2.0)
+    single.on_protocol_negotiated("QmPeerA", "/ipfs/id/1.0.0")
+    single.on_streams_opened("QmPeerA", 2)
+    single.on_connection_closed("QmPeerB", addr_b, timestamp=3.0)
+
+    batched = MetadataCollector()
+    batched.ingest_batch([
+        ("conn_open", "QmPeerA", addr_a, "outbound", 1.0),
+        ("conn_open", "QmPeerB", addr_b, "inbound", 2.0),
+        ("protocol", "QmPeerA", "/ipfs/id/1.0.0"),
+        ("streams", "QmPeerA", 2),
+        ("conn_close", "QmPeerB", addr_b, 3.0),
+    ])
+
+    assert batched.export_data() == single.export_data()
+
+
+def test_ingest_batch_keeps_same_peer_connections_distinct():
+    collector = MetadataCollector(clock=lambda: 5.0)
+    addr = "/ip4/10.0.0.1/tcp/4001"
+
+    collector.ingest_batch([
+        ("conn_open", "QmPeerA", addr, "outbound"),
+        ("protocol", "QmPeerA", "/ipfs/id/1.0.0"),
+        ("conn_open", "QmPeerA", addr, "outbound"),
+    ])
+
+    assert collector.get_statistics()["active_connections"] == 2
+
+
+def test_same_peer_reopening_at_same_time_keeps_connections_distinct():
+    collector = MetadataCollector(clock=lambda: 5.0)
+    addr = Multiaddr("/ip4/10.0.0.1/tcp/4001")
+
+    collector.on_connection_opened("QmPeerA", addr, "outbound")
+    collector.on_connection_opened("QmPeerA", addr, "outbound")
+
+    stats = collector.get_statistics()
+    assert stats["total_connections"] == 2
+    assert stats["active_connections"] == 2
+    assert len(collector.connections) == 2
+
+
+def test_ingest_batch_rejects_unknown_events():
+    with pytest.raises(ValueError):
+        MetadataCollector().ingest_batch([("bogus", "QmPeerA")])
+
+
+def test_peer_events_only_touch_that_peers_open_connections():
+    collector = MetadataCollector()
+    addr = "/ip4/10.0.0.1/tcp/4001"
+    collector.on_connection_opened("QmPeerA", addr, "outbound", timestamp=1.0)
+    collector.on_connection_opened("QmPeerA", addr, "outbound", timestamp=2.0)
+    collector.on_connection_opened("QmPeerB", addr, "inbound", timestamp=3.0)
+
+    # Closing releases the peer's oldest open connection first
+    collector.on_connection_closed("QmPeerA", addr, timestamp=4.0)
+    collector.on_streams_opened("QmPeerA", 2)
+    collector.record_data_transfer("QmPeerA", 10, 20)
+
+    (closed,) = collector.connection_history
+    assert closed.timestamp_start == 1.0
+    assert closed.stream_count == 0
+    assert [(c.peer_id, c.stream_count, c.bytes_sent) for c in collector.get_active_connections()] == [
+        ("QmPeerA", 2, 10),
+        ("QmPeerB", 0, 0),
+    ]
+
+    collector.on_connection_closed("QmPeerC", addr, timestamp=5.0)
+    assert collector.total_disconnections == 1
+
+
+def test_protocol_ids_are_shared_across_peers():
+    collector = MetadataCollector()
+    collector.on_connection_opened("QmPeerA", "/ip4/10.0.0.1/tcp/4001", "outbound")
+    collector.on_connection_opened("QmPeerB", "/ip4/10.0.0.2/tcp/4001", "inbound")
+
+    collector.on_protocol_negotiated("QmPeerA", "".join(["/ipfs/id/", "1.0.0"]))
+    collector.on_protocols_negotiated_batch("QmPeerB", ["".join(["/ipfs/id/", "1.0.0"])])
+
+    (proto_a,) = collector.peers["QmPeerA"].protocols
+    (proto_b,) = collector.peers["QmPeerB"].protocols
+    assert proto_a is proto_b
+    assert collector.protocol_usage == {"/ipfs/id/1.0.0": 2}
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+def test_metadata_records_use_slots():
+    collector = MetadataCollector()
+    collector.on_connection_opened("QmPeerA", "/ip4/10.0.0.1/tcp/4001", "outbound")
+
+    (conn,) = collector.connections.values()
+    for record in (conn, collector.peers["QmPeerA"]):
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(AttributeError):
+            record.unexpected = True
@@ -0,0 +1,256 @@
+"""
+Unit tests for the mock ZK proof system.
+"""
+
+from libp2p_privacy_poc.mock_zk_proofs import MockZKProofSystem
+
+
+def test_identical_requests_generate_fresh_proofs():
+    ticks = iter(range(100))
+    zk_system = MockZKProofSystem(clock=lambda: float(next(ticks)))
+
+    first = zk_system.generate_timing_independence_proof("connection_1", "connection_2", 0.01)
+    second = zk_system.generate_timing_independence_proof("connection_1", "connection_2", 0.01)
+
+    assert second is not first
+    assert (first.timestamp, second.timestamp) == (0.0, 1.0)
+    assert zk_system.generated_proofs == [first, second]
+    assert zk_system.get_proof_statistics()["total_proofs"] == 2
+    second.public_inputs["independence_threshold"] = 0.5
+    assert first.public_inputs["independence_threshold"] == 0.05
+
+
+def test_different_arguments_generate_distinct_proofs():
+    zk_system = MockZKProofSystem()
+
+    first = zk_system.generate_anonymity_set_proof(peer_id="QmPeerA", anonymity_set_size=10)
+    second = zk_system.generate_anonymity_set_proof(peer_id="QmPeerB", anonymity_set_size=10)
+
+    assert second is not first
+    assert zk_system.get_proof_statistics()["total_proofs"] == 2
+
+
+def test_verify_proofs_batch_reports_each_result():
+    zk_system = MockZKProofSystem()
+    valid = zk_system.generate_unlinkability_proof("session_a", "session_b")
+    invalid = zk_system.generate_unlinkability_proof("session_a", "session_c", are_unlinkable=False)
+    foreign = zk_system.generate_range_proof("latency_ms", 0, 100)
+    foreign.mock_verification_key = "not-a-key"
+
+    results = zk_system.verify_proofs_batch([valid, invalid, foreign])
+
+    assert results == [True, False, False]
+    assert results == [zk_system.verify_proof(p) for p in (valid, invalid, foreign)]
+
+
+def test_invalid_proof_is_rejected_after_its_valid_twin():
+    zk_system = MockZKProofSystem(clock=lambda: 5.0)
+    valid = zk_system.generate_unlinkability_proof("session_a", "session_b")
+    invalid = zk_system.generate_unlinkability_proof("session_a", "session_b", are_unlinkable=False)
+
+    assert zk_system.verify_proof(valid)
+    assert not zk_system.verify_proof(invalid)
+    assert zk_system.verify_proofs_batch([valid, invalid]) == [True, False]
+
+
+def test_verification_reflects_later_changes_to_the_proof():
+    zk_system = MockZKProofSystem()
+    proof = zk_system.generate_anonymity_set_proof(peer_id="QmPeerA", anonymity_set_size=5)
+
+    assert zk_system.verify_proof(proof)
+    proof.is_valid = False
+    assert not zk_system.verify_proof(proof)
+    assert zk_system.verify_proofs_batch([proof]) == [zk_system.batch_verify([proof])]
+
+
+def test_mock_proof_hash_is_stable(monkeypatch):
+    import hashlib
+    import struct
+
+    from libp2p_privacy_poc import mock_zk_proofs
+    from libp2p_privacy_poc.mock_zk_proofs import MockZKProof, ZKProofType
+
+    monkeypatch.setattr(mock_zk_proofs, "_fast_hash", hashlib.sha256)
+    proof = MockZKProof(ZKProofType.RANGE_PROOF, "claim", 1700000000.25)
+
+    expected = hashlib.sha256(
+        b"range_proof_claim_" + struct.pack("<d", 1700000000.25)
+    ).hexdigest()
+    assert proof.mock_proof_hash == expected
+
+
+def test_verification_keys_are_per_type_and_per_system():
+    import hashlib
+
+    from libp2p_privacy_poc.mock_zk_proofs import ZKProofType
+
+    first, second = MockZKProofSystem(), MockZKProofSystem()
+    expected = hashlib.sha256(b"vk_range_proof").hexdigest()
+
+    assert first.verification_keys[ZKProofType.RANGE_PROOF] == expected
+    assert first.generate_range_proof("x", 0, 1).mock_verification_key == expected
+
+    first.verification_keys[ZKProofType.RANGE_PROOF] = "rotated"
+    assert second.verification_keys[ZKProofType.RANGE_PROOF] == expected
+
+
+def test_mock_proof_hash_follows_proof_fields():
+    from libp2p_privacy_poc.mock_zk_proofs import MockZKProof, ZKProofType
+
+    proof = MockZKProof(ZKProofType.EQUALITY_PROOF, "claim", 1.0)
+    first = proof.mock_proof_hash
+    assert first and proof.mock_proof_hash == first
+
+    proof.claim = "other claim"
+    assert proof.mock_proof_hash != first
+    proof.claim = "claim"
+    proof.timestamp = 2.0
+    assert proof.mock_proof_hash != first
+
+    explicit = MockZKProof(ZKProofType.EQUALITY_PROOF, "claim", 1.0, mock_proof_hash="given")
+    explicit.claim = "other claim"
+    assert explicit.mock_proof_hash == "given"
+
+
+def test_proof_statistics_track_generated_proofs():
+    zk_system = MockZKProofSystem()
+    zk_system.generate_range_proof("latency_ms", 0, 100)
+    zk_system.generate_range_proof("latency_ms", 0, 100)
+    zk_system.generate_range_proof("peer_count", 0, 50)
+    zk_system.generate_unlinkability_proof("session_a", "session_b", are_unlinkable=False)
+
+    stats = zk_system.get_proof_statistics()
+
+    assert stats["total_proofs"] == 4
+    assert stats["by_type"]["range_proof"] == 3
+    assert stats["by_type"]["session_unlinkability"] == 1
+    assert stats["by_type"]["timing_independence"] == 0
+    assert stats["all_valid"] is False
+
+
+def test_proof_statistics_reflect_later_changes():
+    zk_system = MockZKProofSystem()
+    proof = zk_system.generate_range_proof("latency_ms", 0, 100)
+    zk_system.generate_unlinkability_proof("session_a", "session_b")
+
+    proof.is_valid = False
+    assert zk_system.get_proof_statistics()["all_valid"] is False
+
+    zk_system.generated_proofs.pop()
+    stats = zk_system.get_proof_statistics()
+    assert stats["total_proofs"] == 1
+    assert stats["by_type"]["session_unlinkability"] == 0
+
+
+def test_batch_verify_agrees_with_verify_proof():
+    zk_system = MockZKProofSystem()
+    valid = [zk_system.generate_range_proof(f"value_{i}", 0, 10) for i in range(3)]
+    invalid = zk_system.generate_unlinkability_proof("session_a", "session_b", are_unlinkable=False)
+    foreign = zk_system.generate_range_proof("latency_ms", 0, 100)
+    foreign.mock_verification_key = "not-a-key"
+
+    assert zk_system.batch_verify(valid)
+    assert zk_system.batch_verify([])
+    assert not zk_system.batch_verify(valid + [invalid])
+    assert not zk_system.batch_verify(valid + [foreign])
+
+
+def test_export_proofs_reflects_current_proofs():
+    zk_system = MockZKProofSystem()
+    proof = zk_system.generate_range_proof("latency_ms", 0, 100)
+
+    first = zk_system.export_proofs()
+    first[0]["claim"] = "tampered"
+    proof.is_valid = False
+    zk_system.generate_range_proof("peer_count", 0, 50)
+    second = zk_system.export_proofs()
+
+    assert len(second) == 2
+    assert second[0]["claim"] == proof.claim
+    assert second[0]["is_valid"] is False
+    assert second == [p.to_dict() for p in zk_system.generated_proofs]
+
+
+def test_injected_clock_drives_proof_timestamps():
+    zk_system = MockZKProofSystem(clock=lambda: 42.0)
+
+    proof = zk_system.generate_timing_independence_proof("connection_1", "connection_2", 0.5)
+
+    assert proof.timestamp == 42.0
+
+
+def test_mock_proofs_round_trip_through_pickle():
+    import pickle
+
+    zk_system = MockZKProofSystem()
+    proof = zk_system.generate_anonymity_set_proof(peer_id="QmPeerA", anonymity_set_size=5)
+
+    restored = pickle.loads(pickle.dumps(proof))
+
+    assert restored == proof
+    assert restored.mock_proof_hash == proof.mock_proof_hash
+    assert zk_system.verify_proof(restored)
+
+
+def test_generate_routes_by_proof_type_value():
+    import pytest
+
+    zk_system = MockZKProofSystem(clock=lambda: 42.0)
+
+    proof = zk_system.generate("range_proof", value_name="latency_ms", min_value=0, max_value=100)
+
+    assert proof.to_dict() == zk_system.generate_range_proof("latency_ms", 0, 100).to_dict()
+    with pytest.raises(ValueError):
+        zk_system.generate("equality_proof")
+
+
+def test_static_proof_data_serializes_like_before():
+    import json
+
+    zk_system = MockZKProofSystem()
+    first = zk_system.generate_anonymity_set_proof(peer_id="QmPeerA", anonymity_set_size=5)
+    second = zk_system.generate_anonymity_set_proof(peer_id="QmPeerB", anonymity_set_size=5)
+
+    exported = json.loads(json.dumps(first.to_dict()))
+    assert exported["proof_data"]["mock_proof_path"] == ["mock_hash_1", "mock_hash_2", "mock_hash_3"]
+    assert first.proof_data["mock_proof_path"] is second.proof_data["mock_proof_path"]
+
+
+def test_verification_rejects_malformed_keys():
+    zk_system = MockZKProofSystem()
+    proofs = [zk_system.generate_range_proof(f"value_{i}", 0, 10) for i in range(3)]
+    proofs[0].mock_verification_key = None
+    proofs[1].mock_verification_key = "ключ"
+    proofs[2].mock_verification_key = zk_system.verification_keys[proofs[2].proof_type][:-1]
+
+    assert zk_system.verify_proofs_batch(proofs) == [False, False, False]
+    assert not zk_system.batch_verify(proofs)
+
+
+def test_reset_drops_generated_proofs():
+    zk_system = MockZKProofSystem()
+    proof = zk_system.generate_unlinkability_proof("session_a", "session_b", are_unlinkable=False)
+    zk_system.export_proofs()
+
+    zk_system.reset()
+
+    stats = zk_system.get_proof_statistics()
+    assert stats["total_proofs"] == 0 and stats["all_valid"] is True
+    assert zk_system.export_proofs() == []
+    assert zk_system.generate_unlinkability_proof("session_a", "session_b", are_unlinkable=False) is not proof
+
+
+def test_bulk_anonymity_set_proofs_match_single_generation():
+    ticks = iter(range(100))
+    zk_system = MockZKProofSystem(clock=lambda: float(next(ticks)))
+    existing = zk_system.generate_anonymity_set_proof(peer_id="QmPeer1", anonymity_set_size=3)
+
+    proofs = zk_system.generate_anonymity_set_proofs(["QmPeer0", "QmPeer1", "QmPeer2"], 3)
+
+    assert proofs[1] is not existing
+    assert {p.timestamp for p in proofs} == {1.0}
+    assert zk_system.get_proof_statistics()["total_proofs"] == 4
+    single = MockZKProofSystem().generate_anonymity_set_proof(peer_id="QmPeer0", anonymity_set_size=3)
+    assert proofs[0].proof_data == single.proof_data
+    assert proofs[0].claim == single.claim
+    assert zk_system.batch_verify(proofs)
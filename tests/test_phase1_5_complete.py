@@ -29,6 +29,8 @@ from libp2p_privacy_poc.report_generator import ReportGenerator
 from libp2p_privacy_poc.mock_zk_proofs import MockZKProofSystem
 from libp2p_privacy_poc.utils import get_peer_listening_address
 
+from _helpers import wait_for_connections, wait_for_listen_addr
+
 
 def _cli_command():
     cli_path = shutil.which("libp2p-privacy")
@@ -37,17 +39,6 @@ def _cli_command():
     return [sys.executable, "-m", "libp2p_privacy_poc.cli"]
 
 
-async def _wait_for_listen_addr(network, timeout: float = 5.0):
-    with trio.fail_after(timeout):
-        while True:
-            if network.listeners:
-                listener = next(iter(network.listeners.values()))
-                addrs = listener.get_addrs()
-                if addrs:
-                    return addrs[0]
-            await trio.sleep(0.05)
-
-
 class TestPhase15CoreFunctionality:
     """Test core functionality with real networks."""
     
@@ -86,15 +77,16 @@ class TestPhase15CoreFunctionality:
         # Attach collector (should register as INotifee)
         collector = MetadataCollector(host1)
         
-        async with background_trio_service(host1.get_network()):
-            async with background_trio_service(host2.get_network()):
-                await host1.get_network().listen(Multiaddr("/ip4/127.0.0.1/tcp/0"))
-                await host2.get_network().listen(Multiaddr("/ip4/127.0.0.1/tcp/0"))
+        network1 = host1.get_network()
+        network2 = host2.get_network()
+        async with background_trio_service(network1):
+            async with background_trio_service(network2):
+                await network1.listen(Multiaddr("/ip4/127.0.0.1/tcp/0"))
+                await network2.listen(Multiaddr("/ip4/127.0.0.1/tcp/0"))
                 
                 # Wait for listeners
-                await trio.sleep(0.5)
-                await _wait_for_listen_addr(host1.get_network())
-                await _wait_for_listen_addr(host2.get_network())
+                await wait_for_listen_addr(network1)
+                await wait_for_listen_addr(network2)
                 
                 # Connect
                 peer_addr = get_peer_listening_address(host2)
@@ -104,7 +96,7 @@ class TestPhase15CoreFunctionality:
                     await host1.connect(peer_info)
                 
                 # Wait for event propagation
-                await trio.sleep(0.5)
+                await wait_for_connections(collector)
                 
                 # Events should be captured automatically (no manual on_connection_opened call)
                 stats = collector.get_statistics()
@@ -124,13 +116,14 @@ class TestPhase15CoreFunctionality:
         host2 = new_host()
         collector = MetadataCollector(host1)
         
-        async with background_trio_service(host1.get_network()):
-            async with background_trio_service(host2.get_network()):
-                await host1.get_network().listen(Multiaddr("/ip4/127.0.0.1/tcp/0"))
-                await host2.get_network().listen(Multiaddr("/ip4/127.0.0.1/tcp/0"))
-                await trio.sleep(0.5)
-                await _wait_for_listen_addr(host1.get_network())
-                await _wait_for_listen_addr(host2.get_network())
+        network1 = host1.get_network()
+        network2 = host2.get_network()
+        async with background_trio_service(network1):
+            async with background_trio_service(network2):
+                await network1.listen(Multiaddr("/ip4/127.0.0.1/tcp/0"))
+                await network2.listen(Multiaddr("/ip4/127.0.0.1/tcp/0"))
+                await wait_for_listen_addr(network1)
+                await wait_for_listen_addr(network2)
                 
                 peer_addr = get_peer_listening_address(host2)
                 peer_info = info_from_p2p_addr(peer_addr)
@@ -138,7 +131,7 @@ class TestPhase15CoreFunctionality:
                 with trio.fail_after(5):
                     await host1.connect(peer_info)
                 
-                await trio.sleep(0.5)
+                await wait_for_connections(collector)
                 
                 # Run privacy analysis
                 analyzer = PrivacyAnalyzer(collector)
@@ -170,9 +163,8 @@ class TestPhase15CoreFunctionality:
                     for node in nodes:
                         await node.get_network().listen(Multiaddr("/ip4/127.0.0.1/tcp/0"))
                     
-                    await trio.sleep(0.5)
                     for node in nodes:
-                        await _wait_for_listen_addr(node.get_network())
+                        await wait_for_listen_addr(node.get_network())
                     
                     # Connect in star topology (node 0 is hub)
                     for i in range(1, 3):
@@ -182,7 +174,9 @@ class TestPhase15CoreFunctionality:
                         with trio.fail_after(5):
                             await nodes[0].connect(peer_info)
                     
-                    await trio.sleep(0.5)
+                    await wait_for_connections(collectors[0], count=2)
+                    for collector in collectors[1:]:
+                        await wait_for_connections(collector)
                     
                     # Validate each node captured different perspective
                     stats = [c.get_statistics() for c in collectors]
@@ -208,9 +202,10 @@ class TestPhase15CoreFunctionality:
         collector = MetadataCollector(host)
         
         # Create some data
-        async with background_trio_service(host.get_network()):
-            await host.get_network().listen(Multiaddr("/ip4/127.0.0.1/tcp/0"))
-            await trio.sleep(0.5)
+        network = host.get_network()
+        async with background_trio_service(network):
+            await network.listen(Multiaddr("/ip4/127.0.0.1/tcp/0"))
+            await wait_for_listen_addr(network)
             
             # Analyze
             report = PrivacyAnalyzer(collector).analyze()
@@ -247,10 +242,10 @@ class TestPhase15UtilityFunctions:
         
         host = new_host()
         
-        async with background_trio_service(host.get_network()):
-            await host.get_network().listen(Multiaddr("/ip4/127.0.0.1/tcp/0"))
-            await trio.sleep(0.5)
-            await _wait_for_listen_addr(host.get_network())
+        network = host.get_network()
+        async with background_trio_service(network):
+            await network.listen(Multiaddr("/ip4/127.0.0.1/tcp/0"))
+            await wait_for_listen_addr(network)
             
             # Should get full address including peer ID
             peer_addr = get_peer_listening_address(host)
@@ -274,9 +269,10 @@ class TestPhase15EdgeCases:
         host = new_host()
         collector = MetadataCollector(host)
         
-        async with background_trio_service(host.get_network()):
-            await host.get_network().listen(Multiaddr("/ip4/127.0.0.1/tcp/0"))
-            await trio.sleep(0.5)
+        network = host.get_network()
+        async with background_trio_service(network):
+            await network.listen(Multiaddr("/ip4/127.0.0.1/tcp/0"))
+            await wait_for_listen_addr(network)
             
             # Analyze without any connections
             analyzer = PrivacyAnalyzer(collector)
@@ -301,8 +297,9 @@ class TestPhase15EdgeCases:
         host = new_host()
         collector = MetadataCollector(host)
         
-        async with background_trio_service(host.get_network()):
-            await host.get_network().listen(Multiaddr("/ip4/127.0.0.1/tcp/0"))
+        network = host.get_network()
+        async with background_trio_service(network):
+            await network.listen(Multiaddr("/ip4/127.0.0.1/tcp/0"))
             
             # Try to connect to non-existent peer (should timeout)
             fake_addr = Multiaddr("/ip4/127.0.0.1/tcp/9999")
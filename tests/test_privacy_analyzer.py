@@ -0,0 +1,86 @@
+"""
+Unit tests for PrivacyAnalyzer timing analysis and risk scoring.
+"""
+
+import statistics
+
+from libp2p_privacy_poc.metadata_collector import MetadataCollector
+from libp2p_privacy_poc.privacy_analyzer import PrivacyAnalyzer, PrivacyReport, PrivacyRisk
+
+
+def _collector_with_times(times):
+    collector = MetadataCollector()
+    for i, timestamp in enumerate(times):
+        collector.on_connection_opened(
+            f"QmPeer{i}", f"/ip4/127.0.0.1/tcp/{4000 + i}", "outbound", timestamp=timestamp
+        )
+    return collector
+
+
+def test_timing_analysis_matches_statistics_module():
+    times = [0.0, 0.4, 1.5, 1.9, 3.7, 4.0]
+    intervals = [b - a for a, b in zip(times, times[1:])]
+
+    report = PrivacyAnalyzer(_collector_with_times(times)).analyze()
+
+    timing = report.timing_analysis
+    assert abs(timing["mean_interval"] - statistics.mean(intervals)) < 1e-12
+    assert abs(timing["stdev_interval"] - statistics.stdev(intervals)) < 1e-12
+    assert timing["median_interval"] == statistics.median(intervals)
+    assert timing["total_intervals"] == len(intervals)
+
+
+def test_regular_timing_is_flagged():
+    times = [i * 0.5 for i in range(6)]
+
+    report = PrivacyAnalyzer(_collector_with_times(times)).analyze()
+
+    timing_risks = [r for r in report.risks if r.risk_type == "Timing Correlation"]
+    assert any("Regular connection timing" in r.description for r in timing_risks)
+
+
+def test_risks_by_type_reflect_the_current_risk_list():
+    times = [i * 0.5 for i in range(6)]
+
+    report = PrivacyAnalyzer(_collector_with_times(times)).analyze()
+
+    timing_risks = report.get_risks_by_type("Timing Correlation")
+    assert timing_risks and timing_risks == [r for r in report.risks if r.risk_type == "Timing Correlation"]
+    assert report.get_risks_by_type("No Such Risk") == []
+
+    extra = PrivacyRisk(risk_type="Custom Risk", severity="low", description="Added by hand")
+    report.risks.append(extra)
+    assert report.get_risks_by_type("Custom Risk") == [extra]
+
+
+def test_risk_level_thresholds_are_inclusive():
+    expected = {
+        0.0: "LOW",
+        0.2499: "LOW",
+        0.25: "MEDIUM",
+        0.4999: "MEDIUM",
+        0.5: "HIGH",
+        0.7499: "HIGH",
+        0.75: "CRITICAL",
+        1.0: "CRITICAL",
+    }
+    for score, level in expected.items():
+        report = PrivacyReport(timestamp=0.0, overall_risk_score=score)
+        assert report.get_risk_level() == level, score
+
+
+def test_analyze_collector_matches_instance_analyze():
+    collector = _collector_with_times([0.0, 1.0, 2.0, 3.0])
+
+    via_classmethod = PrivacyAnalyzer.analyze_collector(collector)
+    via_instance = PrivacyAnalyzer(collector).analyze()
+
+    assert via_classmethod.overall_risk_score == via_instance.overall_risk_score
+    assert [r.risk_type for r in via_classmethod.risks] == [r.risk_type for r in via_instance.risks]
+
+
+def test_thresholds_can_be_tuned_per_instance():
+    analyzer = PrivacyAnalyzer(MetadataCollector())
+    analyzer.MIN_ANONYMITY_SET_SIZE = 1
+
+    assert PrivacyAnalyzer.MIN_ANONYMITY_SET_SIZE == 10
@@ -15,16 +15,7 @@ from libp2p_privacy_poc.metadata_collector import MetadataCollector
 from libp2p_privacy_poc.privacy_analyzer import PrivacyAnalyzer
 from libp2p_privacy_poc.report_generator import ReportGenerator
 
-
-async def _wait_for_listen_addr(network, timeout: float = 5.0):
-    with trio.fail_after(timeout):
-        while True:
-            if network.listeners:
-                listener = next(iter(network.listeners.values()))
-                addrs = listener.get_addrs()
-                if addrs:
-                    return addrs[0]
-            await trio.sleep(0.05)
+from _helpers import wait_for_connections, wait_for_listen_addr
 
 
 @pytest.mark.trio
@@ -35,10 +26,10 @@ async def test_real_connections():
     print("Using background_trio_service() pattern from py-libp2p tests")
     print("=" * 70)
     
-    # Create two hosts with explicit listen addresses
+    # Create two hosts on ephemeral ports; the bound address is read back
     print("\n1. Creating hosts...")
-    listen_addr1 = Multiaddr("/ip4/127.0.0.1/tcp/10000")
-    listen_addr2 = Multiaddr("/ip4/127.0.0.1/tcp/10001")
+    listen_addr1 = Multiaddr("/ip4/127.0.0.1/tcp/0")
+    listen_addr2 = Multiaddr("/ip4/127.0.0.1/tcp/0")
     
     host1 = new_host(listen_addrs=[listen_addr1])
     host2 = new_host(listen_addrs=[listen_addr2])
@@ -64,7 +55,8 @@ async def test_real_connections():
             await network2.listen(listen_addr2)
             
             # Wait for listeners to be ready
-            await trio.sleep(1.0)
+            await wait_for_listen_addr(network1)
+            await wait_for_listen_addr(network2)
             
             # Check listeners
             print(f"   Host1 listeners: {len(network1.listeners)}")
@@ -74,7 +66,7 @@ async def test_real_connections():
                 print("   ✅ SUCCESS! Listeners started!")
                 
                 # Get actual address (wait until listener exposes addrs)
-                actual_addr = await _wait_for_listen_addr(network1)
+                actual_addr = await wait_for_listen_addr(network1)
                 full_addr = actual_addr.encapsulate(Multiaddr(f"/p2p/{host1.get_id()}"))
                 print(f"   Host1 listening on: {actual_addr}")
                 
@@ -86,7 +78,7 @@ async def test_real_connections():
                     print("   ✅ CONNECTION SUCCESSFUL!")
                     
                     # Check collector
-                    await trio.sleep(0.5)
+                    await wait_for_connections(collector)
                     stats = collector.get_statistics()
                     print(f"\n6. MetadataCollector Statistics:")
                     print(f"   Total connections: {stats['total_connections']}")
@@ -123,8 +115,7 @@ async def test_real_connections():
                         
                 except Exception as e:
                     print(f"   ✗ Connection failed: {e}")
-                    import traceback
-                    traceback.print_exc()
+                    raise
             else:
                 print("   ✗ Listeners still not starting")
                 print("   This is unexpected with background_trio_service")
@@ -4,7 +4,9 @@ Tests for report data source labeling.
 
 import json
 
-from libp2p_privacy_poc.privacy_analyzer import PrivacyReport
+import numpy as np
+
+from libp2p_privacy_poc.privacy_analyzer import PrivacyReport, PrivacyRisk
 from libp2p_privacy_poc.report_generator import ReportGenerator
 
 
@@ -33,6 +35,18 @@ def test_json_report_includes_data_source():
     assert data["data_source"] == "REAL"
 
 
+def test_json_bytes_match_json_report():
+    report = PrivacyReport(timestamp=0.0, overall_risk_score=0.0)
+    report.timing_analysis = {"mean_interval": np.float64(0.5)}
+    report_gen = ReportGenerator()
+
+    encoded = report_gen.generate_json_bytes(report, data_source="REAL")
+
+    assert isinstance(encoded, bytes)
+    assert encoded.decode("utf-8") == report_gen.generate_json_report(report, data_source="REAL")
+    assert json.loads(encoded)["privacy_report"]["timing_analysis"]["mean_interval"] == 0.5
+
+
 def test_html_report_includes_data_source():
     report = PrivacyReport(timestamp=0.0, overall_risk_score=0.0)
     report_gen = ReportGenerator()
@@ -44,3 +58,53 @@ def test_html_report_includes_data_source():
 
     assert "Data Source:" in html_report
     assert "SIMULATED" in html_report
+
+
+def test_iter_html_report_chunks_join_to_full_report():
+    report = PrivacyReport(timestamp=0.0, overall_risk_score=0.6)
+    report.risks = [
+        PrivacyRisk(risk_type="Timing Correlation", severity="medium", description="a", confidence=0.8),
+        PrivacyRisk(risk_type="Peer Linkability", severity="high", description="b", confidence=0.9),
+    ]
+    report_gen = ReportGenerator()
+
+    chunks = list(report_gen.iter_html_report(report, data_source="REAL"))
+
+    assert len(chunks) > 1
+    assert "".join(chunks) == report_gen.generate_html_report(report, data_source="REAL")
+
+
+def test_generate_all_includes_data_source_in_every_format():
+    report = PrivacyReport(timestamp=0.0, overall_risk_score=0.0)
+    report_gen = ReportGenerator()
+
+    reports = report_gen.generate_all(report, data_source="REAL")
+
+    assert set(reports) == {"console", "json", "html"}
+    assert "Data Source: REAL" in reports["console"]
+    assert json.loads(reports["json"])["data_source"] == "REAL"
+    assert "REAL" in reports["html"]
+
+
+def test_json_report_falls_back_to_stdlib_json(monkeypatch):
+    from libp2p_privacy_poc import report_generator
+
+    monkeypatch.setattr(report_generator, "orjson", None)
+    report = PrivacyReport(timestamp=0.0, overall_risk_score=0.0)
+
+    json_report = ReportGenerator().generate_json_report(report, data_source="REAL")
+
+    assert json.loads(json_report)["data_source"] == "REAL"
+
+
+def test_generate_all_with_process_pool_matches_serial():
+    from concurrent.futures import ProcessPoolExecutor
+
+    report = PrivacyReport(timestamp=0.0, overall_risk_score=0.0)
+    report_gen = ReportGenerator()
+
+    serial = report_gen.generate_all(report, data_source="SIMULATED")
+    with ProcessPoolExecutor(max_workers=3) as executor:
+        pooled = report_gen.generate_all(report, data_source="SIMULATED", executor=executor)
+
+    assert pooled == serial
@@ -0,0 +1,18 @@
+"""
+Unit tests for ZKDataPreparator circuit-input preparation.
+"""
+
+from libp2p_privacy_poc.zk_integration import ZKDataPreparator
+
+
+def test_anonymity_set_batch_matches_single_preparation():
+    preparator = ZKDataPreparator()
+    anonymity_set = ["QmPeerC", "QmPeerA", "QmPeerB", "QmPeerA"]
+    queried = ["QmPeerA", "QmPeerB", "QmOutsider"]
+
+    batch = preparator.prepare_anonymity_set_data_batch(queried, anonymity_set)
+    single = [preparator.prepare_anonymity_set_data(pid, anonymity_set) for pid in queried]
+
+    assert [data.to_dict() for data in batch] == [data.to_dict() for data in single]
+    assert [data.private_inputs["position"] for data in batch] == [1, 2, -1]
+    assert batch[2].private_inputs["merkle_proof"] == []